@@ -22,6 +22,11 @@ class CollectCROReports:
     COST_EXPLORER_TAGS = {TICKET_ID_KEY: 'TicketId'}
     AND = 'And'
     ALLOCATED_BUDGET = 'AllocatedBudget'
+    COSTED_UNTIL = 'costed_until'
+    SETTLED_COST = 'settled_cost'
+    # Cost Explorer keeps updating the costs of the last days
+    COST_SETTLEMENT_DAYS = 3
+    USER_DAILY_REPORT_DAYS = 4
 
     def __init__(self):
         self.__environment_variables_dict = environment_variables.environment_variables_dict
@@ -203,11 +208,13 @@ class CollectCROReports:
         :return:
         """
         upload_data = {}
+        issues_descriptions = self.jira_operations.get_issues_descriptions(ticket_ids=list(monitor_data.keys()),
+                                                                           state='ANY')
         for ticket_id, instance_data in monitor_data.items():
             ticket_id = ticket_id.split('-')[-1]
             user = instance_data[self.ZERO].get('user')
             user_project = instance_data[self.ZERO].get('project')
-            issue_description = self.jira_operations.get_issue_description(ticket_id=ticket_id, state='ANY')
+            issue_description = issues_descriptions.get(ticket_id, {})
             ticket_opened_date = issue_description.get('TicketOpenedDate')
             group_by_tag_name = self.COST_EXPLORER_TAGS[self.TICKET_ID_KEY]
             user_cost = self.get_user_cost_data(group_by_tag_name=group_by_tag_name, group_by_tag_value=ticket_id,
@@ -245,6 +252,8 @@ class CollectCROReports:
     def update_in_progress_ticket_cost(self):
         """
         This method updates the in-progress tickets costs
+        Costs of settled days are stored in the ticket as settled_cost up to costed_until,
+        so each run queries Cost Explorer only for the days after it
         :return:
         """
         query = {"query": {"bool": {"must": [
@@ -254,68 +263,89 @@ class CollectCROReports:
                     ]
                 }}}
         in_progress_es_tickets = self.__cost_over_usage.es_operations.fetch_data_by_es_query(query=query, es_index=self.__es_index_cro)
-        total_account_cost = self.get_total_account_usage_cost()
+        in_progress_tickets = {}
         for in_progress_ticket in in_progress_es_tickets:
             source_data = in_progress_ticket.get('_source')
-            ticket_id = source_data.get(self.TICKET_ID_KEY)
             if source_data.get('account_name').lower() in self.__account_name.lower():
-                ticket_opened_date = datetime.strptime(source_data.get('ticket_opened_date'), "%Y-%m-%d")
-                duration = int(source_data.get('duration', 0))
-                group_by_tag_name = self.COST_EXPLORER_TAGS[self.TICKET_ID_KEY]
-                user_cost = self.get_user_cost_data(group_by_tag_name=group_by_tag_name, group_by_tag_value=ticket_id, requested_date=ticket_opened_date)
-                user_daily_cost = eval(source_data.get('user_daily_cost', "{}"))
-                user_name = source_data.get('user')
-                ce_user_daily_report = self.__get_user_daily_usage_report(days=4, group_by_tag_value=ticket_id,
-                                                                          group_by_tag_name=group_by_tag_name,
-                                                                          user_name=user_name)
-                user_daily_cost.update(ce_user_daily_report)
-                user_forecast = self.get_user_cost_data(group_by_tag_name=group_by_tag_name,
-                                                        group_by_tag_value=ticket_id, requested_date=datetime.utcnow(),
-                                                        forecast=True, duration=duration)
-                update_data = {'actual_cost': user_cost, 'forecast': user_forecast, 'timestamp': datetime.utcnow(),
-                               f'TotalCurrentUsage-{datetime.utcnow().year}': total_account_cost,
-                               'user_daily_cost': str(user_daily_cost)}
-                if not source_data.get(self.ALLOCATED_BUDGET):
-                    update_data[self.ALLOCATED_BUDGET] = self.get_account_budget_from_payer_ce_report()
-                self.__cost_over_usage.es_operations.update_elasticsearch_index(index=self.__es_index_cro, metadata=update_data, id=ticket_id)
-
-    def __get_user_daily_usage_report(self, days: int, group_by_tag_name: str, group_by_tag_value: str, user_name: str):
-        """
-        This method returns the users daily report from last X days
-        :param days:
-        :return:
-        """
-        user_daily_usage_report = {}
-        self.__get_user_usage_by_granularity(tag_name=group_by_tag_name, tag_value=group_by_tag_value,
-                                             days=days,
-                                             result_back_data=user_daily_usage_report)
-        self.__get_user_usage_by_granularity(tag_name='User', tag_value=user_name,
-                                             days=days, result_back_data=user_daily_usage_report)
-        return user_daily_usage_report
+                in_progress_tickets[str(source_data.get(self.TICKET_ID_KEY))] = source_data
+        if not in_progress_tickets:
+            return
+        total_account_cost = self.get_total_account_usage_cost()
+        current_date = datetime.utcnow().date()
+        settled_date = current_date - timedelta(days=self.COST_SETTLEMENT_DAYS)
+        daily_report_start_date = current_date - timedelta(days=self.USER_DAILY_REPORT_DAYS)
+        tickets_start_date = {}
+        for ticket_id, source_data in in_progress_tickets.items():
+            if source_data.get(self.COSTED_UNTIL):
+                tickets_start_date[ticket_id] = datetime.strptime(source_data.get(self.COSTED_UNTIL), "%Y-%m-%d").date() + timedelta(days=1)
+            else:
+                tickets_start_date[ticket_id] = datetime.strptime(source_data.get('ticket_opened_date'), "%Y-%m-%d").date()
+        group_by_tag_name = self.COST_EXPLORER_TAGS[self.TICKET_ID_KEY]
+        tickets_daily_cost = self.__get_daily_cost_by_tag(tag_name=group_by_tag_name, tag_values=list(in_progress_tickets.keys()),
+                                                          start_date=min(min(tickets_start_date.values()), daily_report_start_date),
+                                                          end_date=current_date + timedelta(days=1))
+        user_names = list({source_data.get('user') for source_data in in_progress_tickets.values() if source_data.get('user')})
+        users_daily_cost = self.__get_daily_cost_by_tag(tag_name='User', tag_values=user_names,
+                                                        start_date=daily_report_start_date, end_date=current_date)
+        allocated_budget = None
+        for ticket_id, source_data in in_progress_tickets.items():
+            ticket_daily_cost = tickets_daily_cost.get(ticket_id, {})
+            start_date = str(tickets_start_date[ticket_id])
+            settled_cost = float(source_data.get(self.SETTLED_COST, 0)) if source_data.get(self.COSTED_UNTIL) else 0
+            settled_cost += sum(cost for day, cost in ticket_daily_cost.items() if start_date <= day < str(settled_date))
+            unsettled_cost = sum(cost for day, cost in ticket_daily_cost.items() if day >= max(start_date, str(settled_date)))
+            user_cost = round(settled_cost + unsettled_cost, self.DEFAULT_ROUND_DIGITS)
+            user_daily_cost = eval(source_data.get('user_daily_cost', "{}"))
+            for day, cost in ticket_daily_cost.items():
+                if str(daily_report_start_date) <= day < str(current_date):
+                    user_daily_cost.setdefault(day, {}).update({group_by_tag_name: round(cost, self.DEFAULT_ROUND_DIGITS)})
+            for day, cost in users_daily_cost.get(source_data.get('user'), {}).items():
+                user_daily_cost.setdefault(day, {}).update({'User': round(cost, self.DEFAULT_ROUND_DIGITS)})
+            duration = int(source_data.get('duration', 0))
+            user_forecast = self.get_user_cost_data(group_by_tag_name=group_by_tag_name,
+                                                    group_by_tag_value=ticket_id, requested_date=datetime.utcnow(),
+                                                    forecast=True, duration=duration)
+            update_data = {'actual_cost': user_cost, 'forecast': user_forecast,
+                           f'TotalCurrentUsage-{datetime.utcnow().year}': total_account_cost,
+                           'user_daily_cost': str(user_daily_cost)}
+            if start_date < str(settled_date):
+                update_data[self.SETTLED_COST] = round(settled_cost, self.DEFAULT_ROUND_DIGITS)
+                update_data[self.COSTED_UNTIL] = str(settled_date - timedelta(days=1))
+            if not source_data.get(self.ALLOCATED_BUDGET):
+                if allocated_budget is None:
+                    allocated_budget = self.get_account_budget_from_payer_ce_report()
+                update_data[self.ALLOCATED_BUDGET] = allocated_budget
+            update_data = {key: value for key, value in update_data.items() if source_data.get(key) != value}
+            update_data['timestamp'] = datetime.utcnow()
+            self.__cost_over_usage.es_operations.update_elasticsearch_index(index=self.__es_index_cro, metadata=update_data, id=ticket_id)
 
-    def __get_user_usage_by_granularity(self, result_back_data: dict, tag_name: str, days: int, tag_value):
+    def __get_daily_cost_by_tag(self, tag_name: str, tag_values: list, start_date, end_date):
         """
-        This method returns the organized input of the usage_reports
-        :param result_back_data:
+        This method returns the daily cost of all tag_values with one grouped cost explorer query
         :param tag_name:
-        :param days:
-        :param tag_value:
-        :return:
+        :param tag_values:
+        :param start_date:
+        :param end_date: exclusive
+        :return: {tag_value: {day: cost}}
         """
-        end_date = datetime.utcnow().date()
-        start_date = end_date - timedelta(days=days)
+        daily_cost = {}
+        if not tag_values or start_date >= end_date:
+            return daily_cost
         cost_explorer_object = self.__cost_over_usage.get_cost_explorer_operations()
         ce_daily_usage = cost_explorer_object.get_cost_by_tags(tag=tag_name,
                                                                granularity='DAILY',
                                                                start_date=str(start_date),
                                                                end_date=str(end_date),
-                                                               Filter={'Tags': {'Key': tag_name, 'Values': [tag_value]}})
-        filtered_ce_daily_usage = cost_explorer_object.get_ce_report_filter_data(ce_daily_usage,
-                                                                                 tag_name=tag_name)
-        for index_id, daily_cost in filtered_ce_daily_usage.items():
-            start_date = daily_cost.get('start_date')
-            usage = round(float(daily_cost.get(tag_name)), self.DEFAULT_ROUND_DIGITS)
-            result_back_data.setdefault(start_date, {}).update({tag_name: usage })
+                                                               Filter={'Tags': {'Key': tag_name, 'Values': tag_values}})
+        for results_by_time in ce_daily_usage.get('ResultsByTime', []):
+            day = results_by_time.get('TimePeriod').get('Start')
+            for group in results_by_time.get('Groups', []):
+                tag_value = group.get('Keys')[0].split('$')[-1].strip() if group.get('Keys') else ''
+                if tag_value:
+                    amount = float(group.get('Metrics').get('UnblendedCost').get('Amount'))
+                    tag_daily_cost = daily_cost.setdefault(tag_value, {})
+                    tag_daily_cost[day] = tag_daily_cost.get(day, 0) + amount
+        return daily_cost
 
     @typeguard.typechecked
     @logger_time_stamp
@@ -47,11 +47,13 @@ class AzureMonitorTickets(AbstractMonitorTickets):
     def update_cluster_cost(self):
         pass
 
-    def extend_tickets_budget(self, ticket_id: str, region_name: str, current_budget: int = 0):
-        return super().extend_tickets_budget(ticket_id, region_name, current_budget)
+    def extend_tickets_budget(self, ticket_id: str, region_name: str, current_budget: int = 0,
+                              sub_ticket_ids: list = None):
+        return super().extend_tickets_budget(ticket_id, region_name, current_budget, sub_ticket_ids)
 
-    def extend_ticket_duration(self, ticket_id: str, region_name: str, current_duration: int = 0):
-        return super().extend_ticket_duration(ticket_id, region_name, current_duration)
+    def extend_ticket_duration(self, ticket_id: str, region_name: str, current_duration: int = 0,
+                               sub_ticket_ids: list = None):
+        return super().extend_ticket_duration(ticket_id, region_name, current_duration, sub_ticket_ids)
 
     @logger_time_stamp
     def run(self):
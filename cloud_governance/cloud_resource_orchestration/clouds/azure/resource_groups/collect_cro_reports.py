@@ -87,11 +87,13 @@ class CollectCROReports(AbstractCollectCROReports):
         :return:
         """
         upload_data = {}
+        issues_descriptions = self._jira_operations.get_issues_descriptions(
+            ticket_ids=[ticket_id for ticket_id, instance_data in monitor_data.items() if instance_data], state='ANY')
         for ticket_id, instance_data in monitor_data.items():
             if instance_data:
                 ticket_id = ticket_id.split('-')[-1]
                 user = instance_data[self.ZERO].get('user')
-                issue_description = self._jira_operations.get_issue_description(ticket_id=ticket_id, state='ANY')
+                issue_description = issues_descriptions.get(ticket_id, {})
                 ticket_opened_date = issue_description.get('TicketOpenedDate')
                 group_by_tag_name = self.TICKET_ID_VALUE
                 user_cost = self.get_user_cost_data(group_by_tag_name=group_by_tag_name, group_by_tag_value=ticket_id,
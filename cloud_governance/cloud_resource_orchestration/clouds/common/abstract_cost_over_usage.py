@@ -81,16 +81,18 @@ class AbstractCostOverUsage(ABC):
 
     @typeguard.typechecked
     @logger_time_stamp
-    def _get_user_active_ticket_costs(self, user_name: str):
+    def _get_users_active_ticket_costs(self, user_names: list):
         """
-        This method returns a boolean indicating whether the user should open the ticket or not
-        :param user_name:
-        :return:
+        This method returns the active tickets cost of all users with one es query
+        :param user_names:
+        :return: {user_name: active tickets cost}, users without active tickets are not present
         """
-        query = {  # check user opened the ticket in elastic_search
+        if not user_names:
+            return {}
+        query = {  # check users opened the ticket in elastic_search
             "query": {
                 "bool": {
-                    "must": [{"term": {"user_cro.keyword": user_name}},
+                    "must": [{"terms": {"user_cro.keyword": user_names}},
                              {"terms": {"ticket_id_state.keyword": ['new', 'manager-approved', 'in-progress']}},
                              {"term": {"account_name.keyword": self._account.upper()}},
                              {"term": {"cloud_name.keyword": self._public_cloud_name.upper()}},
@@ -105,37 +107,39 @@ class AbstractCostOverUsage(ABC):
                         }
                     }
                 }
-            }
+            },
+            "_source": ['user_cro', 'estimated_cost']
         }
-        user_active_tickets = self.es_operations.fetch_data_by_es_query(es_index=self.es_index_cro, query=query)
-        if not user_active_tickets:
-            return None
-        else:
-            total_active_ticket_cost = 0
-            for cro_data in user_active_tickets:
-                opened_ticket_cost = float(cro_data.get('_source').get('estimated_cost'))
-                total_active_ticket_cost += opened_ticket_cost
-            return total_active_ticket_cost
+        users_active_tickets = self.es_operations.fetch_data_by_es_query(es_index=self.es_index_cro, query=query,
+                                                                         search_size=1000)
+        users_active_ticket_costs = {}
+        for cro_data in users_active_tickets:
+            user_name = cro_data.get('_source').get('user_cro')
+            opened_ticket_cost = float(cro_data.get('_source').get('estimated_cost'))
+            users_active_ticket_costs[user_name] = users_active_ticket_costs.get(user_name, 0) + opened_ticket_cost
+        return users_active_ticket_costs
 
     @typeguard.typechecked
     @logger_time_stamp
-    def _get_user_closed_ticket_costs(self, user_name: str):
+    def _get_users_closed_ticket_costs(self, user_names: list):
         """
-        This method returns the users closed tickets cost
-        :param user_name:
-        :type user_name:
-        :return:
-        :rtype:
+        This method returns the closed tickets cost of all users with one es query
+        :param user_names:
+        :return: {user_name: closed tickets cost}
         """
-        match_conditions = [{"term": {"user.keyword": user_name}},
+        if not user_names:
+            return {}
+        match_conditions = [{"terms": {"user.keyword": user_names}},
                             {"term": {"account_name.keyword": self._account.upper()}},
                             {"term": {"cloud_name.keyword": self._public_cloud_name}}
                             ]
-        query = self._elastic_search_queries.get_all_closed_tickets(match_conditions=match_conditions)
-        user_closed_tickets = self.es_operations.fetch_data_by_es_query(es_index=self.es_index_cro, query=query,
-                                                                        filter_path='hits.hits._source')
-        total_closed_ticket_cost = 0
-        for closed_ticket in user_closed_tickets:
+        query = self._elastic_search_queries.get_all_closed_tickets(match_conditions=match_conditions,
+                                                                    fields=['user', 'user_daily_cost'])
+        users_closed_tickets = self.es_operations.fetch_data_by_es_query(es_index=self.es_index_cro, query=query,
+                                                                         search_size=1000,
+                                                                         filter_path='hits.hits._source,_scroll_id')
+        users_closed_ticket_costs = {user_name: 0 for user_name in user_names}
+        for closed_ticket in users_closed_tickets:
             total_used_cost = 0
             user_daily_report = closed_ticket.get('_source', {}).get('user_daily_cost', '')
             if user_daily_report:
@@ -143,8 +147,9 @@ class AbstractCostOverUsage(ABC):
                 for date, user_cost in user_daily_report.items():
                     if datetime.strptime(date, DATE_FORMAT) >= self.current_start_date:
                         total_used_cost += int(user_cost.get('TicketId', 0))
-            total_closed_ticket_cost += total_used_cost
-        return total_closed_ticket_cost
+            user_name = closed_ticket.get('_source', {}).get('user')
+            users_closed_ticket_costs[user_name] = users_closed_ticket_costs.get(user_name, 0) + total_used_cost
+        return users_closed_ticket_costs
 
     @typeguard.typechecked
     @logger_time_stamp
@@ -168,20 +173,24 @@ class AbstractCostOverUsage(ABC):
         :return:
         """
         over_usage_users = []
-        current_month_users = self.get_monthly_user_es_cost_data()
-        for user in current_month_users:
-            user_name = str(user.get('User'))
+        over_usage_candidates = [user for user in self.get_monthly_user_es_cost_data()
+                                 if round(user.get('Cost'), DEFAULT_ROUND_DIGITS) >=
+                                 (self._over_usage_amount - self._over_usage_threshold)]
+        user_names = list({str(user.get('User')).lower() for user in over_usage_candidates})
+        users_active_tickets_cost = self._get_users_active_ticket_costs(user_names=user_names)
+        users_closed_tickets_cost = self._get_users_closed_ticket_costs(user_names=user_names)
+        for user in over_usage_candidates:
+            user_name = str(user.get('User')).lower()
             user_cost = round(user.get('Cost'), DEFAULT_ROUND_DIGITS)
-            if user_cost >= (self._over_usage_amount - self._over_usage_threshold):
-                user_active_tickets_cost = self._get_user_active_ticket_costs(user_name=user_name.lower())
-                user_closed_tickets_cost = self._get_user_closed_ticket_costs(user_name=user_name.lower())
-                if not user_active_tickets_cost:
+            user_active_tickets_cost = users_active_tickets_cost.get(user_name)
+            user_closed_tickets_cost = users_closed_tickets_cost.get(user_name, 0)
+            if not user_active_tickets_cost:
+                over_usage_users.append(user)
+            else:
+                user_cost_without_active_ticket = user_cost - user_active_tickets_cost - user_closed_tickets_cost
+                if user_cost_without_active_ticket > self._over_usage_amount:
+                    user['Cost'] = user_cost_without_active_ticket
                     over_usage_users.append(user)
-                else:
-                    user_cost_without_active_ticket = user_cost - user_active_tickets_cost - user_closed_tickets_cost
-                    if user_cost_without_active_ticket > self._over_usage_amount:
-                        user['Cost'] = user_cost_without_active_ticket
-                        over_usage_users.append(user)
         return over_usage_users
 
     @logger_time_stamp
@@ -89,17 +89,20 @@ class AbstractMonitorTickets(ABC):
         raise NotImplemented("This method is not implemented")
 
     @logger_time_stamp
-    def extend_tickets_budget(self, ticket_id: str, region_name: str, current_budget: int = 0):
+    def extend_tickets_budget(self, ticket_id: str, region_name: str, current_budget: int = 0,
+                              sub_ticket_ids: list = None):
         """
         This method extends the ticket budget if any
         :param ticket_id:
         :param region_name:
         :param current_budget:
+        :param sub_ticket_ids: pre-fetched budget extension tickets, fetched from jira if None
         :return:
         """
         ticket_extended = False
-        sub_ticket_ids = self.__jira_operations.get_budget_extend_tickets(ticket_id=ticket_id,
-                                                                          ticket_state='inprogress')
+        if sub_ticket_ids is None:
+            sub_ticket_ids = self.__jira_operations.get_budget_extend_tickets(ticket_id=ticket_id,
+                                                                              ticket_state='inprogress')
         if sub_ticket_ids:
             total_budget_to_extend = self.__jira_operations.get_total_extend_budget(sub_ticket_ids=sub_ticket_ids)
             if string_equal_ignore_case(self.__cloud_name, 'AWS'):
@@ -118,15 +121,20 @@ class AbstractMonitorTickets(ABC):
 
     @typeguard.typechecked
     @logger_time_stamp
-    def extend_ticket_duration(self, ticket_id: str, region_name: str, current_duration: int = 0):
+    def extend_ticket_duration(self, ticket_id: str, region_name: str, current_duration: int = 0,
+                               sub_ticket_ids: list = None):
         """
         This method extends the duration of the ticket if any
         :param ticket_id:
         :param region_name:
+        :param current_duration:
+        :param sub_ticket_ids: pre-fetched duration extension tickets, fetched from jira if None
         :return:
         """
         tickets_found = False
-        sub_ticket_ids = self.__jira_operations.get_duration_extend_tickets(ticket_id=ticket_id, ticket_state='new')
+        if sub_ticket_ids is None:
+            sub_ticket_ids = self.__jira_operations.get_duration_extend_tickets(ticket_id=ticket_id,
+                                                                                ticket_state='new')
         if sub_ticket_ids:
             total_duration_to_extend = self.__jira_operations.get_total_extend_duration(sub_ticket_ids=sub_ticket_ids)
             if string_equal_ignore_case(self.__cloud_name, 'AWS'):
@@ -173,7 +181,8 @@ class AbstractMonitorTickets(ABC):
         subject = body = None
         if remaining_duration <= FIRST_CRO_ALERT:
             ticket_extended = self.extend_ticket_duration(ticket_id=ticket_id, region_name=region_name,
-                                                          current_duration=duration)
+                                                          current_duration=duration,
+                                                          sub_ticket_ids=kwargs.get('duration_extend_ticket_ids'))
             if not ticket_extended:
                 if remaining_duration == FIRST_CRO_ALERT:
                     subject, body = self.__mail_message.cro_monitor_alert_message(user=user, days=FIRST_CRO_ALERT,
@@ -247,7 +256,8 @@ class AbstractMonitorTickets(ABC):
         alert_user, total_alerts = self.get_budget_exceed_alert_times(user=user, remaining_budget=remaining_budget)
         if threshold_budget >= remaining_budget > 0 and alert_user and total_alerts < 2:
             ticket_extended = self.extend_tickets_budget(ticket_id=ticket_id, region_name=region_name,
-                                                         current_budget=budget)
+                                                         current_budget=budget,
+                                                         sub_ticket_ids=kwargs.get('budget_extend_ticket_ids'))
             if not ticket_extended:
                 subject, body = self.__mail_message.cro_monitor_budget_remain_alert(user=user, budget=budget,
                                                                                     ticket_id=ticket_id,
@@ -255,7 +265,8 @@ class AbstractMonitorTickets(ABC):
                                                                                     remain_budget=remaining_budget)
         elif remaining_budget <= 0 and alert_user and total_alerts == 1:
             ticket_extended = self.extend_tickets_budget(ticket_id=ticket_id, region_name=region_name,
-                                                         current_budget=budget)
+                                                         current_budget=budget,
+                                                         sub_ticket_ids=kwargs.get('budget_extend_ticket_ids'))
             if not ticket_extended:
                 subject, body = self.__mail_message.cro_monitor_budget_remain_high_alert(user=user, budget=budget,
                                                                                          ticket_id=ticket_id,
@@ -272,6 +283,13 @@ class AbstractMonitorTickets(ABC):
         :return:
         """
         in_progress_tickets_list = self._get_all_in_progress_tickets()
+        ticket_ids = [str(ticket_data.get('_source', {}).get('ticket_id')) for ticket_data in in_progress_tickets_list
+                      if ticket_data.get('_source', {}).get('ticket_id')]
+        issues = self.__jira_operations.get_issues(ticket_ids=ticket_ids)
+        budget_extend_tickets = self.__jira_operations.get_budget_extend_tickets_by_tickets(
+            ticket_ids=ticket_ids, ticket_state='inprogress', issues=issues)
+        duration_extend_tickets = self.__jira_operations.get_duration_extend_tickets_by_tickets(
+            ticket_ids=ticket_ids, ticket_state='new', issues=issues)
         for ticket_data in in_progress_tickets_list:
             source_data = ticket_data.get('_source')
             if source_data:
@@ -287,11 +305,13 @@ class AbstractMonitorTickets(ABC):
                 self._monitor_ticket_budget(ticket_id=ticket_id, region_name=region_name, budget=budget,
                                             used_budget=used_budget,
                                             user_cro=source_data.get('user_cro'),
-                                            approved_manager=source_data.get('approved_manager'))
+                                            approved_manager=source_data.get('approved_manager'),
+                                            budget_extend_ticket_ids=budget_extend_tickets.get(str(ticket_id)))
                 self._monitor_ticket_duration(ticket_id=ticket_id, region_name=region_name, duration=duration,
                                               completed_duration=completed_duration,
                                               user_cro=source_data.get('user_cro'),
-                                              approved_manager=source_data.get('approved_manager')
+                                              approved_manager=source_data.get('approved_manager'),
+                                              duration_extend_ticket_ids=duration_extend_tickets.get(str(ticket_id))
                                               )
 
     def notify_ticket_closed(self, ticket_id: str, region_name: str = ''):
@@ -1,7 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from cloud_governance.cloud_resource_orchestration.common.cro_object import CroObject
-from cloud_governance.cloud_resource_orchestration.utils.common_operations import string_equal_ignore_case
 from cloud_governance.common.elasticsearch.elasticsearch_operations import ElasticSearchOperations
 from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
@@ -13,6 +13,7 @@ class RunCRO:
 
     PERSISTENT_RUN_DOC_ID = f'cro_run_persistence-{datetime.now(timezone.utc).date()}'
     PERSISTENT_RUN_INDEX = 'cloud_resource_orchestration_persistence_run'
+    MAX_REGION_WORKERS = 8
 
     def __init__(self):
         self.__environment_variables_dict = environment_variables.environment_variables_dict
@@ -68,28 +69,59 @@ class RunCRO:
             logger.error(err)
         self.save_current_timestamp()
 
+    def __run_region_resources(self, active_region: str, cro_monitor, cro_tagging):
+        """
+        This method runs the cro tagging and monitoring in the region, the region is passed explicitly to
+        the cro objects so the regions don't share any global context
+        :param active_region:
+        :type active_region:
+        :param cro_monitor: monitor cro resources object of the region
+        :param cro_tagging: tag cro resources object of the region
+        :return: monitored tickets data of the region
+        :rtype: dict
+        """
+        logger.info(f"""Running CloudResourceOrchestration in region: {active_region}""")
+        logger.info(f"""{active_region}: -> Running CRO Tagging""")
+        tagging_response = cro_tagging.run()
+        logger.info(f'{active_region}: Tagged instances : {tagging_response}')
+        logger.info(f"""{active_region}: -> Running CRO Resource data Collection""")
+        return cro_monitor.run()
+
     def __run_cloud_resources(self):
         """
         This method runs the public cloud resources and upload results to es
+        Regions are processed concurrently, the monitored tickets of all regions are merged by ticket id,
+        so each ticket document is updated once in es, even if the ticket has resources in multiple regions
         :return:
         :rtype:
         """
         active_regions = self.__cro_object.get_active_regions()
         logger.info(f"""***** Running CloudResourceOrchestration in all Active regions: {active_regions} *****""")
+        monitor_response = {}
+        max_workers = max(min(self.MAX_REGION_WORKERS, len(active_regions)), 1)
+        # the region objects create boto3 clients, boto3 default session is not thread safe to create clients
+        region_objects = {}
         for active_region in active_regions:
-            cro_monitor = self.__cro_object.get_monitor_cro_resources_object(region_name=active_region)
-            cro_tagging = self.__cro_object.get_tag_cro_resources_object(region_name=active_region)
-            if string_equal_ignore_case(self.__cloud_name, 'aws'):
-                self.__environment_variables_dict.update({'AWS_DEFAULT_REGION': active_region})
-            logger.info(f"""Running CloudResourceOrchestration in region: {active_region}""")
-            logger.info(f"""{active_region}: -> Running CRO Tagging""")
-            tagging_response = cro_tagging.run()
-            logger.info(f'Tagged instances : {tagging_response}')
-            logger.info(f"""{active_region}: -> Running CRO Resource data Collection""")
-            monitor_response = cro_monitor.run()
-            if monitor_response:
-                cro_reports = self.__cro_reports.run(monitor_response)
-                logger.info(f'Cloud Orchestration Resources: {cro_reports}')
+            try:
+                region_objects[active_region] = (
+                    self.__cro_object.get_monitor_cro_resources_object(region_name=active_region),
+                    self.__cro_object.get_tag_cro_resources_object(region_name=active_region))
+            except Exception as err:
+                logger.error(f'{active_region}: Failed to run CloudResourceOrchestration: {err}')
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {active_region: executor.submit(self.__run_region_resources, active_region, *cro_objects)
+                       for active_region, cro_objects in region_objects.items()}
+            for active_region, future in futures.items():
+                try:
+                    region_monitor_response = future.result()
+                except Exception as err:
+                    logger.error(f'{active_region}: Failed to run CloudResourceOrchestration: {err}')
+                    continue
+                for ticket_id, instance_data in (region_monitor_response or {}).items():
+                    monitor_response.setdefault(ticket_id, []).extend(instance_data)
+        if monitor_response:
+            cro_reports = self.__cro_reports.run(monitor_response)
+            logger.info(f'Cloud Orchestration Resources: {cro_reports}')
 
     @logger_time_stamp
     def __start_cro(self):
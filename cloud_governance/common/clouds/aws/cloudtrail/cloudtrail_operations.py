@@ -3,8 +3,7 @@ import os
 import time
 from datetime import timedelta, datetime
 
-import boto3
-
+from cloud_governance.common.clouds.aws.utils.boto3_client_pool import Boto3ClientPool
 from cloud_governance.common.logger.init_logger import logger
 
 
@@ -14,9 +13,9 @@ class CloudTrailOperations:
     LOOKBACK_DAYS = 30
 
     def __init__(self, region_name: str):
-        self.__cloudtrail = boto3.client('cloudtrail', region_name=region_name)
-        self.__global_cloudtrail = boto3.client('cloudtrail', region_name='us-east-1')
-        self.__iam_client = boto3.client('iam')
+        self.__cloudtrail = Boto3ClientPool.get_client('cloudtrail', region_name=region_name)
+        self.__global_cloudtrail = Boto3ClientPool.get_client('cloudtrail', region_name='us-east-1')
+        self.__iam_client = Boto3ClientPool.get_client('iam', region_name=None)
 
     def __check_filter_username(self, username: str, event: dict):
         """
@@ -249,7 +248,7 @@ class CloudTrailOperations:
             return ''
 
     def set_cloudtrail(self, region_name: str):
-        self.__cloudtrail = boto3.client('cloudtrail', region_name=region_name)
+        self.__cloudtrail = Boto3ClientPool.get_client('cloudtrail', region_name=region_name)
 
     def get_last_time_accessed(self, resource_id: str, event_name: str, start_time: datetime, end_time: datetime, **kwargs):
         """
@@ -0,0 +1,135 @@
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+from cloud_governance.common.logger.init_logger import logger
+
+
+class CostExplorerCache:
+    """
+    This class caches the Cost Explorer responses by the normalized request
+    Responses are kept in memory for the run and on disk when a cache directory is set,
+    identical requests which are in-flight are coalesced into one Cost Explorer call
+    """
+
+    FILE_EXTENSION = '.json'
+    # Cost Explorer keeps adjusting the last month costs, i.e. credits and refunds, until mid of the next month
+    CLOSED_MONTH_SETTLEMENT_DAYS = 15
+
+    def __init__(self, cache_directory: str = '', ttl: int = 3600, closed_month_ttl: int = 2592000):
+        self.__cache_directory = cache_directory
+        self.__ttl = ttl
+        self.__closed_month_ttl = closed_month_ttl
+        self.__memory_cache = {}
+        self.__in_flight = {}
+        self.__lock = threading.Lock()
+        if self.__cache_directory:
+            os.makedirs(self.__cache_directory, exist_ok=True)
+
+    @staticmethod
+    def get_request_key(namespace: str, method: str, **request):
+        """
+        This method returns the content address of the request
+        :param namespace: identity of the account the request is sent with
+        :param method:
+        :param request:
+        :return:
+        """
+        normalized_request = json.dumps({'namespace': namespace, 'method': method, 'request': request},
+                                        sort_keys=True, default=str, separators=(',', ':'))
+        return hashlib.sha256(normalized_request.encode()).hexdigest()
+
+    def get_expires_at(self, end_date: str, forecast: bool = False):
+        """
+        This method returns the expiry time of the response, the settled closed months expire after closed_month_ttl
+        :param end_date: exclusive end date of the request
+        :param forecast:
+        :return:
+        """
+        if not forecast:
+            settled_month_start = (datetime.utcnow() - timedelta(days=self.CLOSED_MONTH_SETTLEMENT_DAYS)).replace(day=1)
+            if end_date and end_date[:10] <= str(settled_month_start.date()):
+                return time.time() + self.__closed_month_ttl
+        return time.time() + self.__ttl
+
+    def __get_cache_file(self, key: str):
+        return os.path.join(self.__cache_directory, f'{key}{self.FILE_EXTENSION}')
+
+    def __get_cached_response(self, key: str):
+        """
+        This method returns the cached response which is not expired, memory first then disk
+        :param key:
+        :return: (found, response)
+        """
+        with self.__lock:
+            cached = self.__memory_cache.get(key)
+        if not cached and self.__cache_directory and os.path.exists(self.__get_cache_file(key)):
+            try:
+                with open(self.__get_cache_file(key)) as cache_file:
+                    cached = json.load(cache_file)
+            except (OSError, ValueError) as err:
+                logger.warning(f'Unable to read the cost explorer cache: {err}')
+                cached = None
+        if cached and (cached.get('expires_at') is None or cached.get('expires_at') > time.time()):
+            with self.__lock:
+                self.__memory_cache[key] = cached
+            return True, cached.get('response')
+        return False, None
+
+    def __set_cached_response(self, key: str, response, expires_at: float = None, persist: bool = True):
+        """
+        This method saves the response in memory and on disk
+        :param key:
+        :param response:
+        :param expires_at:
+        :param persist: save on disk
+        :return:
+        """
+        cached = {'expires_at': expires_at, 'response': json.loads(json.dumps(response, default=str))}
+        with self.__lock:
+            self.__memory_cache[key] = cached
+        if self.__cache_directory and persist:
+            try:
+                with tempfile.NamedTemporaryFile('w', dir=self.__cache_directory, delete=False) as cache_file:
+                    json.dump(cached, cache_file)
+                os.replace(cache_file.name, self.__get_cache_file(key))
+            except OSError as err:
+                logger.warning(f'Unable to write the cost explorer cache: {err}')
+
+    def get_or_load(self, key: str, loader, expires_at: float = None, persist: bool = True):
+        """
+        This method returns the cached response of key, or loads it once for all the concurrent callers
+        :param key:
+        :param loader: callable which fetches the response from Cost Explorer
+        :param expires_at:
+        :param persist: save on disk, False when the request is not tied to a known account
+        :return:
+        """
+        found, response = self.__get_cached_response(key)
+        if found:
+            return copy.deepcopy(response)
+        with self.__lock:
+            future = self.__in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.__in_flight[key] = future
+        if not owner:
+            return copy.deepcopy(future.result())
+        try:
+            response = loader()
+            self.__set_cached_response(key, response, expires_at=expires_at, persist=persist)
+            future.set_result(response)
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self.__lock:
+                self.__in_flight.pop(key, None)
+        return copy.deepcopy(response)
@@ -1,8 +1,13 @@
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta
 
 import boto3
 
+from cloud_governance.common.clouds.aws.cost_explorer.cost_explorer_cache import CostExplorerCache
 from cloud_governance.common.logger.init_logger import logger
+from cloud_governance.main.environment_variables import environment_variables
 
 
 class CostExplorerOperations:
@@ -28,8 +33,97 @@ class CostExplorerOperations:
     }
     CE_COST_FILTERS = {'SPOT': {KEY: PURCHASE_TYPE, VALUES: [SPOT_INSTANCES]}}
 
-    def __init__(self, ce_client=''):
+    # Cost Explorer API allows 5 requests per second per account
+    MAX_REQUESTS_PER_SECOND = 5
+
+    # Shared across the instances, identical requests are sent once
+    __cache = None
+    __cache_lock = threading.Lock()
+    __next_request_time = 0
+    __throttle_lock = threading.Lock()
+    # The account of the default credentials, looked up once per process
+    __account_id = None
+    __account_id_lock = threading.Lock()
+
+    def __init__(self, ce_client='', cache_namespace: str = ''):
+        """
+        :param ce_client:
+        :param cache_namespace: account identity of the ce_client, responses of a ce_client without it are
+                                cached only in memory
+        """
         self.cost_explorer_client = boto3.client('ce') if not ce_client else ce_client
+        self.__cache_namespace = cache_namespace
+        self.__persist_cache = bool(cache_namespace) or not ce_client
+
+    @classmethod
+    def __get_cache(cls):
+        """
+        This method returns the cache shared by all the instances
+        :return:
+        """
+        with cls.__cache_lock:
+            if cls.__cache is None:
+                environment_variables_dict = environment_variables.environment_variables_dict
+                cls.__cache = CostExplorerCache(cache_directory=environment_variables_dict.get('CE_CACHE_DIRECTORY', ''),
+                                                ttl=environment_variables_dict.get('CE_CACHE_TTL', 3600),
+                                                closed_month_ttl=environment_variables_dict.get(
+                                                    'CE_CACHE_CLOSED_MONTH_TTL', 2592000))
+            return cls.__cache
+
+    def __get_cache_namespace(self):
+        """
+        This method returns the account identity which the requests are sent with
+        :return:
+        """
+        if not self.__cache_namespace:
+            if self.__persist_cache:
+                try:
+                    self.__cache_namespace = self.__get_account_id()
+                except Exception as err:
+                    logger.warning(f'Unable to get the account identity, caching in memory only: {err}')
+                    self.__persist_cache = False
+            if not self.__cache_namespace:
+                self.__cache_namespace = f'client-{uuid.uuid4()}'
+        return self.__cache_namespace
+
+    @classmethod
+    def __get_account_id(cls):
+        """
+        This method returns the account id of the default credentials, sts is called once per process
+        :return:
+        """
+        with cls.__account_id_lock:
+            if cls.__account_id is None:
+                cls.__account_id = boto3.client('sts').get_caller_identity()['Account']
+            return cls.__account_id
+
+    @classmethod
+    def __throttle(cls):
+        """
+        This method waits until the next Cost Explorer request is allowed by the rate limit
+        :return:
+        """
+        with cls.__throttle_lock:
+            current_time = time.monotonic()
+            request_time = max(current_time, cls.__next_request_time)
+            cls.__next_request_time = request_time + 1 / cls.MAX_REQUESTS_PER_SECOND
+        if request_time > current_time:
+            time.sleep(request_time - current_time)
+
+    def __cached_request(self, method: str, loader, end_date: str, forecast: bool = False, **request):
+        """
+        This method returns the response of the request from the cache, loads it with loader on miss
+        :param method:
+        :param loader:
+        :param end_date:
+        :param forecast:
+        :param request: the normalized request
+        :return:
+        """
+        cache = self.__get_cache()
+        key = cache.get_request_key(self.__get_cache_namespace(), method, end_date=end_date, **request)
+        return cache.get_or_load(key, loader, expires_at=cache.get_expires_at(end_date=end_date, forecast=forecast),
+                                 persist=self.__persist_cache)
 
     def __get_ce_tag_filters(self, tag: str, ce_default_filter: dict):
         """
@@ -145,22 +239,30 @@ class CostExplorerOperations:
         try:
             if self.FILTER in kwargs and not kwargs.get('Filter'):
                 kwargs.pop('Filter')
-            usage_cost = {}
-            response = self.cost_explorer_client.get_cost_and_usage(TimePeriod={
-                'Start': start_date,
-                'End': end_date
-            }, Granularity=granularity, Metrics=[cost_metric], **kwargs)
-            usage_cost['GroupDefinitions'] = response.get('GroupDefinitions')
-            usage_cost['ResultsByTime'] = response.get('ResultsByTime')
-            usage_cost['DimensionValueAttributes'] = response.get('DimensionValueAttributes')
-            while response.get('NextPageToken'):
+
+            def get_cost_and_usage():
+                usage_cost = {}
+                self.__throttle()
                 response = self.cost_explorer_client.get_cost_and_usage(TimePeriod={
                     'Start': start_date,
                     'End': end_date
-                }, Granularity=granularity, Metrics=[cost_metric], NextPageToken=response.get('NextPageToken'), **kwargs)
-                usage_cost['ResultsByTime'].extend(response.get('ResultsByTime'))
-                usage_cost['DimensionValueAttributes'].extend(response.get('DimensionValueAttributes'))
-            return usage_cost
+                }, Granularity=granularity, Metrics=[cost_metric], **kwargs)
+                usage_cost['GroupDefinitions'] = response.get('GroupDefinitions')
+                usage_cost['ResultsByTime'] = response.get('ResultsByTime')
+                usage_cost['DimensionValueAttributes'] = response.get('DimensionValueAttributes')
+                while response.get('NextPageToken'):
+                    self.__throttle()
+                    response = self.cost_explorer_client.get_cost_and_usage(TimePeriod={
+                        'Start': start_date,
+                        'End': end_date
+                    }, Granularity=granularity, Metrics=[cost_metric], NextPageToken=response.get('NextPageToken'), **kwargs)
+                    usage_cost['ResultsByTime'].extend(response.get('ResultsByTime'))
+                    usage_cost['DimensionValueAttributes'].extend(response.get('DimensionValueAttributes'))
+                return usage_cost
+
+            return self.__cached_request('get_cost_and_usage', get_cost_and_usage, end_date=end_date,
+                                         start_date=start_date, granularity=granularity, cost_metric=cost_metric,
+                                         **kwargs)
         except Exception as err:
             logger.error(err)
             return {
@@ -179,14 +281,20 @@ class CostExplorerOperations:
         @return:
         """
         try:
-            return self.cost_explorer_client.get_cost_forecast(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity=granularity,
-                Metric=cost_metric, **kwargs
-            )
+            def get_cost_forecast():
+                self.__throttle()
+                return self.cost_explorer_client.get_cost_forecast(
+                    TimePeriod={
+                        'Start': start_date,
+                        'End': end_date
+                    },
+                    Granularity=granularity,
+                    Metric=cost_metric, **kwargs
+                )
+
+            return self.__cached_request('get_cost_forecast', get_cost_forecast, end_date=end_date, forecast=True,
+                                         start_date=start_date, granularity=granularity, cost_metric=cost_metric,
+                                         **kwargs)
         except Exception as err:
             logger.error(err)
             return {'Total': {'Amount': 0}, 'ForecastResultsByTime': []}
@@ -1,3 +1,6 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
 
@@ -6,6 +9,12 @@ from cloud_governance.common.logger.init_logger import logger
 
 class DynamoDbOperations:
 
+    # batch_write_item accepts up to 25 put requests
+    BATCH_WRITE_LIMIT = 25
+    BATCH_WRITE_RETRIES = 5
+    BATCH_WRITE_DELAY = 0.1
+    SCAN_TOTAL_SEGMENTS = 4
+
     def __init__(self, region_name: str = 'us-east-2'):
         self.__region_name = region_name
         self.__db_client = boto3.client('dynamodb', region_name=self.__region_name)
@@ -74,6 +83,49 @@ class DynamoDbOperations:
         except Exception as err:
             print(err)
 
+    def batch_write(self, table_name: str, items: list):
+        """
+        This method puts the serialized items into the table in chunks of 25 items,
+        the unprocessed items are retried with exponential backoff
+        @param table_name:
+        @param items:
+        @return: the count of the written items
+        """
+        count = 0
+        for index in range(0, len(items), self.BATCH_WRITE_LIMIT):
+            request_items = {table_name: [{'PutRequest': {'Item': item}}
+                                          for item in items[index: index + self.BATCH_WRITE_LIMIT]]}
+            try:
+                for retry in range(self.BATCH_WRITE_RETRIES + 1):
+                    if retry:
+                        time.sleep(self.BATCH_WRITE_DELAY * 2 ** (retry - 1))
+                    chunk_size = len(request_items[table_name])
+                    request_items = self.__db_client.batch_write_item(RequestItems=request_items).get(
+                        'UnprocessedItems', {})
+                    count += chunk_size - len(request_items.get(table_name, []))
+                    if not request_items.get(table_name):
+                        break
+                else:
+                    logger.error(f'Cannot write {len(request_items[table_name])} unprocessed items to {table_name}')
+            except Exception as err:
+                logger.error(f'Cannot batch write items to {table_name}, {err}')
+        return count
+
+    def __scan_segment(self, table, scan_kwargs: dict):
+        """
+        This method scans all the pages of the table or of its segment
+        @param table:
+        @param scan_kwargs:
+        @return:
+        """
+        responses = []
+        response = table.scan(**scan_kwargs)
+        responses.extend(response['Items'])
+        while response.get('LastEvaluatedKey'):
+            response = table.scan(**scan_kwargs, ExclusiveStartKey=response['LastEvaluatedKey'])
+            responses.extend(response['Items'])
+        return responses
+
     def scan_table(self, table_name: str, scan_kwargs):
         """
         This method scan the table and list the  queries
@@ -81,16 +133,37 @@ class DynamoDbOperations:
         @param scan_kwargs:
         @return:
         """
-        responses = []
         try:
             table = self.__db_resource.Table(table_name)
-            response = table.scan(**scan_kwargs)
-            responses.extend(response['Items'])
-            while response.get('LastEvaluatedKey'):
-                response = table.scan(**scan_kwargs, ExclusiveStartKey=response['LastEvaluatedKey'])
-                responses.extend(response['Items'])
+            responses = self.__scan_segment(table=table, scan_kwargs=scan_kwargs)
+        except Exception as err:
+            responses = []
+        return responses
+
+    def parallel_scan_table(self, table_name: str, scan_kwargs: dict = None, total_segments: int = 0):
+        """
+        This method scans the table segments concurrently, each segment is scanned with its own resource
+        because the boto3 resources are not thread safe
+        @param table_name:
+        @param scan_kwargs:
+        @param total_segments:
+        @return:
+        """
+        scan_kwargs = scan_kwargs if scan_kwargs else {}
+        total_segments = total_segments if total_segments else self.SCAN_TOTAL_SEGMENTS
+
+        def scan_segment(segment: int):
+            table = boto3.session.Session().resource('dynamodb', region_name=self.__region_name).Table(table_name)
+            return self.__scan_segment(table=table, scan_kwargs={**scan_kwargs, 'Segment': segment,
+                                                                 'TotalSegments': total_segments})
 
+        responses = []
+        try:
+            with ThreadPoolExecutor(max_workers=total_segments) as executor:
+                for segment_responses in executor.map(scan_segment, range(total_segments)):
+                    responses.extend(segment_responses)
         except Exception as err:
+            logger.error(f'Cannot scan the table {table_name}, {err}')
             responses = []
         return responses
 
@@ -111,13 +184,3 @@ class DynamoDbOperations:
             return response
         except Exception as err:
             raise
-
-    # def batch_write(self, table_name: str, items: list):
-    #     """
-    #     This method groups put_item into the dynamoDb
-    #     @return:
-    #     """
-    #     table_resource = self.__db_resource.Table(table_name)
-    #     with table_resource.batch_writer() as writer:
-    #         for item in items:
-    #             writer.put_item(Item=item)
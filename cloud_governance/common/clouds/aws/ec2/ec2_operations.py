@@ -4,6 +4,7 @@ import boto3
 import typeguard
 from typing import Callable
 
+from cloud_governance.common.clouds.aws.utils.boto3_client_pool import Boto3ClientPool
 from cloud_governance.common.clouds.aws.utils.common_methods import get_boto3_client
 from cloud_governance.common.clouds.aws.utils.utils import Utils
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
@@ -510,7 +511,7 @@ class EC2Operations:
         users_list = {}
         regions = self.ec2_client.describe_regions()['Regions']
         for region in regions:
-            region_ec2_client = boto3.client('ec2', region_name=region.get('RegionName'))
+            region_ec2_client = Boto3ClientPool.get_client('ec2', region_name=region.get('RegionName'))
             instances = self.get_ec2_list(region_ec2_client.describe_instances()['Reservations'])
             for instance in instances:
                 user_data = {'InstanceId': instance.get('InstanceId'),
@@ -637,8 +638,8 @@ class EC2Operations:
             filters = [{'Name': f'tag:{tag_name}',
                         'Values': [tag_value, tag_value.upper(), tag_value.lower(), tag_value.title()]}]
             self.get_ec2_instance_list()
-            active_instances_in_region = self.get_ec2_instance_list(Filters=filters, ec2_client=boto3.client('ec2',
-                                                                                                             region_name=region_name),
+            region_ec2_client = Boto3ClientPool.get_client('ec2', region_name=region_name)
+            active_instances_in_region = self.get_ec2_instance_list(Filters=filters, ec2_client=region_ec2_client,
                                                                     ignore_tag=ignore_tag)
             if active_instances_in_region:
                 if skip_full_scan:
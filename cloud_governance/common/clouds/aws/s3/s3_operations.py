@@ -1,13 +1,15 @@
 import datetime
 import gzip
+import hashlib
 import json
 import os
-import tempfile
 import typeguard
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from botocore.exceptions import ClientError
 from os import listdir
 from os.path import isfile, join
 
+from cloud_governance.common.clouds.aws.s3.s3_stream_writer import S3StreamWriter
 from cloud_governance.common.clouds.aws.utils.common_methods import get_boto3_client
 from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
@@ -16,6 +18,11 @@ from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
 class S3Operations:
     """ This class is responsible for S3 operations """
 
+    MAX_TRANSFER_CONCURRENCY = 10
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+    UPLOAD_EXTRA_ARGS = {'ServerSideEncryption': 'AES256', 'StorageClass': 'ONEZONE_IA'}
+
     def __init__(self, region_name, report_file_name: str = "zombie_report.json",
                  resource_file_name: str = "resources.json.gz", bucket: str = '', logs_bucket_key: str = ''):
         #  @Todo ask AWS support regarding about this issue
@@ -27,7 +34,6 @@ class S3Operations:
         self.__report_file_name = report_file_name
         self.__resource_file_name = resource_file_name
         self.__report_file_full_path = os.path.join(os.path.dirname(__file__), self.__report_file_name)
-        self.__resources_file_full_path = os.path.join('/tmp', self.__resource_file_name)
         if bucket and logs_bucket_key:
             self.__bucket, self.__logs_bucket_key = bucket, logs_bucket_key
 
@@ -48,8 +54,7 @@ class S3Operations:
             self.__s3_client.upload_file(Filename=file_name_path,
                                          Bucket=bucket,
                                          Key=f'{key}/{upload_file}',
-                                         ExtraArgs={'ServerSideEncryption': 'AES256',
-                                                    'StorageClass': 'ONEZONE_IA'})
+                                         ExtraArgs=dict(self.UPLOAD_EXTRA_ARGS))
         # Todo add custom error
         except ClientError:
             raise
@@ -158,28 +163,95 @@ class S3Operations:
         except Exception:
             raise
 
+    @staticmethod
+    def __split_s3_target(s3_target: str):
+        """
+        This method splits the s3 target path to bucket and key
+        :param s3_target: 'data_store/calc_image_data/'
+        :return: bucket, key
+        """
+        if '/' in s3_target:
+            targets = s3_target.split('/')
+            return targets[0], '/'.join(targets[1:])
+        return s3_target, ''
+
+    def __get_file_etag(self, file_name_path: str, multipart_threshold: int, multipart_chunksize: int):
+        """
+        This method returns the etag s3 computes for the file when it is uploaded with the transfer config
+        :param file_name_path:
+        :param multipart_threshold:
+        :param multipart_chunksize:
+        :return:
+        """
+        file_digest = hashlib.md5()
+        chunk_digests = []
+        with open(file_name_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(multipart_chunksize), b''):
+                file_digest.update(chunk)
+                chunk_digests.append(hashlib.md5(chunk).digest())
+        if os.path.getsize(file_name_path) < multipart_threshold:
+            return file_digest.hexdigest()
+        return f'{hashlib.md5(b"".join(chunk_digests)).hexdigest()}-{len(chunk_digests)}'
+
+    def __list_objects(self, bucket: str, prefix: str):
+        """
+        This method lists all the objects under the prefix, page by page
+        :param bucket:
+        :param prefix:
+        :return: {key: etag}
+        """
+        objects = {}
+        paginator = self.__s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for item in page.get('Contents', []):
+                objects[item['Key']] = item['ETag'].strip('"')
+        return objects
+
+    def __get_transfer_manager(self, max_concurrency: int, multipart_threshold: int, multipart_chunksize: int):
+        """
+        This method returns the transfer manager which runs the transfers concurrently
+        :param max_concurrency:
+        :param multipart_threshold:
+        :param multipart_chunksize:
+        :return:
+        """
+        transfer_config = TransferConfig(max_concurrency=max_concurrency, multipart_threshold=multipart_threshold,
+                                         multipart_chunksize=multipart_chunksize)
+        return create_transfer_manager(self.__s3_client, transfer_config)
+
     @logger_time_stamp
     @typeguard.typechecked
-    def upload_objects(self, local_source: str, s3_target: str):
+    def upload_objects(self, local_source: str, s3_target: str, max_concurrency: int = MAX_TRANSFER_CONCURRENCY,
+                       multipart_threshold: int = MULTIPART_THRESHOLD, multipart_chunksize: int = MULTIPART_CHUNKSIZE,
+                       skip_unchanged: bool = False):
         """
         This method upload local data folder to s3 target path
         :param local_source: local data folder i.e. 'D:/Temp/'
         :param s3_target: target s3 path i.e. 'data_store/calc_image_data/'
+        :param max_concurrency: number of concurrent transfers
+        :param multipart_threshold:
+        :param multipart_chunksize:
+        :param skip_unchanged: skip the files whose etag matches the s3 object
         :return:
         """
         try:
-            if '/' in s3_target:
-                targets = s3_target.split('/')
-                bucket = targets[0]
-                key = '/'.join(targets[1:])
-            else:
-                bucket = s3_target
-                key = ''
-
+            bucket, key = self.__split_s3_target(s3_target=s3_target)
             files = [f for f in listdir(local_source) if isfile(join(local_source, f))]
-            for file in files:
-                filename = os.path.join(local_source, file)
-                self.upload_file(file_name_path=filename, bucket=bucket, key=key, upload_file=file)
+            s3_objects = self.__list_objects(bucket=bucket, prefix=key) if skip_unchanged else {}
+            futures = []
+            with self.__get_transfer_manager(max_concurrency=max_concurrency, multipart_threshold=multipart_threshold,
+                                             multipart_chunksize=multipart_chunksize) as transfer_manager:
+                for file in files:
+                    filename = os.path.join(local_source, file)
+                    s3_key = f'{key}/{file}'
+                    if skip_unchanged and s3_objects.get(s3_key) == self.__get_file_etag(
+                            file_name_path=filename, multipart_threshold=multipart_threshold,
+                            multipart_chunksize=multipart_chunksize):
+                        continue
+                    futures.append(transfer_manager.upload(fileobj=filename, bucket=bucket, key=s3_key,
+                                                           extra_args=dict(self.UPLOAD_EXTRA_ARGS)))
+            for future in futures:
+                future.result()
 
         # Todo add custom error
         except ClientError as err:
@@ -189,35 +261,36 @@ class S3Operations:
 
     @logger_time_stamp
     @typeguard.typechecked
-    def download_objects(self, s3_target: str, local_source: str):
+    def download_objects(self, s3_target: str, local_source: str, max_concurrency: int = MAX_TRANSFER_CONCURRENCY,
+                         multipart_threshold: int = MULTIPART_THRESHOLD, multipart_chunksize: int = MULTIPART_CHUNKSIZE,
+                         skip_unchanged: bool = False):
         """
         This method download from s3 target to local data folder
         :param local_source: local data folder i.e. 'D:/Temp/'
         :param s3_target: target s3 path i.e. 'data_store/calc_image_data/'
+        :param max_concurrency: number of concurrent transfers
+        :param multipart_threshold:
+        :param multipart_chunksize:
+        :param skip_unchanged: skip the local files whose etag matches the s3 object
         :return:
         """
-        files = []
-
         try:
-            if '/' in s3_target:
-                targets = s3_target.split('/')
-                bucket = targets[0]
-                key = '/'.join(targets[1:])
-            else:
-                bucket = s3_target
-                key = ''
-
-            response = self.__s3_client.list_objects_v2(Bucket=bucket, Prefix=key)
-            if response.get('Contents'):
-                for item in response['Contents']:
-                    if item['Key'].split('/')[-1]:
-                        files.append(item['Key'].split('/')[-1])
-                    else:
-                        files.append(item['Key'])
-
-            for file in files:
-                file_name = os.path.join(local_source, file)
-                self.download_file(bucket=bucket, key=key, download_file=file, file_name_path=file_name)
+            bucket, key = self.__split_s3_target(s3_target=s3_target)
+            futures = []
+            with self.__get_transfer_manager(max_concurrency=max_concurrency, multipart_threshold=multipart_threshold,
+                                             multipart_chunksize=multipart_chunksize) as transfer_manager:
+                for s3_key, etag in self.__list_objects(bucket=bucket, prefix=key).items():
+                    file = s3_key.split('/')[-1]
+                    if not file:
+                        continue
+                    file_name = os.path.join(local_source, file)
+                    if skip_unchanged and os.path.isfile(file_name) and etag == self.__get_file_etag(
+                            file_name_path=file_name, multipart_threshold=multipart_threshold,
+                            multipart_chunksize=multipart_chunksize):
+                        continue
+                    futures.append(transfer_manager.download(bucket=bucket, key=s3_key, fileobj=file_name))
+            for future in futures:
+                future.result()
 
         # Todo add custom error
         except ClientError as err:
@@ -256,31 +329,58 @@ class S3Operations:
             return list(obj)
         raise TypeError
 
+    def __dump_gzip_json(self, data, file_object):
+        """
+        This method compresses the json encoding of data into the file object while it is encoded
+        @param data:
+        @param file_object:
+        @return:
+        """
+        with gzip.open(file_object, 'wt', encoding="ascii") as zipfile:
+            json.dump(data, zipfile, default=self.__set_default)
+
+    @typeguard.typechecked
+    def upload_gzip_json(self, data, bucket: str, key: str):
+        """
+        This method streams the gzip json of data to s3, without a local file
+        @param data:
+        @param bucket:
+        @param key:
+        @return:
+        """
+        with S3StreamWriter(self.__s3_client, bucket=bucket, key=key,
+                            ServerSideEncryption='AES256', StorageClass='ONEZONE_IA') as s3_file:
+            self.__dump_gzip_json(data=data, file_object=s3_file)
+
+    @typeguard.typechecked
+    def open_gzip_object(self, bucket: str, key: str):
+        """
+        This method returns a text stream which decompresses the s3 gzip object while it is read
+        @param bucket:
+        @param key:
+        @return:
+        """
+        body = self.__s3_client.get_object(Bucket=bucket, Key=key)['Body']
+        return gzip.open(body, 'rt')
+
     @logger_time_stamp
     def save_results_to_s3(self, policy, policy_output, policy_result):
         """
         This method save policy result to s3 with folder creation order by datetime
         @return:
         """
-
-        with gzip.open(self.__resources_file_full_path, 'wt', encoding="ascii") as zipfile:
-            json.dump(policy_result, zipfile, default=self.__set_default)
         if 's3' in policy_output:
-            s3_operations = S3Operations(self.__region)
             date_key = datetime.datetime.now().strftime("%Y/%m/%d/%H")
             if '/' in policy_output:
                 targets = policy_output.split('/')
                 bucket = targets[2]
                 logs = targets[3]
-            s3_operations.upload_file(file_name_path=self.__resources_file_full_path, bucket=bucket,
-                                      key=f'{logs}/{self.__region}/{policy}/{date_key}',
-                                      upload_file=self.__resource_file_name)
+            self.upload_gzip_json(data=policy_result, bucket=bucket,
+                                  key=f'{logs}/{self.__region}/{policy}/{date_key}/{self.__resource_file_name}')
         # save local
         else:
-            os.replace(self.__resources_file_full_path, fr'{policy_output}/{self.__resource_file_name}')
-        resource_file = self.__resources_file_full_path
-        if os.path.isfile(resource_file):
-            os.remove(resource_file)
+            with open(fr'{policy_output}/{self.__resource_file_name}', 'wb') as resource_file:
+                self.__dump_gzip_json(data=policy_result, file_object=resource_file)
 
     @logger_time_stamp
     @typeguard.typechecked
@@ -307,25 +407,25 @@ class S3Operations:
                                      key_prefix=key_prefix,
                                      policy=policy)
 
+    def open_last_s3_policy_content(self, policy: str = '', file_name: str = '', s3_file_path: str = None,
+                                    key_prefix: str = ''):
+        """
+        This method returns a text stream of the last policy content
+        @return:
+        """
+        if not s3_file_path:
+            s3_file_path = self.__get_s3_latest_policy_file(policy=policy, key_prefix=key_prefix)
+        return self.open_gzip_object(bucket=self.__bucket, key=f'{s3_file_path}/{file_name}.gz')
+
     def get_last_s3_policy_content(self, policy: str = '', file_name: str = '', s3_file_path: str = None,
                                    key_prefix: str = ''):
         """
         This method return last policy content
         @return:
         """
-        with tempfile.TemporaryDirectory() as temp_local_directory:
-            local_file = temp_local_directory + '/' + file_name + '.gz'
-            if not s3_file_path:
-                if self.__get_s3_latest_policy_file(policy=policy, key_prefix=key_prefix):
-                    s3_file_path = self.__get_s3_latest_policy_file(policy=policy, key_prefix=key_prefix)
-            self.download_file(bucket=self.__bucket,
-                               key=str(s3_file_path),
-                               download_file=file_name + '.gz',
-                               file_name_path=local_file)
-            # gzip
-            os.system(f"gzip -d {local_file}")
-            with open(os.path.join(temp_local_directory, file_name)) as f:
-                return f.read()
+        with self.open_last_s3_policy_content(policy=policy, file_name=file_name, s3_file_path=s3_file_path,
+                                              key_prefix=key_prefix) as policy_file:
+            return policy_file.read()
 
     def list_buckets(self):
         """
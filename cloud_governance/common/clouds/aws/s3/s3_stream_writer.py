@@ -0,0 +1,90 @@
+import io
+
+
+class S3StreamWriter:
+    """
+    This class is a writable file object which uploads the written bytes to S3 in multipart chunks
+    Only one part is kept in memory, objects smaller than a part are uploaded with a single put_object
+    """
+
+    # S3 requires at least 5 MiB for all the parts except the last one
+    PART_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, s3_client, bucket: str, key: str, part_size: int = 0, **extra_args):
+        self.__s3_client = s3_client
+        self.__bucket = bucket
+        self.__key = key
+        self.__part_size = part_size if part_size else self.PART_SIZE
+        self.__extra_args = extra_args
+        self.__buffer = io.BytesIO()
+        self.__upload_id = None
+        self.__parts = []
+        self.closed = False
+
+    def writable(self):
+        return True
+
+    def write(self, data: bytes):
+        """
+        This method buffers the data and uploads a part once the buffer reaches the part size
+        :param data:
+        :return:
+        """
+        self.__buffer.write(data)
+        if self.__buffer.tell() >= self.__part_size:
+            self.__upload_part()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def __upload_part(self):
+        """
+        This method uploads the buffered data as the next part of the multipart upload
+        :return:
+        """
+        if not self.__upload_id:
+            self.__upload_id = self.__s3_client.create_multipart_upload(Bucket=self.__bucket, Key=self.__key,
+                                                                        **self.__extra_args)['UploadId']
+        part_number = len(self.__parts) + 1
+        response = self.__s3_client.upload_part(Bucket=self.__bucket, Key=self.__key, UploadId=self.__upload_id,
+                                                PartNumber=part_number, Body=self.__buffer.getvalue())
+        self.__parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+        self.__buffer = io.BytesIO()
+
+    def close(self):
+        """
+        This method uploads the remaining data and completes the upload
+        :return:
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.__upload_id:
+            if self.__buffer.tell():
+                self.__upload_part()
+            self.__s3_client.complete_multipart_upload(Bucket=self.__bucket, Key=self.__key, UploadId=self.__upload_id,
+                                                       MultipartUpload={'Parts': self.__parts})
+        else:
+            self.__s3_client.put_object(Bucket=self.__bucket, Key=self.__key, Body=self.__buffer.getvalue(),
+                                        **self.__extra_args)
+
+    def abort(self):
+        """
+        This method drops the uploaded parts, nothing is written to the key
+        :return:
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.__upload_id:
+            self.__s3_client.abort_multipart_upload(Bucket=self.__bucket, Key=self.__key, UploadId=self.__upload_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type:
+            self.abort()
+        else:
+            self.close()
@@ -0,0 +1,172 @@
+import threading
+import time
+from functools import partial
+
+from cloud_governance.common.logger.init_logger import logger
+from cloud_governance.main.environment_variables import environment_variables
+
+
+class AWSApiMonitor:
+    """
+    This class hooks the boto3 clients events, it limits the requests rate per service, region and credentials
+    as the aws quotas, and counts the calls, errors, retries, throttles and latency per api operation
+    """
+
+    THROTTLING_ERROR_CODES = ('Throttling', 'ThrottlingException', 'ThrottledException', 'RequestThrottledException',
+                              'TooManyRequestsException', 'ProvisionedThroughputExceededException',
+                              'TransactionInProgressException', 'RequestLimitExceeded', 'BandwidthLimitExceeded',
+                              'LimitExceededException', 'RequestThrottled', 'SlowDown', 'PriorRequestNotComplete',
+                              'EC2ThrottledException')
+    START_TIME_KEY = 'api_monitor_start_time'
+
+    __operations = {}
+    __next_request_times = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get_rate_limits():
+        """
+        This method returns the max requests per second per service id, i.e. {'cloudtrail': 2}
+        :return:
+        """
+        return environment_variables.environment_variables_dict.get('AWS_API_RATE_LIMITS') or {}
+
+    @classmethod
+    def register(cls, client, credentials_key: str = ''):
+        """
+        This method registers the monitor handlers on the client events
+        :param client:
+        :param credentials_key: identity of the client credentials, i.e. the access key id
+        :return:
+        """
+        client.meta.events.register('before-call.*.*', partial(cls.__before_call,
+                                                               region_name=client.meta.region_name,
+                                                               credentials_key=credentials_key))
+        client.meta.events.register('after-call.*.*', cls.__after_call)
+        client.meta.events.register('after-call-error.*.*', cls.__after_call_error)
+        client.meta.events.register('needs-retry.*.*', cls.__needs_retry)
+
+    @staticmethod
+    def __get_operation_name(event_name: str):
+        """
+        This method returns service.operation from the event name
+        :param event_name: i.e. after-call.ec2.DescribeInstances
+        :return:
+        """
+        return '.'.join(event_name.split('.')[1:3])
+
+    @classmethod
+    def __get_operation(cls, operation_name: str):
+        """
+        This method returns the counters of the operation, the lock must be held
+        :param operation_name:
+        :return:
+        """
+        if operation_name not in cls.__operations:
+            cls.__operations[operation_name] = {'calls': 0, 'errors': 0, 'retries': 0, 'throttles': 0,
+                                                'total_latency': 0.0, 'max_latency': 0.0}
+        return cls.__operations[operation_name]
+
+    @classmethod
+    def __throttle(cls, service_id: str, region_name: str, credentials_key: str):
+        """
+        This method waits until the next request of the service is allowed by its rate limit,
+        the rate limit applies per region and credentials
+        :param service_id:
+        :param region_name:
+        :param credentials_key:
+        :return:
+        """
+        max_requests_per_second = cls.get_rate_limits().get(service_id)
+        if not max_requests_per_second:
+            return
+        limiter_key = (service_id, region_name, credentials_key)
+        with cls.__lock:
+            current_time = time.monotonic()
+            request_time = max(current_time, cls.__next_request_times.get(limiter_key, 0))
+            cls.__next_request_times[limiter_key] = request_time + 1 / max_requests_per_second
+        if request_time > current_time:
+            time.sleep(request_time - current_time)
+
+    @classmethod
+    def __before_call(cls, event_name: str, context: dict = None, region_name: str = None, credentials_key: str = '',
+                      **kwargs):
+        cls.__throttle(service_id=event_name.split('.')[1], region_name=region_name, credentials_key=credentials_key)
+        if context is not None:
+            context[cls.START_TIME_KEY] = time.monotonic()
+
+    @classmethod
+    def __record_call(cls, event_name: str, context: dict, error: bool, retries: int = 0):
+        """
+        This method records the call of the operation
+        :param event_name:
+        :param context:
+        :param error:
+        :param retries:
+        :return:
+        """
+        start_time = (context or {}).get(cls.START_TIME_KEY)
+        latency = time.monotonic() - start_time if start_time else 0.0
+        with cls.__lock:
+            operation = cls.__get_operation(cls.__get_operation_name(event_name))
+            operation['calls'] += 1
+            operation['errors'] += int(error)
+            operation['retries'] += retries
+            operation['total_latency'] += latency
+            operation['max_latency'] = max(operation['max_latency'], latency)
+
+    @classmethod
+    def __after_call(cls, event_name: str, http_response=None, parsed: dict = None, context: dict = None, **kwargs):
+        retries = (parsed or {}).get('ResponseMetadata', {}).get('RetryAttempts', 0)
+        error = http_response is not None and http_response.status_code >= 300
+        cls.__record_call(event_name=event_name, context=context, error=error, retries=retries)
+
+    @classmethod
+    def __after_call_error(cls, event_name: str, context: dict = None, **kwargs):
+        cls.__record_call(event_name=event_name, context=context, error=True)
+
+    @classmethod
+    def __needs_retry(cls, event_name: str, response=None, **kwargs):
+        if response:
+            error_code = response[1].get('Error', {}).get('Code')
+            if error_code in cls.THROTTLING_ERROR_CODES:
+                with cls.__lock:
+                    cls.__get_operation(cls.__get_operation_name(event_name))['throttles'] += 1
+
+    @classmethod
+    def get_summary(cls):
+        """
+        This method returns the counters per api operation
+        :return: {service.operation: counters}
+        """
+        with cls.__lock:
+            return {operation_name: dict(operation) for operation_name, operation in cls.__operations.items()}
+
+    @classmethod
+    def log_summary(cls):
+        """
+        This method logs the counters of the run, the most throttled and slowest operations first
+        :return:
+        """
+        summary = cls.get_summary()
+        if not summary:
+            return
+        operations = sorted(summary.items(), key=lambda item: (item[1]['throttles'], item[1]['total_latency']),
+                            reverse=True)
+        lines = [f'{"Operation":<60}{"Calls":>8}{"Errors":>8}{"Retries":>9}{"Throttles":>11}{"AvgSec":>9}{"MaxSec":>9}']
+        for operation_name, operation in operations:
+            average_latency = operation['total_latency'] / operation['calls'] if operation['calls'] else 0
+            lines.append(f'{operation_name:<60}{operation["calls"]:>8}{operation["errors"]:>8}'
+                         f'{operation["retries"]:>9}{operation["throttles"]:>11}'
+                         f'{average_latency:>9.3f}{operation["max_latency"]:>9.3f}')
+        logger.info('AWS api calls summary:\n' + '\n'.join(lines))
+
+    @classmethod
+    def clear(cls):
+        """
+        This method drops the counters
+        :return:
+        """
+        with cls.__lock:
+            cls.__operations.clear()
+            cls.__next_request_times.clear()
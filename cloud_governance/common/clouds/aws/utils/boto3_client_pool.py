@@ -0,0 +1,64 @@
+import threading
+
+import boto3
+from botocore.config import Config
+
+from cloud_governance.common.clouds.aws.utils.aws_api_monitor import AWSApiMonitor
+from cloud_governance.main.environment_variables import environment_variables
+
+
+class Boto3ClientPool:
+    """
+    This class shares the boto3 clients across the process, one client per (service, region, credentials)
+    boto3 clients are thread safe once created, the creation itself is serialized
+    Each client is registered on the AWSApiMonitor which rate limits and counts its calls
+    """
+
+    __clients = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get_client_config():
+        """
+        This method returns the botocore config of the pooled clients
+        :return:
+        """
+        environment_variables_dict = environment_variables.environment_variables_dict
+        return Config(max_pool_connections=environment_variables_dict.get('AWS_MAX_POOL_CONNECTIONS', 50),
+                      retries={'mode': environment_variables_dict.get('AWS_RETRY_MODE', 'adaptive'),
+                               'max_attempts': environment_variables_dict.get('AWS_MAX_ATTEMPTS', 5)},
+                      connect_timeout=environment_variables_dict.get('AWS_CONNECT_TIMEOUT', 60),
+                      read_timeout=environment_variables_dict.get('AWS_READ_TIMEOUT', 60),
+                      tcp_keepalive=True)
+
+    @classmethod
+    def get_client(cls, service_name: str, region_name: str = None, **kwargs):
+        """
+        This method returns the shared client, it is created on the first use
+        :param service_name:
+        :param region_name:
+        :param kwargs: credentials, endpoint_url or config which is merged over the pool config
+        :return:
+        """
+        key = (service_name, region_name, tuple(sorted(kwargs.items(), key=lambda item: item[0])))
+        client = cls.__clients.get(key)
+        if client is None:
+            with cls.__lock:
+                client = cls.__clients.get(key)
+                if client is None:
+                    config = cls.get_client_config()
+                    if kwargs.get('config'):
+                        config = config.merge(kwargs.pop('config'))
+                    client = boto3.client(service_name, region_name=region_name, config=config, **kwargs)
+                    AWSApiMonitor.register(client, credentials_key=kwargs.get('aws_access_key_id', ''))
+                    cls.__clients[key] = client
+        return client
+
+    @classmethod
+    def clear(cls):
+        """
+        This method drops the shared clients
+        :return:
+        """
+        with cls.__lock:
+            cls.__clients.clear()
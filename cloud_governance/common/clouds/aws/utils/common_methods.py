@@ -1,5 +1,4 @@
-import boto3
-
+from cloud_governance.common.clouds.aws.utils.boto3_client_pool import Boto3ClientPool
 from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.common.utils.configs import AWS_DEFAULT_GLOBAL_REGION
 
@@ -37,7 +36,7 @@ def get_tag_value_from_tags(tags: list, tag_name: str, cast_type: str = 'str',
 
 def get_boto3_client(client: str, region_name: str = AWS_DEFAULT_GLOBAL_REGION, **kwargs):
     """
-    This method initializes the aws boto3 client
+    This method returns the aws boto3 client, shared across the process per service, region and credentials
     :param client:
     :type client:
     :param region_name:
@@ -47,7 +46,7 @@ def get_boto3_client(client: str, region_name: str = AWS_DEFAULT_GLOBAL_REGION,
     """
     client_object = None
     try:
-        client_object = boto3.client(client, region_name=region_name, **kwargs)
+        client_object = Boto3ClientPool.get_client(client, region_name=region_name, **kwargs)
     except Exception as err:
         logger.error(f"{client} Client Initialization error: {err}")
     return client_object
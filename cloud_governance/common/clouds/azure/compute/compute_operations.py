@@ -31,6 +31,20 @@ class ComputeOperations(CommonOperations):
         instances_list: [VirtualMachine] = self._item_paged_iterator(item_paged_object=instances_paged_object)
         return instances_list
 
+    def get_all_instance_statuses(self) -> dict:
+        """
+        This method returns the instance view of all the virtual machines in a few paged calls
+        :return: {vm_id: instance_view}
+        :rtype:
+        """
+        instances_paged_object = self.__compute_client.virtual_machines.list_all(status_only='true')
+        instances_list: [VirtualMachine] = self._item_paged_iterator(item_paged_object=instances_paged_object)
+        instance_statuses = {}
+        for instance in instances_list:
+            if instance.instance_view:
+                instance_statuses[instance.id.lower()] = instance.instance_view.as_dict()
+        return instance_statuses
+
     def get_instance_statuses(self, resource_id: str, vm_name: str) -> dict:
         """
         This method returns the virtual machine instance status
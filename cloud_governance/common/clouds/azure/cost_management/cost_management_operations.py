@@ -1,6 +1,10 @@
 import calendar
+import copy
 import datetime
+import json
+import threading
 import time
+from concurrent.futures import Future
 
 import pytz
 from azure.core.exceptions import HttpResponseError
@@ -14,22 +18,125 @@ from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
 class CostManagementOperations:
     """This class for fetching the azure usage and forecast reports"""
 
+    MAX_RETRIES = 5
+    DEFAULT_RETRY_AFTER = 10
+    MAX_CONCURRENT_QUERIES_PER_SCOPE = 3
+    RETRY_AFTER_HEADERS = ['x-ms-ratelimit-microsoft.costmanagement-qpu-retry-after',
+                           'x-ms-ratelimit-microsoft.costmanagement-entity-retry-after',
+                           'x-ms-ratelimit-microsoft.costmanagement-tenant-retry-after',
+                           'x-ms-ratelimit-microsoft.consumption-retry-after',
+                           'retry-after']
+
+    # Shared across the instances, identical queries are served once per run
+    __query_cache = {}
+    __in_flight = {}
+    __scope_semaphores = {}
+    __lock = threading.Lock()
+
     def __init__(self):
         self.azure_operations = AzureOperations()
 
-    def __get_query_dataset(self, grouping: list, tags: dict, granularity: str):
+    def __get_scope_semaphore(self, scope: str):
+        """
+        This method returns the semaphore which bounds the concurrent queries of the scope
+        :param scope:
+        :type scope:
+        :return:
+        :rtype:
+        """
+        with self.__lock:
+            if scope not in self.__scope_semaphores:
+                self.__scope_semaphores[scope] = threading.BoundedSemaphore(self.MAX_CONCURRENT_QUERIES_PER_SCOPE)
+            return self.__scope_semaphores[scope]
+
+    def __get_retry_after_seconds(self, http_error: HttpResponseError):
+        """
+        This method returns the seconds to wait from the rate limit headers of the throttled response
+        :param http_error:
+        :type http_error:
+        :return:
+        :rtype:
+        """
+        headers = {}
+        if http_error.response is not None and http_error.response.headers:
+            headers = {key.lower(): value for key, value in http_error.response.headers.items()}
+        retry_after_values = []
+        for header in self.RETRY_AFTER_HEADERS:
+            try:
+                retry_after_values.append(int(headers[header]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return max(retry_after_values) if retry_after_values else self.DEFAULT_RETRY_AFTER
+
+    def __execute_query(self, query_type: str, scope: str, parameters: dict):
+        """
+        This method executes the usage/forecast query, waits for the Retry-After time on throttling and
+        caches the identical (scope, dataset, period) responses, identical in-flight queries are sent once
+        :param query_type: usage | forecast
+        :type query_type:
+        :param scope:
+        :type scope:
+        :param parameters:
+        :type parameters:
+        :return:
+        :rtype:
+        """
+        time_period = parameters.get('time_period')
+        cache_key = (query_type, scope, str(time_period.from_property), str(time_period.to),
+                     json.dumps({key: value for key, value in parameters.items() if key != 'time_period'},
+                                sort_keys=True, default=str))
+        with self.__lock:
+            if cache_key in self.__query_cache:
+                return copy.deepcopy(self.__query_cache[cache_key])
+            future = self.__in_flight.get(cache_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.__in_flight[cache_key] = future
+        if not owner:
+            return copy.deepcopy(future.result())
+        query_operations = self.azure_operations.cost_mgmt_client.query if query_type == 'usage' \
+            else self.azure_operations.cost_mgmt_client.forecast
+        try:
+            with self.__get_scope_semaphore(scope):
+                for attempt in range(self.MAX_RETRIES + 1):
+                    try:
+                        response = query_operations.usage(scope=scope, parameters=parameters).as_dict()
+                        break
+                    except HttpResponseError as e:
+                        if e.status_code != 429 or attempt == self.MAX_RETRIES:
+                            raise
+                        retry_after = self.__get_retry_after_seconds(http_error=e)
+                        logger.warning(f'Cost Management {query_type} query throttled on {scope}, '
+                                       f'retrying after {retry_after} seconds')
+                        time.sleep(retry_after)
+            with self.__lock:
+                self.__query_cache[cache_key] = copy.deepcopy(response)
+            future.set_result(copy.deepcopy(response))
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self.__lock:
+                self.__in_flight.pop(cache_key, None)
+        return response
+
+    def __get_query_dataset(self, grouping: list, tags: dict, granularity: str, dimensions: dict = None):
         """
         This method returns the dataset
         :param grouping:
         :type grouping:
         :param tags:
         :type tags:
+        :param dimensions: {dimension_name: values}, i.e. {'SubscriptionId': [subscription_id]}
+        :type dimensions:
         :return:
         :rtype:
         """
         query_dataset = {"aggregation": {"totalCost": {"name": "Cost", "function": "Sum"}},
                          "granularity": granularity,
                          }
+        query_filters = []
         if tags:
             filter_tags = {}
             if len(tags) > 2:
@@ -39,7 +146,12 @@ class CostManagementOperations:
             else:
                 for key, value in tags.items():
                     filter_tags = {'tags': {'name': key.lower(), "operator": "In", 'values': [value.lower()]}}
-            query_dataset['filter'] = filter_tags
+            query_filters.extend(filter_tags.get('and', [filter_tags]))
+        if dimensions:
+            for name, values in dimensions.items():
+                query_filters.append({'dimensions': {'name': name, "operator": "In", 'values': values}})
+        if query_filters:
+            query_dataset['filter'] = query_filters[0] if len(query_filters) == 1 else {'and': query_filters}
         if grouping:
             filter_grouping = []
             for group in grouping:
@@ -52,7 +164,8 @@ class CostManagementOperations:
 
     @logger_time_stamp
     def get_usage(self, scope: str, start_date: datetime = None, end_date: datetime = None,
-                  granularity: str = 'Monthly', tags: dict = None, grouping: list = None, **kwargs):
+                  granularity: str = 'Monthly', tags: dict = None, grouping: list = None, dimensions: dict = None,
+                  **kwargs):
         """
         This method get the current usage based on month
         :param scope:
@@ -61,6 +174,7 @@ class CostManagementOperations:
         :param granularity:
         :param tags:
         :param grouping:
+        :param dimensions: {dimension_name: values} filter
         :param kwargs:
         :return:
         """
@@ -68,24 +182,21 @@ class CostManagementOperations:
             if not start_date and not end_date:
                 end_date = datetime.datetime.now(pytz.UTC)
                 start_date = (end_date - datetime.timedelta(days=30)).replace(day=1)
-            response = self.azure_operations.cost_mgmt_client.query.usage(scope=scope, parameters={
+            return self.__execute_query(query_type='usage', scope=scope, parameters={
                 'type': 'Usage', 'timeframe': 'Custom',
                 'time_period': QueryTimePeriod(from_property=start_date, to=end_date),
-                'dataset': self.__get_query_dataset(grouping=grouping, tags=tags, granularity=granularity)
+                'dataset': self.__get_query_dataset(grouping=grouping, tags=tags, granularity=granularity,
+                                                    dimensions=dimensions)
                 })
-            return response.as_dict()
         except HttpResponseError as e:
             logger.error(e)
-            if e.status_code == 429:
-                time.sleep(10)
-                return self.get_usage(scope, start_date=start_date, end_date=end_date, granularity=granularity, **kwargs)
         except Exception as err:
             logger.error(err)
         return []
 
     @logger_time_stamp
     def get_forecast(self, scope: str, start_date: datetime = '', end_date: datetime = '', granularity: str = 'Monthly',
-                     tags: dict = None, grouping: list = None, **kwargs):
+                     tags: dict = None, grouping: list = None, dimensions: dict = None, **kwargs):
         """
         This method gets the forecast of next couple of months
         @param start_date:
@@ -94,6 +205,7 @@ class CostManagementOperations:
         @param scope:
         @param tags:
         @param grouping:
+        @param dimensions: {dimension_name: values} filter
         @return:
         """
         try:
@@ -104,12 +216,13 @@ class CostManagementOperations:
                 month_end = calendar.monthrange(end_date.year, end_date.month)[1]
                 end_date = end_date.replace(day=month_end)
             logger.info(f'StartDate: {start_date}, EndDate: {end_date}')
-            response = self.azure_operations.cost_mgmt_client.forecast.usage(scope=scope, parameters={
+            response = self.__execute_query(query_type='forecast', scope=scope, parameters={
                         'type': 'ActualCost', 'timeframe': 'Custom',
                         'time_period': QueryTimePeriod(from_property=start_date, to=end_date),
-                        'dataset': self.__get_query_dataset(grouping=grouping, tags=tags, granularity=granularity),
+                        'dataset': self.__get_query_dataset(grouping=grouping, tags=tags, granularity=granularity,
+                                                            dimensions=dimensions),
                         'include_actual_cost': True, 'include_fresh_partial_cost': False
-            }).as_dict()
+            })
             result = {'columns': response.get('columns'), 'rows': []}
             row_data = {}
             for data in response.get('rows'):
@@ -124,9 +237,6 @@ class CostManagementOperations:
             return result
         except HttpResponseError as e:
             logger.error(e)
-            if e.status_code == 429:
-                time.sleep(10)
-                return self.get_usage(scope, start_date=start_date, end_date=end_date, granularity=granularity, **kwargs)
         except Exception as err:
             logger.error(err)
         return []
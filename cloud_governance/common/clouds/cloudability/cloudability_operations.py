@@ -1,13 +1,26 @@
+import hashlib
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.common.utils.api_requests import APIRequests
 from cloud_governance.common.utils.configs import LOOK_BACK_DAYS
 from cloud_governance.main.environment_variables import environment_variables
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 
 
 class CloudabilityOperations:
     APPITO_LOGIN_API = "https://frontdoor.apptio.com/service/apikeylogin"
+    MAX_WORKERS = 10
+    # the past month reports are cached once the month is settled, late charges are added in the first days
+    CACHE_SETTLE_DAYS = 7
+
+    __appito_token = None
+    __appito_token_time = 0
+    __appito_token_lock = threading.Lock()
 
     def __init__(self):
         self.__api_requests = APIRequests()
@@ -18,27 +31,45 @@ class CloudabilityOperations:
         self.__appito_envid = self.environment_variables_dict.get('APPITO_ENVID')
         self.__key_secret = self.environment_variables_dict.get('APPITO_KEY_SECRET')
         self.__key_access = self.environment_variables_dict.get('APPITO_KEY_ACCESS')
+        self.__appito_token_ttl = self.environment_variables_dict.get('APPITO_TOKEN_TTL', 0)
+        self.__cache_dir = self.environment_variables_dict.get('CLOUDABILITY_CACHE_DIR', '')
         self.dimensions = self.environment_variables_dict.get('CLOUDABILITY_DIMENSIONS')
         self.metrics = self.environment_variables_dict.get('CLOUDABILITY_METRICS')
 
     def __get_appito_token(self):
         """
-        This method returns the appito token
+        This method returns the appito token, the token is shared and reused until the APPITO_TOKEN_TTL expires
         :return:
         :rtype:
         """
-        data = {
-            "keyAccess": self.__key_access,
-            "keySecret": self.__key_secret
-        }
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
-        response = self.__api_requests.post(url=self.APPITO_LOGIN_API, data=json.dumps(data), headers=headers)
-        if response.ok:
-            return response.headers['apptio-opentoken']
-        return None
+        cls = CloudabilityOperations
+        with cls.__appito_token_lock:
+            if cls.__appito_token and time.time() - cls.__appito_token_time < self.__appito_token_ttl:
+                return cls.__appito_token
+            data = {
+                "keyAccess": self.__key_access,
+                "keySecret": self.__key_secret
+            }
+            headers = {
+                'Accept': 'application/json',
+                'Content-Type': 'application/json'
+            }
+            response = self.__api_requests.post(url=self.APPITO_LOGIN_API, data=json.dumps(data), headers=headers)
+            if response.ok:
+                cls.__appito_token = response.headers['apptio-opentoken']
+                cls.__appito_token_time = time.time()
+                return cls.__appito_token
+            return None
+
+    @classmethod
+    def clear_appito_token(cls):
+        """
+        This method drops the shared appito token
+        :return:
+        """
+        with cls.__appito_token_lock:
+            cls.__appito_token = None
+            cls.__appito_token_time = 0
 
     def __get_start_date(self, look_back_days: int = LOOK_BACK_DAYS):
         return (self.__get_end_date() - timedelta(days=look_back_days)).replace(day=1)
@@ -46,6 +77,82 @@ class CloudabilityOperations:
     def __get_end_date(self):
         return datetime.now(timezone.utc).date()
 
+    @staticmethod
+    def __to_date(value):
+        """
+        This method returns the date of the date string
+        :param value:
+        :return:
+        """
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return date.fromisoformat(str(value)[:10])
+
+    @staticmethod
+    def __split_by_month(start_date: date, end_date: date):
+        """
+        This method splits the date range into monthly date ranges, the end dates are inclusive
+        :param start_date:
+        :param end_date:
+        :return:
+        """
+        date_ranges = []
+        while start_date <= end_date:
+            next_month = (start_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+            date_ranges.append((start_date, min(end_date, next_month - timedelta(days=1))))
+            start_date = next_month
+        return date_ranges
+
+    def __get_cache_file(self, api: str, end_date: date):
+        """
+        This method returns the cache file of the report, None if the report can still change
+        :param api:
+        :param end_date:
+        :return:
+        """
+        if not self.__cache_dir or end_date + timedelta(days=self.CACHE_SETTLE_DAYS) >= self.__get_end_date():
+            return None
+        return os.path.join(self.__cache_dir, f'{hashlib.sha256(api.encode()).hexdigest()}.json')
+
+    def __get_report_pages(self, api: str, end_date: date):
+        """
+        This method returns the results of all the report pages, the settled reports are read from the cache
+        :param api:
+        :param end_date:
+        :return:
+        """
+        cache_file = self.__get_cache_file(api=api, end_date=end_date)
+        if cache_file and os.path.exists(cache_file):
+            with open(cache_file) as file:
+                return json.load(file)
+        cost_usage_result = []
+        page_token = None
+        while True:
+            appito_token = self.__get_appito_token()
+            if not appito_token:
+                raise Exception("Appito Token missing error")
+            headers = {
+                "apptio-environmentid": self.__appito_envid,
+                "apptio-opentoken": appito_token
+            }
+            response = self.__api_requests.get(url=f'{api}&token={page_token}' if page_token else api,
+                                               headers=headers)
+            if not isinstance(response, dict):
+                logger.error(f'Cannot get the cloudability report: {response}')
+                return cost_usage_result
+            cost_usage_result.extend(response.get('results') or [])
+            page_token = response.get('pagination', {}).get('next')
+            if not page_token:
+                break
+        if cache_file:
+            os.makedirs(self.__cache_dir, exist_ok=True)
+            with open(f'{cache_file}.tmp', 'w') as file:
+                json.dump(cost_usage_result, file)
+            os.replace(f'{cache_file}.tmp', cache_file)
+        return cost_usage_result
+
     def get_cost_reports(self,
                          dimensions: str = None,
                          metrics: str = None,
@@ -53,43 +160,32 @@ class CloudabilityOperations:
                          end_date: str = None,
                          custom_filter: str = '',
                          look_back_days: int = LOOK_BACK_DAYS,
-                         page_token: str = None):
+                         custom_filters: list = None):
         """
         This method returns the cost reports from the cloudability
+        The independent queries, one per custom filter and per month when the date is a dimension, run concurrently
+        :param custom_filters: the filters are queried separately and their results are concatenated
         :return:
         :rtype:
         """
-        cost_usage_result = []
-        appito_token = self.__get_appito_token()
-        if not appito_token:
-            raise Exception("Appito Token missing error")
-
         dimensions = dimensions or self.dimensions
         metrics = metrics or self.metrics
-        start_date = start_date or self.__get_start_date(look_back_days)
-        end_date = end_date or self.__get_end_date()
-        api = f'{self.__cloudability_api}/{self.__reports_path}?' \
-              f'dimensions={dimensions}&metrics={metrics}' \
-              f'&start_date={start_date}&end_date={end_date}' \
-              f'&id={self.__view_id}&{custom_filter}'
-        if page_token:
-            api += f'&token={page_token}'
-        headers = {
-            "apptio-environmentid": self.__appito_envid,
-            "apptio-opentoken": appito_token
-        }
-        response = self.__api_requests.get(url=api, headers=headers)
-        if isinstance(response, dict):
-            results = response.get('results') if response.get('results') else response
-            cost_usage_result.extend(results)
-            page_token = response.get('pagination', {}).get('next')
-            if page_token:
-                cost_usage_result.extend(self.get_cost_reports(page_token=page_token,
-                                                               dimensions=dimensions,
-                                                               metrics=metrics,
-                                                               start_date=start_date,
-                                                               end_date=end_date,
-                                                               custom_filter=custom_filter
-                                                               ))
-
+        start_date = self.__to_date(start_date or self.__get_start_date(look_back_days))
+        end_date = self.__to_date(end_date or self.__get_end_date())
+        if 'date' in dimensions.split(','):
+            date_ranges = self.__split_by_month(start_date=start_date, end_date=end_date)
+        else:
+            date_ranges = [(start_date, end_date)]
+        queries = []
+        for query_filter in (custom_filters if custom_filters else [custom_filter]):
+            for query_start_date, query_end_date in date_ranges:
+                api = f'{self.__cloudability_api}/{self.__reports_path}?' \
+                      f'dimensions={dimensions}&metrics={metrics}' \
+                      f'&start_date={query_start_date}&end_date={query_end_date}' \
+                      f'&id={self.__view_id}&{query_filter}'
+                queries.append((api, query_end_date))
+        cost_usage_result = []
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for results in executor.map(lambda query: self.__get_report_pages(*query), queries):
+                cost_usage_result.extend(results)
         return cost_usage_result
@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
 
+from google.api_core.exceptions import GoogleAPICallError
 from google.cloud import bigquery
 from typeguard import typechecked
 
+from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
 from cloud_governance.main.environment_variables import environment_variables
 
@@ -35,20 +37,29 @@ class GoogleAccount:
         start_date = end_date - timedelta(days=diff_days)
         return start_date, end_date
 
+    def __get_query_rows(self, query_job: bigquery.QueryJob):
+        """
+        This method waits for the query job and decodes the rows through arrow,
+        reads the large results with the BigQuery Storage Read API
+        :param query_job:
+        :return:
+        """
+        query_result = query_job.result()
+        try:
+            arrow_table = query_result.to_arrow(create_bqstorage_client=True)
+        except (GoogleAPICallError, ImportError) as err:
+            logger.warning(f'Unable to read the results using BigQuery Storage API, falling back to REST: {err}')
+            arrow_table = query_result.to_arrow(create_bqstorage_client=False)
+        return arrow_table.to_pylist()
+
     @typechecked()
     @logger_time_stamp
     def query_list(self, queries: list):
         """
         This method returns the query results that scans from the BigQuery
+        All the queries are submitted before waiting, so they run concurrently in BigQuery
         :param queries:
         :return:
         """
-        queries_results = []
-        for idx, query in enumerate(queries):
-            parent_job = self.__client.query(query)
-            results = parent_job.result()  # Waits for job to complete.
-            query_rows = []
-            for row in results:
-                query_rows.append(dict(row))
-            queries_results.append(query_rows)
-        return queries_results
+        query_jobs = [self.__client.query(query) for query in queries]
+        return [self.__get_query_rows(query_job) for query_job in query_jobs]
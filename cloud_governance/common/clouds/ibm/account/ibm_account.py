@@ -1,5 +1,9 @@
 import datetime
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import SoftLayer
 import pandas as pd
@@ -26,6 +30,15 @@ class IBMAccount:
     END_DATE = 16
     RETRIES = 3
     DELAY = 30
+    ITEMS_PAGE_LIMIT = 100
+    MAX_WORKERS = 10
+    INVOICE_ITEM_MASK = 'mask[id, createDate, recurringFee, parentId, categoryCode, description, hostName, domainName, ' \
+                        'invoiceId, resourceTableId, productItemId]'
+    USER_TAGS_INDEXES = ('User', '_Email')
+
+    # {file_name: (modified_time, loaded_at, {index: {user: tags}})}, shared by the IBM tagging and cost policies
+    __user_tags_sheets = {}
+    __user_tags_sheets_lock = threading.Lock()
 
     def __init__(self):
         self.__environment_variables_dict = environment_variables.environment_variables_dict
@@ -48,6 +61,7 @@ class IBMAccount:
         self.__gsheet_client = GoogleDriveOperations()
         self.__ldap_host_name = self.__environment_variables_dict.get('LDAP_HOST_NAME', '')
         self.__ldap = LdapSearch(ldap_host_name=self.__ldap_host_name)
+        self.__user_tags_cache_ttl = self.__environment_variables_dict.get('GSHEET_USER_TAGS_CACHE_TTL', 0)
 
     def get_sl_client(self):
         """
@@ -70,6 +84,58 @@ class IBMAccount:
                 user_tags.append(f'{tag.strip().lower()}:{value.strip().lower()}')
         return user_tags
 
+    def __load_user_tags_sheet(self, file_name: str):
+        """
+        This method reads the user tags sheet and indexes its rows by the User and the _Email columns
+        @param file_name:
+        @return: {index: {user: tags}}
+        """
+        df = pd.read_csv(file_name, dtype=str)
+        df.fillna('', inplace=True)
+        user_tags_sheet = {}
+        for index in self.USER_TAGS_INDEXES:
+            if index in df.columns:
+                users_tags = user_tags_sheet.setdefault(index, {})
+                for row in df.to_dict(orient='records'):
+                    user = row.pop(index)
+                    if user not in users_tags:
+                        users_tags[user] = row
+        return user_tags_sheet
+
+    @typechecked
+    def get_user_tags_sheet(self, file_path: str = '/tmp/'):
+        """
+        This method returns the indexed user tags sheet of the account, it is downloaded if it is missing,
+        loaded once per run and reloaded when the sheet file is modified or the GSHEET_USER_TAGS_CACHE_TTL expires
+        @param file_path:
+        @return: {index: {user: tags}} or None if there is no sheet
+        """
+        file_name = os.path.join(file_path, f'{self.account}.csv')
+        with self.__user_tags_sheets_lock:
+            modified_time, loaded_at, user_tags_sheet = self.__user_tags_sheets.get(file_name, (0, 0, None))
+            expired = user_tags_sheet is not None and self.__user_tags_cache_ttl and \
+                time.time() - loaded_at > self.__user_tags_cache_ttl
+            if expired or not os.path.exists(file_name):
+                self.__gsheet_client.download_spreadsheet(spreadsheet_id=self.__gsheet_id, sheet_name=self.account,
+                                                          file_path=file_path)
+            if not os.path.exists(file_name):
+                self.__user_tags_sheets.pop(file_name, None)
+                return None
+            if expired or user_tags_sheet is None or os.path.getmtime(file_name) != modified_time:
+                modified_time = os.path.getmtime(file_name)
+                user_tags_sheet = self.__load_user_tags_sheet(file_name=file_name)
+                self.__user_tags_sheets[file_name] = (modified_time, time.time(), user_tags_sheet)
+            return user_tags_sheet
+
+    @classmethod
+    def clear_user_tags_sheets(cls):
+        """
+        This method drops the loaded user tags sheets
+        @return:
+        """
+        with cls.__user_tags_sheets_lock:
+            cls.__user_tags_sheets.clear()
+
     @typechecked
     def get_user_tags_from_gsheet(self, username: str, user_email: str = '', file_path: str = '/tmp/'):
         """
@@ -79,23 +145,15 @@ class IBMAccount:
         @param file_path:
         @return:
         """
-        file_name = os.path.join(file_path, f'{self.account}.csv')
-        if not os.path.exists(file_name):
-            self.__gsheet_client.download_spreadsheet(spreadsheet_id=self.__gsheet_id, sheet_name=self.account,
-                                                      file_path=file_path)
-        if os.path.exists(file_name):
-            df = pd.read_csv(file_name)
-            df.fillna('', inplace=True)
+        user_tags_sheet = self.get_user_tags_sheet(file_path=file_path)
+        if user_tags_sheet is not None:
             if user_email:
-                df.set_index('_Email', inplace=True)
+                users_tags = user_tags_sheet.get('_Email', {})
                 user = username.split('@')[0]
             else:
-                df.set_index('User', inplace=True)
+                users_tags = user_tags_sheet.get('User', {})
                 user = username.split('_')[1].split('@')[0]
-            try:
-                tags = dict(df.loc[username])
-            except KeyError:
-                tags = {}
+            tags = dict(users_tags.get(username, {}))
             tags['User'] = user
         else:
             tags = {}
@@ -111,10 +169,30 @@ class IBMAccount:
                 tags['Manager'] = ldap_data['managerName']
         return self.__organise_user_tags(tags)
 
+    def __get_invoice_items_page(self, invoice_id: int, offset: int = None):
+        """
+        This method returns one page of the invoice items, all the items if the offset is None
+        @param invoice_id:
+        @param offset:
+        @return:
+        """
+        if offset is None:
+            return self.__sl_client.call('SoftLayer_Billing_Invoice', 'getItems', id=invoice_id,
+                                         mask=self.INVOICE_ITEM_MASK, iter=True)
+        return self.__sl_client.call('SoftLayer_Billing_Invoice', 'getItems', id=invoice_id,
+                                     mask=self.INVOICE_ITEM_MASK, limit=self.ITEMS_PAGE_LIMIT, offset=offset)
+
     @retry(exceptions=Exception, tries=RETRIES, delay=DELAY)
     @typechecked
     @logger_time_stamp
     def get_monthly_invoices(self, month: int, year: int):
+        """
+        This method returns the items of the monthly recurring invoices,
+        the item pages of all the invoices are fetched concurrently based on the invoice itemCount
+        @param month:
+        @param year:
+        @return: {invoice_id: [invoice_items]}
+        """
         _filter = {
             'invoices': {
                 'closedDate': {
@@ -126,18 +204,36 @@ class IBMAccount:
                 }
             }
         }
-        invoice_mask = "mask[id, closedDate, typeCode, createDate]"
+        invoice_mask = "mask[id, closedDate, typeCode, createDate, itemCount]"
         invoice_list = self.__sl_client.call('SoftLayer_Account', 'getInvoices', mask=invoice_mask, filter=_filter,
                                              iter=True)
-        invoice_data = {}
+        invoice_pages = []
         for invoice in invoice_list:
             if invoice.get('typeCode') == 'RECURRING':
-                invoice_item_mask = f"""mask[id, createDate, recurringFee, parentId, categoryCode, description, hostName, domainName, invoiceId, resourceTableId, productItemId]"""
-                invoice_items = self.__sl_client.call('SoftLayer_Billing_Invoice', 'getItems', id=invoice.get('id'),
-                                                      iter=True, mask=invoice_item_mask)
-                invoice_data[invoice.get('id')] = invoice_items
+                if 'itemCount' not in invoice:
+                    invoice_pages.append((invoice.get('id'), None))
+                    continue
+                for offset in range(0, int(invoice.get('itemCount')), self.ITEMS_PAGE_LIMIT):
+                    invoice_pages.append((invoice.get('id'), offset))
+        invoice_data = {}
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            pages = executor.map(lambda page: self.__get_invoice_items_page(*page), invoice_pages)
+            for (invoice_id, _), invoice_items in zip(invoice_pages, pages):
+                invoice_data.setdefault(invoice_id, []).extend(invoice_items or [])
         return invoice_data
 
+    @staticmethod
+    def get_users_pattern(users: list):
+        """
+        This method returns a regex which finds any of the users in a text, the longest user name first
+        @param users:
+        @return: compiled regex or None if there are no users
+        """
+        users = sorted({user for user in users if user}, key=len, reverse=True)
+        if not users:
+            return None
+        return re.compile('|'.join(re.escape(user) for user in users))
+
     @retry(exceptions=Exception, tries=RETRIES, delay=DELAY)
     @logger_time_stamp
     def get_users(self):
@@ -160,6 +256,7 @@ class IBMAccount:
         @return:
         """
         users = self.get_users()
+        users_pattern = self.get_users_pattern(users)
         data = self.get_monthly_invoices(month, year)
         hostname_data = {}
         parent_id_data = {}
@@ -170,7 +267,7 @@ class IBMAccount:
                 item_id = invoice.get('id')
                 recurring_fee = float(invoice.get('recurringFee', 0))
                 description = invoice.get('description')
-                username = [user for user in users if user in description]
+                username = users_pattern.search(description) if users_pattern and description else None
                 if not parent_id:
                     if 'hostName' in invoice:
                         hostname_data[item_id] = f"""{invoice.get('hostName')}.{invoice.get('domainName')}"""
@@ -182,7 +279,7 @@ class IBMAccount:
                     parent_id_data[item_id] = parent_id_data.get(item_id, 0) + recurring_fee
                 if username:
                     description_id_data.setdefault(parent_id, set()).add(
-                        f'{username[0]}-{"-".join(description.split()[:2])}')
+                        f'{username.group()}-{"-".join(description.split()[:2])}')
         for parent_id, username in description_id_data.items():
             hostname_data[parent_id] = list(username)[0]
         combine_invoice_data = {}
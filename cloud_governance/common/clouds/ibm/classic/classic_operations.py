@@ -13,6 +13,8 @@ class ClassicOperations:
 
     RETRIES = 3
     DELAY = 30
+    DEVICE_DETAILS_MASK = ("mask[id, hostname, domain, fullyQualifiedDomainName, tagReferences[tag[name]], "
+                           "billingItem[orderItem[order[userRecord[username]]]]]")
 
     def __init__(self):
         self._sl_client = IBMAccount().get_sl_client()
@@ -30,6 +32,48 @@ class ClassicOperations:
                 tags.append(tag.get('tag')['name'].strip())
         return tags
 
+    def __get_device_record(self, device: dict):
+        """
+        This method returns the compact record of the device from the object mask response
+        @param device:
+        @return:
+        """
+        username = ''
+        billing_item = device.get('billingItem')
+        if billing_item:
+            user_record = billing_item.get('orderItem', {}).get('order', {}).get('userRecord', {})
+            username = user_record.get('username', '')
+        return {
+            'id': str(device.get('id')),
+            'hostname': device.get('hostname'),
+            'name': f'{device.get("hostname")}.{device.get("domain")}',
+            'fqdn': device.get('fullyQualifiedDomainName', ''),
+            'username': username,
+            'tags': self.__filter_tag_names(tag_references=device.get('tagReferences') or [])
+        }
+
+    @retry(exceptions=Exception, tries=RETRIES, delay=DELAY)
+    @logger_time_stamp
+    def get_hardware_details(self):
+        """
+        This method returns all hardwares ( bare-metal machines ) with tags and order username
+        in a single object mask call, instead of fetching the data per hardware
+        @return:
+        """
+        hardwares = self._sl_client.call('Account', 'getHardware', mask=self.DEVICE_DETAILS_MASK, iter=True)
+        return [self.__get_device_record(device=hardware) for hardware in hardwares]
+
+    @retry(exceptions=Exception, tries=RETRIES, delay=DELAY)
+    @logger_time_stamp
+    def get_virtual_machine_details(self):
+        """
+        This method returns all virtual machines with tags and order username
+        in a single object mask call, instead of fetching the data per virtual machine
+        @return:
+        """
+        vms = self._sl_client.call('Account', 'getVirtualGuests', mask=self.DEVICE_DETAILS_MASK, iter=True)
+        return [self.__get_device_record(device=vm) for vm in vms]
+
     @retry(exceptions=Exception, tries=RETRIES, delay=DELAY)
     @logger_time_stamp
     def get_hardware_ids(self):
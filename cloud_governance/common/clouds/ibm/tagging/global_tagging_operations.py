@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ibm_platform_services import GlobalSearchV2
 from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1, Resource
 
 from cloud_governance.common.clouds.ibm.account.ibm_authenticator import IBMAuthenticator
@@ -10,10 +13,77 @@ class GlobalTaggingOperations(IBMAuthenticator):
     This class performs tagging operations on cloud resources.
     """
     BATCH_SIZE = 100
+    MAX_WORKERS = 5
+    RETRIES = 2
+    SEARCH_LIMIT = 1000
 
     def __init__(self):
         super().__init__()
         self.__tag_service = GlobalTaggingV1(authenticator=self.iam_authenticator)
+        self.__search_service = GlobalSearchV2(authenticator=self.iam_authenticator)
+
+    def get_tagged_resources_crn(self, tag_name: str):
+        """
+        This method returns the crn's of all resources already attached with the tag
+        :param tag_name:
+        :return:
+        """
+        resources_crn = set()
+        search_cursor = None
+        while True:
+            response = self.__search_service.search(query=f'tags:"{tag_name}"', fields=['crn'],
+                                                    account_id=self.account_id, limit=self.SEARCH_LIMIT,
+                                                    search_cursor=search_cursor).get_result()
+            resources_crn.update(item.get('crn') for item in response.get('items', []))
+            search_cursor = response.get('search_cursor')
+            if not search_cursor or len(response.get('items', [])) < self.SEARCH_LIMIT:
+                break
+        return resources_crn
+
+    def __get_untagged_resources_crn(self, resources_crn: list, tag_names: list):
+        """
+        This method filters out the crn's which already carry all the tags
+        :param resources_crn:
+        :param tag_names:
+        :return:
+        """
+        try:
+            tagged_resources_crn = None
+            for tag_name in tag_names:
+                tag_resources_crn = self.get_tagged_resources_crn(tag_name=tag_name)
+                tagged_resources_crn = tag_resources_crn if tagged_resources_crn is None \
+                    else tagged_resources_crn & tag_resources_crn
+            tagged_resources_crn = tagged_resources_crn or set()
+        except Exception as err:
+            logger.error(f'Unable to fetch the tagged resources, tagging all resources: {err}')
+            tagged_resources_crn = set()
+        return [resource_crn for resource_crn in resources_crn if resource_crn not in tagged_resources_crn]
+
+    def __attach_tags(self, resources_crn: list, tag_names: list):
+        """
+        This method attaches the tags to a batch of resources, retries only the failed crn's
+        :param resources_crn:
+        :param tag_names:
+        :return: success count, failed crn's
+        """
+        success = 0
+        failed_crns = resources_crn
+        for attempt in range(self.RETRIES + 1):
+            resources = [Resource(resource_crn) for resource_crn in failed_crns]
+            responses = self.__tag_service.attach_tag(resources=resources, tag_names=tag_names) \
+                .get_result()['results']
+            failed_crns = []
+            for resource in responses:
+                if resource['is_error']:
+                    failed_crns.append(resource.get('resource_id'))
+                else:
+                    success += 1
+            if not failed_crns:
+                break
+            logger.info(f'Retrying to attach the tags to {len(failed_crns)} resources, attempt: {attempt + 1}')
+        for resource_crn in failed_crns:
+            logger.error(f'Unable to attach resource tags to: {resource_crn}')
+        return success, failed_crns
 
     @logger_time_stamp
     def update_tags(self, resources_crn: list, tags: list):
@@ -23,23 +93,23 @@ class GlobalTaggingOperations(IBMAuthenticator):
         :param tags:
         :return:
         """
-        resources_list = [Resource(resource_crn) for resource_crn in resources_crn]
-        resources_batch_list = [resources_list[i:i + self.BATCH_SIZE]
-                                for i in range(0, len(resources_list), self.BATCH_SIZE)]
         success = 0
         errors = []
         tag_names = []
         for tag in tags:
             key, value = tag.split(":")
             tag_names.append(f'{key.strip()}:{value.strip()}')
-        logger.info(f"Tagging {len(resources_crn)} resources.")
-        for resource_batch in resources_batch_list:
-            responses = self.__tag_service.attach_tag(resources=resource_batch, tag_names=tag_names) \
-                .get_result()['results']
-            for resource in responses:
-                if resource['is_error']:
-                    errors.append(resource.get('resource_id'))
-                    logger.error(f'Unable to attach resource tags to: {resource["resource_id"]}')
-                else:
-                    success += 1
+        untagged_resources_crn = self.__get_untagged_resources_crn(resources_crn=resources_crn, tag_names=tag_names)
+        success += len(resources_crn) - len(untagged_resources_crn)
+        logger.info(f"Tagging {len(untagged_resources_crn)} resources, "
+                    f"skipped {success} resources already having the tags.")
+        resources_batch_list = [untagged_resources_crn[i:i + self.BATCH_SIZE]
+                                for i in range(0, len(untagged_resources_crn), self.BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = [executor.submit(self.__attach_tags, resources_batch, tag_names)
+                       for resources_batch in resources_batch_list]
+            for future in as_completed(futures):
+                batch_success, batch_errors = future.result()
+                success += batch_success
+                errors.extend(batch_errors)
         return success == len(resources_crn), errors
@@ -1,5 +1,7 @@
 import os.path
 import tempfile
+import threading
+import time
 
 import numpy as np
 import pandas as pd
@@ -14,32 +16,68 @@ class UploadToGsheet:
     This class collects the data from clouds and uploads to the GSheet
     """
 
+    ACCOUNTS_SHEET_NAME = 'Accounts'
+
+    # Shared across the instances, the accounts sheet is downloaded once per run
+    __accounts_tables = {}
+    __accounts_tables_lock = threading.Lock()
+
     def __init__(self):
         self.__environment_variables_dict = environment_variables.environment_variables_dict
         self.gsheet_operations = GoogleDriveOperations()
         self.__gsheet_id = self.__environment_variables_dict.get('SPREADSHEET_ID', '')
+        self.__accounts_cache_ttl = self.__environment_variables_dict.get('GSHEET_ACCOUNTS_CACHE_TTL', 0)
 
-    @logger_time_stamp
-    def get_cost_center_budget_details(self, account_id: str, dir_path: str = ''):
+    def __load_accounts_table(self, dir_path: str = ''):
         """
-        This method returns the cost center & budget details
-        @return:
+        This method downloads the accounts sheet and indexes the rows by AccountId
+        @param dir_path:
+        @return: {account_id: account_row}
         """
         with tempfile.TemporaryDirectory() as tmp_dir:
-            sheet_name = 'Accounts'
             dirtectory = dir_path if dir_path else tmp_dir
-            file_path = f'{tmp_dir}/{sheet_name}.csv' if not dir_path else f'{dir_path}/{sheet_name}.csv'
+            file_path = f'{dirtectory}/{self.ACCOUNTS_SHEET_NAME}.csv'
             if not os.path.exists(file_path):
-                self.gsheet_operations.download_spreadsheet(spreadsheet_id=self.__gsheet_id, sheet_name=sheet_name,
+                self.gsheet_operations.download_spreadsheet(spreadsheet_id=self.__gsheet_id, sheet_name=self.ACCOUNTS_SHEET_NAME,
                                                             file_path=dirtectory)
-            accounts_df = pd.read_csv(file_path)
-            account_row = accounts_df[
-                accounts_df['AccountId'] == account_id].reset_index().to_dict(
-                orient='records')
-            if account_row:
-                return account_row[0].get('CostCenter', 0), round(
-                    float(account_row[0].get('Budget', '0').replace(',', '')), 0), str(account_row[0].get('Year')), account_row[0].get('Owner')
-            return 0, 0, '', 'Others'
+            accounts_df = pd.read_csv(file_path, dtype={'AccountId': str})
+        accounts_table = {}
+        for account_row in accounts_df.to_dict(orient='records'):
+            accounts_table.setdefault(str(account_row.get('AccountId')).strip(), account_row)
+        return accounts_table
+
+    def get_accounts_table(self, dir_path: str = ''):
+        """
+        This method returns the accounts sheet indexed by AccountId, loaded once and reloaded after the ttl
+        @param dir_path: directory of an already downloaded accounts sheet
+        @return: {account_id: account_row}
+        """
+        with self.__accounts_tables_lock:
+            loaded_at, accounts_table = self.__accounts_tables.get(self.__gsheet_id, (0, None))
+            if accounts_table is None or (self.__accounts_cache_ttl and time.time() - loaded_at > self.__accounts_cache_ttl):
+                accounts_table = self.__load_accounts_table(dir_path=dir_path)
+                self.__accounts_tables[self.__gsheet_id] = (time.time(), accounts_table)
+            return accounts_table
+
+    @classmethod
+    def clear_accounts_table(cls):
+        """
+        This method drops the loaded accounts sheets
+        @return:
+        """
+        with cls.__accounts_tables_lock:
+            cls.__accounts_tables.clear()
+
+    def get_cost_center_budget_details(self, account_id: str, dir_path: str = ''):
+        """
+        This method returns the cost center & budget details
+        @return:
+        """
+        account_row = self.get_accounts_table(dir_path=dir_path).get(str(account_id).strip())
+        if account_row:
+            return account_row.get('CostCenter', 0), round(
+                float(str(account_row.get('Budget', '0')).replace(',', '')), 0), str(account_row.get('Year')), account_row.get('Owner')
+        return 0, 0, '', 'Others'
 
     def get_monthly_spa(self, month_name: str, dir_path: str = ''):
         """This method gets the monthly savings plan amortization"""
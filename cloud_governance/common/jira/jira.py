@@ -56,18 +56,29 @@ class Jira(object):
         if self.new_loop:
             self.loop.close()
 
-    async def get_request(self, endpoint):
+    def create_session(self, max_concurrency=None):
+        connector = aiohttp.TCPConnector(limit=max_concurrency or 100, ssl=False)
+        return aiohttp.ClientSession(headers=self.headers, connector=connector, loop=self.loop)
+
+    async def get_request(self, endpoint, session=None):
         logger.debug("GET: %s" % endpoint)
         try:
-            async with aiohttp.ClientSession(
-                headers=self.headers,
-                loop=self.loop,
-            ) as session:
+            if session:
                 async with session.get(
                     self.url + endpoint,
                     verify_ssl=False,
                 ) as response:
                     result = await response.json(content_type="application/json")
+            else:
+                async with aiohttp.ClientSession(
+                    headers=self.headers,
+                    loop=self.loop,
+                ) as session:
+                    async with session.get(
+                        self.url + endpoint,
+                        verify_ssl=False,
+                    ) as response:
+                        result = await response.json(content_type="application/json")
         except Exception as ex:
             logger.debug(ex)
             logger.error("There was something wrong with your request.")
@@ -201,15 +212,26 @@ class Jira(object):
             logger.error("No transitions found under %s" % issue_id)
             return []
 
-    async def get_ticket(self, ticket):
+    async def get_ticket(self, ticket, session=None):
         issue_id = "%s-%s" % (self.ticket_queue, ticket)
         endpoint = "/issue/%s" % issue_id
-        result = await self.get_request(endpoint)
+        result = await self.get_request(endpoint, session=session)
         if not result:
             logger.error("Failed to get ticket")
             return None
         return result
 
+    async def get_tickets(self, tickets, max_concurrency=10):
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with self.create_session(max_concurrency=max_concurrency) as session:
+            async def get_bounded_ticket(ticket):
+                async with semaphore:
+                    return await self.get_ticket(ticket, session=session)
+
+            results = await asyncio.gather(*[get_bounded_ticket(ticket) for ticket in tickets])
+        return dict(zip(tickets, results))
+
     async def get_watchers(self, ticket):
         issue_id = "%s-%s" % (self.ticket_queue, ticket)
         endpoint = "/issue/%s/watchers" % issue_id
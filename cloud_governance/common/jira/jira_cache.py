@@ -0,0 +1,142 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+
+from cloud_governance.common.logger.init_logger import logger
+
+
+class JiraCache:
+    """
+    This class stores the parsed jira ticket descriptions in an embedded sqlite database
+    Entries expire after ttl seconds and are dropped when the ticket status changes
+    """
+
+    DATABASE_NAME = 'jira_cache.db'
+    TABLE_NAME = 'ticket_descriptions'
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    # sqlite default SQLITE_MAX_VARIABLE_NUMBER is 999
+    MAX_QUERY_VARIABLES = 900
+
+    def __init__(self, cache_directory: str, ttl: int):
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__database_path = ''
+        if cache_directory:
+            os.makedirs(cache_directory, exist_ok=True)
+            self.__database_path = os.path.join(cache_directory, self.DATABASE_NAME)
+            self.__execute(f'CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} ('
+                           'ticket_id TEXT PRIMARY KEY, jira_status TEXT, description TEXT, updated_at REAL)')
+
+    def __execute(self, query: str, parameters=(), many: bool = False):
+        """
+        This method executes the query in its own connection, threads of the same run can share the cache
+        :param query:
+        :param parameters:
+        :param many:
+        :return:
+        """
+        with self.__lock, closing(sqlite3.connect(self.__database_path, timeout=30)) as connection:
+            with connection:
+                if many:
+                    cursor = connection.executemany(query, parameters)
+                else:
+                    cursor = connection.execute(query, parameters)
+                return cursor.fetchall()
+
+    @property
+    def enabled(self):
+        return bool(self.__database_path)
+
+    def get_many(self, ticket_ids: list):
+        """
+        This method returns the cached descriptions which are not expired
+        :param ticket_ids:
+        :return: {ticket_id: description}
+        """
+        descriptions = {}
+        if not self.enabled or not ticket_ids:
+            return descriptions
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        min_updated_at = time.time() - self.__ttl
+        for index in range(0, len(ticket_ids), self.MAX_QUERY_VARIABLES):
+            chunk = ticket_ids[index:index + self.MAX_QUERY_VARIABLES]
+            try:
+                rows = self.__execute(f'SELECT ticket_id, description FROM {self.TABLE_NAME} '
+                                      f'WHERE updated_at >= ? AND ticket_id IN ({",".join("?" * len(chunk))})',
+                                      (min_updated_at, *chunk))
+            except sqlite3.Error as err:
+                logger.warning(f'Unable to read the jira cache: {err}')
+                return descriptions
+            for ticket_id, description in rows:
+                description = json.loads(description)
+                if description.get('TicketOpenedDate'):
+                    description['TicketOpenedDate'] = datetime.strptime(description['TicketOpenedDate'],
+                                                                        self.DATE_FORMAT)
+                descriptions[ticket_id] = description
+        return descriptions
+
+    def get(self, ticket_id: str):
+        """
+        This method returns the cached description of the ticket_id
+        :param ticket_id:
+        :return:
+        """
+        return self.get_many(ticket_ids=[ticket_id]).get(ticket_id, {})
+
+    def put_many(self, descriptions: dict):
+        """
+        This method saves the descriptions
+        :param descriptions: {ticket_id: description}
+        :return:
+        """
+        if not self.enabled or not descriptions:
+            return
+        updated_at = time.time()
+        rows = [(ticket_id, description.get('JiraStatus', ''), json.dumps(description, default=str), updated_at)
+                for ticket_id, description in descriptions.items()]
+        try:
+            self.__execute(f'INSERT OR REPLACE INTO {self.TABLE_NAME} '
+                           '(ticket_id, jira_status, description, updated_at) VALUES (?, ?, ?, ?)', rows, many=True)
+        except sqlite3.Error as err:
+            logger.warning(f'Unable to write the jira cache: {err}')
+
+    def put(self, ticket_id: str, description: dict):
+        """
+        This method saves the description of the ticket_id
+        :param ticket_id:
+        :param description:
+        :return:
+        """
+        self.put_many(descriptions={ticket_id: description})
+
+    def invalidate(self, ticket_ids: list):
+        """
+        This method drops the cached descriptions of ticket_ids
+        :param ticket_ids:
+        :return:
+        """
+        if not self.enabled or not ticket_ids:
+            return
+        try:
+            self.__execute(f'DELETE FROM {self.TABLE_NAME} WHERE ticket_id = ?',
+                           [(ticket_id,) for ticket_id in ticket_ids], many=True)
+        except sqlite3.Error as err:
+            logger.warning(f'Unable to invalidate the jira cache: {err}')
+
+    def invalidate_changed_status(self, ticket_statuses: dict):
+        """
+        This method drops the cached descriptions whose status differs from the current jira status
+        :param ticket_statuses: {ticket_id: jira_status}
+        :return:
+        """
+        if not self.enabled or not ticket_statuses:
+            return
+        try:
+            self.__execute(f'DELETE FROM {self.TABLE_NAME} WHERE ticket_id = ? AND jira_status != ?',
+                           list(ticket_statuses.items()), many=True)
+        except sqlite3.Error as err:
+            logger.warning(f'Unable to invalidate the jira cache: {err}')
@@ -1,11 +1,10 @@
 import asyncio
-import json
-import os.path
 from datetime import datetime
 
 import typeguard
 
 from cloud_governance.cloud_resource_orchestration.utils.common_operations import string_equal_ignore_case
+from cloud_governance.common.jira.jira_cache import JiraCache
 from cloud_governance.common.jira.jira_exceptions import JiraExceptions
 from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
@@ -24,7 +23,7 @@ class JiraOperations:
     JIRA_TRANSITION_IDS = {
         'NEW': 51, 'REFINEMENT': 61, 'INPROGRESS': 31, 'CLOSED': 41, 'ANY': 0
     }
-    FILE_EXTENSION = '.json'
+    MAX_CONCURRENT_REQUESTS = 10
 
     def __init__(self):
         self.__environment_variables_dict = environment_variables.environment_variables_dict
@@ -32,7 +31,10 @@ class JiraOperations:
         self.__jira_username = self.__environment_variables_dict.get('JIRA_USERNAME').strip()
         self.__jira_token = self.__environment_variables_dict.get('JIRA_TOKEN').strip()
         self.__jira_queue = self.__environment_variables_dict.get('JIRA_QUEUE').strip()
-        self.__cache_temp_dir = self.__environment_variables_dict.get('TEMPORARY_DIRECTORY', '').strip()
+        self.__cache_dir = self.__environment_variables_dict.get('JIRA_CACHE_DIRECTORY', '').strip() or \
+                           self.__environment_variables_dict.get('TEMPORARY_DIRECTORY', '').strip()
+        self.__jira_cache = JiraCache(cache_directory=self.__cache_dir,
+                                      ttl=self.__environment_variables_dict.get('JIRA_CACHE_TTL', 0))
         self.__loop = asyncio.new_event_loop()
         self.__jira_object = Jira(url=self.__jira_url, username=self.__jira_username, token=self.__jira_token, ticket_queue=self.__jira_queue, loop=self.__loop)
 
@@ -48,6 +50,7 @@ class JiraOperations:
         if '-' in ticket_id:
             ticket_id = ticket_id.split('-')[-1]
         state_id = self.JIRA_TRANSITION_IDS.get(state.upper())
+        self.__jira_cache.invalidate(ticket_ids=[ticket_id])
         return self.__loop.run_until_complete(self.__jira_object.post_transition(ticket=ticket_id, transition=state_id))
 
     @typeguard.typechecked
@@ -60,6 +63,20 @@ class JiraOperations:
         """
         return self.__loop.run_until_complete(self.__jira_object.get_ticket(ticket=ticket_id))
 
+    @typeguard.typechecked
+    @logger_time_stamp
+    def get_issues(self, ticket_ids: list):
+        """
+        This method returns the issues data of all ticket_ids, fetched concurrently
+        :param ticket_ids:
+        :return: {ticket_id: issue_data}
+        """
+        ticket_ids = list(dict.fromkeys(ticket_id.split('-')[-1] for ticket_id in ticket_ids))
+        if not ticket_ids:
+            return {}
+        return self.__loop.run_until_complete(
+            self.__jira_object.get_tickets(tickets=ticket_ids, max_concurrency=self.MAX_CONCURRENT_REQUESTS))
+
     @typeguard.typechecked
     @logger_time_stamp
     def return_cache_ticket_description(self, ticket_id: str):
@@ -68,10 +85,7 @@ class JiraOperations:
         :param ticket_id:
         :return:
         """
-        with open(f'{self.__cache_temp_dir}/{ticket_id}{self.FILE_EXTENSION}') as cache_ticket_description:
-            result_data = json.load(cache_ticket_description)
-            result_data['TicketOpenedDate'] = datetime.strptime(result_data.get('TicketOpenedDate'), "%Y-%m-%d %H:%M:%S")
-            return result_data
+        return self.__jira_cache.get(ticket_id=ticket_id)
 
     @typeguard.typechecked
     @logger_time_stamp
@@ -82,9 +96,37 @@ class JiraOperations:
         :param ticket_id:
         :return:
         """
-        if self.__cache_temp_dir:
-            with open(f'{self.__cache_temp_dir}/{ticket_id}{self.FILE_EXTENSION}', 'w') as cache_ticket_description:
-                json.dump(ticket_description, cache_ticket_description, default=str)
+        self.__jira_cache.put(ticket_id=ticket_id, description=ticket_description)
+
+    def __parse_issue_description(self, issue_data: dict, state: str = '', sub_task: bool = False):
+        """
+        This method parse the issue data into the description dict, returns empty dict if state doesn't match
+        :param issue_data:
+        :param state:
+        :param sub_task:
+        :return:
+        """
+        if issue_data:
+            if issue_data['fields']['status']['name'] == self.REFINEMENT or self.JIRA_TRANSITION_IDS.get(state, -1) == 0 or (state == 'INPROGRESS' and issue_data['fields']['status']['name'] == self.IN_PROGRESS) or sub_task:
+                description_list = issue_data['fields']['description'].split('\n')
+                description_dict = {}
+                for description in description_list:
+                    if description:
+                        values = description.strip().split(':', 1)
+                        if len(values) == 2:
+                            key, value = values
+                            description_dict[key.strip().replace(' ', '')] = value.strip()
+                if 'Project' in description_dict:
+                    if description_dict['Project'] == "Other":
+                        description_dict['Project'] = description_dict.get('Explanationof"Other"primaryproduct')
+                        if not description_dict['Project']:
+                            description_dict['Project'] = description_dict.get('Otherproductsbeingtested')
+                        if not description_dict['Project']:
+                            description_dict['Project'] = description_dict.get('Explanationof"Other"secondaryproduct')
+                description_dict['TicketOpenedDate'] = datetime.strptime(issue_data.get('fields').get('created').split('.')[0], "%Y-%m-%dT%H:%M:%S")
+                description_dict['JiraStatus'] = issue_data['fields']['status']['name']
+                return description_dict
+        return {}
 
     @typeguard.typechecked
     @logger_time_stamp
@@ -98,32 +140,51 @@ class JiraOperations:
         """
         if '-' in ticket_id:
             ticket_id = ticket_id.split('-')[-1]
-        if os.path.exists(f'{self.__cache_temp_dir}/{ticket_id}{self.FILE_EXTENSION}'):
-            return self.return_cache_ticket_description(ticket_id=ticket_id)
+        cached_description = self.return_cache_ticket_description(ticket_id=ticket_id)
+        if cached_description:
+            return cached_description
         else:
             issue_data = self.get_issue(ticket_id=ticket_id)
-            if issue_data:
-                if issue_data['fields']['status']['name'] == self.REFINEMENT or self.JIRA_TRANSITION_IDS.get(state, -1) == 0 or (state == 'INPROGRESS' and issue_data['fields']['status']['name'] == self.IN_PROGRESS) or sub_task:
-                    description_list = issue_data['fields']['description'].split('\n')
-                    description_dict = {}
-                    for description in description_list:
-                        if description:
-                            values = description.strip().split(':', 1)
-                            if len(values) == 2:
-                                key, value = values
-                                description_dict[key.strip().replace(' ', '')] = value.strip()
-                    if 'Project' in description_dict:
-                        if description_dict['Project'] == "Other":
-                            description_dict['Project'] = description_dict.get('Explanationof"Other"primaryproduct')
-                            if not description_dict['Project']:
-                                description_dict['Project'] = description_dict.get('Otherproductsbeingtested')
-                            if not description_dict['Project']:
-                                description_dict['Project'] = description_dict.get('Explanationof"Other"secondaryproduct')
-                    description_dict['TicketOpenedDate'] = datetime.strptime(issue_data.get('fields').get('created').split('.')[0], "%Y-%m-%dT%H:%M:%S")
-                    description_dict['JiraStatus'] = issue_data['fields']['status']['name']
-                    self.cache_ticket_description(ticket_id=ticket_id, ticket_description=description_dict)
-                    return description_dict
-        return {}
+            description = self.__parse_issue_description(issue_data=issue_data, state=state, sub_task=sub_task)
+            if description:
+                self.cache_ticket_description(ticket_id=ticket_id, ticket_description=description)
+            return description
+
+    @typeguard.typechecked
+    @logger_time_stamp
+    def get_issues_descriptions(self, ticket_ids: list, state: str = '', sub_task: bool = False):
+        """
+        This method return the descriptions of all ticket_ids, uncached tickets are fetched concurrently
+        :param ticket_ids:
+        :param state:
+        :param sub_task:
+        :return: {ticket_id: description}
+        """
+        ticket_ids = [ticket_id.split('-')[-1] for ticket_id in ticket_ids]
+        descriptions = self.__jira_cache.get_many(ticket_ids=ticket_ids)
+        missing_ticket_ids = [ticket_id for ticket_id in ticket_ids if ticket_id not in descriptions]
+        fetched_descriptions = {}
+        for ticket_id, issue_data in self.get_issues(ticket_ids=missing_ticket_ids).items():
+            fetched_descriptions[ticket_id] = self.__parse_issue_description(issue_data=issue_data, state=state,
+                                                                             sub_task=sub_task)
+        self.__jira_cache.put_many(descriptions={ticket_id: description
+                                                 for ticket_id, description in fetched_descriptions.items()
+                                                 if description})
+        descriptions.update(fetched_descriptions)
+        return descriptions
+
+    def __invalidate_changed_statuses(self, issues: list):
+        """
+        This method drops the cached descriptions of issues whose jira status has changed
+        :param issues: issues or sub-tasks data returned by jira
+        :return:
+        """
+        ticket_statuses = {}
+        for issue in issues:
+            status = issue.get('fields', {}).get('status', {}).get('name')
+            if issue.get('key') and status:
+                ticket_statuses[issue.get('key').split('-')[-1]] = status
+        self.__jira_cache.invalidate_changed_status(ticket_statuses=ticket_statuses)
 
     @logger_time_stamp
     def get_all_issues_in_progress(self):
@@ -132,6 +193,7 @@ class JiraOperations:
         :return:
         """
         issues = self.__loop.run_until_complete(self.__jira_object.search_tickets(query={'Status': "'IN PROGRESS'"})).get('issues')
+        self.__invalidate_changed_statuses(issues=issues)
         ticket_ids = {}
         for issue in issues:
             if '[Clouds]' in issue['fields']['summary']:
@@ -172,6 +234,7 @@ class JiraOperations:
             sub_tasks_ids = []
             sub_tasks = jira_data.get('fields', {}).get('subtasks', {})
             if sub_tasks:
+                self.__invalidate_changed_statuses(issues=sub_tasks)
                 for sub_task in sub_tasks:
                     fields = sub_task.get('fields')
                     if fields.get('status').get('name') != 'Closed' or closed:
@@ -189,8 +252,7 @@ class JiraOperations:
         """
         sub_tasks = self.get_ticket_id_sub_tasks(ticket_id=ticket_id, closed=True)
         cost_estimation = 0
-        for sub_task in sub_tasks:
-            description = self.get_issue_description(ticket_id=sub_task, sub_task=True)
+        for description in self.get_issues_descriptions(ticket_ids=sub_tasks, sub_task=True).values():
             cost_estimation += float(description.get('CostEstimation', 0))
         return cost_estimation
 
@@ -203,8 +265,7 @@ class JiraOperations:
         """
         sub_tasks = self.get_ticket_id_sub_tasks(ticket_id=ticket_id, closed=True)
         total_duration = 0
-        for sub_task in sub_tasks:
-            description = self.get_issue_description(ticket_id=sub_task, sub_task=True)
+        for description in self.get_issues_descriptions(ticket_ids=sub_tasks, sub_task=True).values():
             total_duration += int(description.get('Days', 0))
         return total_duration
 
@@ -218,6 +279,7 @@ class JiraOperations:
         """
         issues = self.__loop.run_until_complete(
             self.__jira_object.search_tickets(query={'Status': f"'{ticket_status}'"})).get('issues')
+        self.__invalidate_changed_statuses(issues=issues)
         ticket_ids = {}
         for issue in issues:
             if '[Clouds]' in issue['fields']['summary']:
@@ -247,6 +309,7 @@ class JiraOperations:
         """
         sub_tasks_ids = []
         if sub_tasks_data:
+            self.__invalidate_changed_statuses(issues=sub_tasks_data)
             for sub_task in sub_tasks_data:
                 summary = sub_task.get('fields', {}).get('summary')
                 if summary and check_summary in summary:
@@ -279,6 +342,53 @@ class JiraOperations:
                     logger.warn(f'No sub-tasks found for the TicketId: {ticket_id}')
             return sub_tasks_ids
 
+    def get_all_subtasks_ticket_ids_by_tickets(self, ticket_ids: list, ticket_state: str, check_summary: str = '',
+                                               issues: dict = None):
+        """
+        This method returns the sub-tasks ids of many tickets based on check_summary, parents are fetched concurrently
+        :param ticket_ids:
+        :param ticket_state:
+        :param check_summary:
+        :param issues: the issues of get_issues, fetched when not passed
+        :return: {ticket_id: sub_tasks_ids}
+        """
+        sub_tasks_by_ticket = {}
+        if self.__check_ticket_state(ticket_state=ticket_state):
+            if issues is None:
+                issues = self.get_issues(ticket_ids=ticket_ids)
+            for ticket_id, jira_data in issues.items():
+                sub_tasks_ids = []
+                if jira_data:
+                    sub_tasks = jira_data.get('fields', {}).get('subtasks', {})
+                    if sub_tasks:
+                        sub_tasks_ids = self.__get_ids_from_sub_task_data(sub_tasks_data=sub_tasks,
+                                                                          ticket_state=ticket_state,
+                                                                          check_summary=check_summary)
+                    else:
+                        logger.warn(f'No sub-tasks found for the TicketId: {ticket_id}')
+                sub_tasks_by_ticket[ticket_id] = sub_tasks_ids
+        return sub_tasks_by_ticket
+
+    def get_budget_extend_tickets_by_tickets(self, ticket_ids: list, ticket_state: str, issues: dict = None):
+        """
+        This method returns the budget extension tickets of many ticket_ids
+        :param issues: the issues of get_issues, fetched when not passed
+        :return: {ticket_id: sub_tasks_ids}
+        """
+        check_summary = 'Budget Extension'
+        return self.get_all_subtasks_ticket_ids_by_tickets(ticket_ids=ticket_ids, ticket_state=ticket_state,
+                                                           check_summary=check_summary, issues=issues)
+
+    def get_duration_extend_tickets_by_tickets(self, ticket_ids: list, ticket_state: str, issues: dict = None):
+        """
+        This method returns the duration extension tickets of many ticket_ids
+        :param issues: the issues of get_issues, fetched when not passed
+        :return: {ticket_id: sub_tasks_ids}
+        """
+        check_summary = 'Duration Extension'
+        return self.get_all_subtasks_ticket_ids_by_tickets(ticket_ids=ticket_ids, ticket_state=ticket_state,
+                                                           check_summary=check_summary, issues=issues)
+
     def get_budget_extend_tickets(self, ticket_id: str, ticket_state: str):
         """
         This method returns the budget extension tickets of ticket_id
@@ -304,8 +414,7 @@ class JiraOperations:
         :return:
         """
         total_budget_to_extend = 0
-        for sub_ticket_id in sub_ticket_ids:
-            description = self.get_issue_description(ticket_id=sub_ticket_id, sub_task=True)
+        for description in self.get_issues_descriptions(ticket_ids=sub_ticket_ids, sub_task=True).values():
             extended_budget = int(description.get('Budget', 0))
             if extended_budget == 0:
                 extended_budget = int(description.get('CostEstimation', 0))
@@ -319,7 +428,6 @@ class JiraOperations:
         :return:
         """
         total_duration = 0
-        for sub_ticket_id in sub_ticket_ids:
-            description = self.get_issue_description(ticket_id=sub_ticket_id, sub_task=True)
+        for description in self.get_issues_descriptions(ticket_ids=sub_ticket_ids, sub_task=True).values():
             total_duration += int(description.get('Days', 0))
         return total_duration
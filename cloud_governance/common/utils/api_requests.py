@@ -1,19 +1,42 @@
 import asyncio
+import threading
 
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 
 from cloud_governance.common.logger.init_logger import logger
 
 
 class APIRequests:
 
+    POOL_MAXSIZE = 20
+
+    __session = None
+    __session_lock = threading.Lock()
+
     def __init__(self):
         self.__loop = asyncio.new_event_loop()
 
+    @classmethod
+    def get_session(cls):
+        """
+        This method returns the shared requests session, its connections are kept alive and reused across the calls
+        :return:
+        """
+        if cls.__session is None:
+            with cls.__session_lock:
+                if cls.__session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=cls.POOL_MAXSIZE, pool_maxsize=cls.POOL_MAXSIZE)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    cls.__session = session
+        return cls.__session
+
     def get(self, url: str, **kwargs):
         try:
-            response = requests.get(url, **kwargs)
+            response = self.get_session().get(url, **kwargs)
             if response.ok:
                 return response.json()
             else:
@@ -23,7 +46,7 @@ class APIRequests:
 
     def post(self, url: str,  **kwargs):
         try:
-            response = requests.post(url, **kwargs)
+            response = self.get_session().post(url, **kwargs)
             return response
         except Exception as err:
             raise err
@@ -0,0 +1,72 @@
+import json
+import re
+
+
+class JsonStreamDecoder(json.JSONDecoder):
+    """
+    This class decodes a json text stream incrementally, the items of a top level array are decoded one by one
+    so only one item and one chunk of the text are kept in memory
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+    DELIMITERS = ' \t\n\r,]'
+
+    def __init__(self, chunk_size: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.__chunk_size = chunk_size if chunk_size else self.CHUNK_SIZE
+
+    def decode_stream(self, file_object):
+        """
+        This method decodes the json text stream, a top level array is returned as a generator of its items
+        :param file_object: text file object
+        :return: generator of the array items, the decoded value or None if the stream is empty
+        """
+        buffer = file_object.read(self.__chunk_size)
+        position = self.WHITESPACE.match(buffer).end()
+        if not buffer[position:position + 1] == '[':
+            text = buffer + file_object.read()
+            return self.decode(text) if text.strip() else None
+        return self.__iter_array(file_object=file_object, buffer=buffer, position=position + 1)
+
+    def __iter_array(self, file_object, buffer: str, position: int):
+        """
+        This method yields the array items, an item is decoded once the text after it is read
+        :param file_object:
+        :param buffer: the text which is read
+        :param position: the position after the array opening bracket
+        :return:
+        """
+        eof = False
+        expect_item = True
+        item_count = 0
+        while True:
+            position = self.WHITESPACE.match(buffer, position).end()
+            item = end = None
+            if position < len(buffer):
+                if buffer[position] == ']' and (not expect_item or not item_count):
+                    return
+                if not expect_item:
+                    if buffer[position] != ',':
+                        raise json.JSONDecodeError('Expecting \',\' delimiter', buffer, position)
+                    position += 1
+                    expect_item = True
+                    continue
+                try:
+                    item, end = self.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+            # the item is decoded again with more text when it is incomplete or may continue, i.e. a number
+            if end is None or (not eof and (end == len(buffer) or buffer[end] not in self.DELIMITERS)):
+                if eof:
+                    raise json.JSONDecodeError('Unterminated array', buffer, position)
+                chunk = file_object.read(max(self.__chunk_size, len(buffer) - position))
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            position = end
+            expect_item = False
+            item_count += 1
+            yield item
@@ -1,16 +1,61 @@
 import argparse
 import json
 import os
+import threading
 
 from ast import literal_eval
 
-import boto3
 import yaml
 
 from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.main.environment_variables_exceptions import ParseFailed
 
 
+class EnvironmentVariablesDict(dict):
+    """
+    This class is the environment variables dict, which resolves the lazy variables on the first access
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__loaders = {}
+        self.__lock = threading.Lock()
+
+    def set_lazy(self, key: str, loader):
+        """
+        This method sets the variable which is loaded only when it is first used
+        :param key:
+        :param loader: callable which returns the value
+        :return:
+        """
+        self.pop(key, None)
+        self.__loaders[key] = loader
+
+    def __resolve(self, key):
+        with self.__lock:
+            loader = self.__loaders.pop(key, None)
+            if loader:
+                super().__setitem__(key, loader())
+        return super().__getitem__(key)
+
+    def __missing__(self, key):
+        if key in self.__loaders:
+            return self.__resolve(key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self.__loaders
+
+    def __setitem__(self, key, value):
+        self.__loaders.pop(key, None)
+        super().__setitem__(key, value)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+
 class EnvironmentVariables:
     """
     This class manages the environment variable parameters
@@ -59,7 +104,7 @@ class EnvironmentVariables:
 
     def __init__(self):
         super().__init__()
-        self._environment_variables_dict = {}
+        self._environment_variables_dict = EnvironmentVariablesDict()
 
         self.load_from_env()
         self.load_from_yaml()
@@ -90,8 +135,18 @@ class EnvironmentVariables:
         if self._environment_variables_dict['AWS_ACCESS_KEY_ID'] and \
                 self._environment_variables_dict['AWS_SECRET_ACCESS_KEY']:
             self._environment_variables_dict['PUBLIC_CLOUD_NAME'] = 'AWS'
-            self._environment_variables_dict['account'] = self.get_aws_account_alias_name().upper().replace(
-                'OPENSHIFT-', '')
+            # IAM is called only when the account is used
+            self._environment_variables_dict.set_lazy(
+                'account', lambda: self.get_aws_account_alias_name().upper().replace('OPENSHIFT-', ''))
+        # boto3 clients config, the clients are shared across the run
+        self._environment_variables_dict['AWS_MAX_POOL_CONNECTIONS'] = int(EnvironmentVariables.get_env('AWS_MAX_POOL_CONNECTIONS', '50'))
+        self._environment_variables_dict['AWS_RETRY_MODE'] = EnvironmentVariables.get_env('AWS_RETRY_MODE', 'adaptive')
+        self._environment_variables_dict['AWS_MAX_ATTEMPTS'] = int(EnvironmentVariables.get_env('AWS_MAX_ATTEMPTS', '5'))
+        self._environment_variables_dict['AWS_CONNECT_TIMEOUT'] = int(EnvironmentVariables.get_env('AWS_CONNECT_TIMEOUT', '60'))
+        self._environment_variables_dict['AWS_READ_TIMEOUT'] = int(EnvironmentVariables.get_env('AWS_READ_TIMEOUT', '60'))
+        # max requests per second per service id, i.e. {'cloudtrail': 2}, throttles and latency are logged at the end
+        self._environment_variables_dict['AWS_API_RATE_LIMITS'] = literal_eval(
+            EnvironmentVariables.get_env('AWS_API_RATE_LIMITS', "{'cloudtrail': 2}"))
         self._environment_variables_dict['policy'] = EnvironmentVariables.get_env('policy', '')
         # cost_usage_reports - athena queries on pair account, spot and graviton usage
         self._environment_variables_dict['non_cluster_policies'] = ['instance_run', 'unattached_volume', 'cluster_run',
@@ -228,12 +283,20 @@ class EnvironmentVariables:
         self._environment_variables_dict['GOOGLE_APPLICATION_CREDENTIALS'] = EnvironmentVariables.get_env(
             'GOOGLE_APPLICATION_CREDENTIALS', '')
         self._environment_variables_dict['SPREADSHEET_ID'] = EnvironmentVariables.get_env('SPREADSHEET_ID', '')
+        # 0 keeps the accounts sheet for the whole run
+        self._environment_variables_dict['GSHEET_ACCOUNTS_CACHE_TTL'] = int(EnvironmentVariables.get_env('GSHEET_ACCOUNTS_CACHE_TTL', '0'))
+        # 0 keeps the user tags sheet for the whole run, it is reloaded when the sheet file changes
+        self._environment_variables_dict['GSHEET_USER_TAGS_CACHE_TTL'] = int(EnvironmentVariables.get_env('GSHEET_USER_TAGS_CACHE_TTL', '0'))
 
         # AWS Top Acconut
         self._environment_variables_dict['AWS_ACCOUNT_ROLE'] = EnvironmentVariables.get_env('AWS_ACCOUNT_ROLE', '')
         self._environment_variables_dict['PAYER_SUPPORT_FEE_CREDIT'] = EnvironmentVariables.get_env(
             'PAYER_SUPPORT_FEE_CREDIT', 0)
         self._environment_variables_dict['TEMPORARY_DIR'] = EnvironmentVariables.get_env('TEMPORARY_DIR', '/tmp')
+        self._environment_variables_dict['CE_CACHE_DIRECTORY'] = EnvironmentVariables.get_env('CE_CACHE_DIRECTORY', '')
+        self._environment_variables_dict['CE_CACHE_TTL'] = int(EnvironmentVariables.get_env('CE_CACHE_TTL', '3600'))
+        self._environment_variables_dict['CE_CACHE_CLOSED_MONTH_TTL'] = int(
+            EnvironmentVariables.get_env('CE_CACHE_CLOSED_MONTH_TTL', '2592000'))
         self._environment_variables_dict['COST_CENTER_OWNER'] = EnvironmentVariables.get_env('COST_CENTER_OWNER', '{}')
 
         # Jira env parameters
@@ -242,6 +305,8 @@ class EnvironmentVariables:
         self._environment_variables_dict['JIRA_TOKEN'] = EnvironmentVariables.get_env('JIRA_TOKEN', '')
         self._environment_variables_dict['JIRA_QUEUE'] = EnvironmentVariables.get_env('JIRA_QUEUE', '')
         self._environment_variables_dict['JIRA_PASSWORD'] = EnvironmentVariables.get_env('JIRA_PASSWORD', '')
+        self._environment_variables_dict['JIRA_CACHE_DIRECTORY'] = EnvironmentVariables.get_env('JIRA_CACHE_DIRECTORY', '')
+        self._environment_variables_dict['JIRA_CACHE_TTL'] = int(EnvironmentVariables.get_env('JIRA_CACHE_TTL', '21600'))
 
         # Cloud Resource Orchestration
         self._environment_variables_dict['CRO_PORTAL'] = EnvironmentVariables.get_env('CRO_PORTAL', '')
@@ -341,6 +406,11 @@ class EnvironmentVariables:
                                                                                                 'unblended_cost')
         self._environment_variables_dict['CLOUDABILITY_DIMENSIONS'] = EnvironmentVariables.get_env(
             'CLOUDABILITY_DIMENSIONS', 'date,category4,vendor_account_name,vendor_account_identifier,vendor')
+        # the appito token is reused until it is older than the ttl seconds
+        self._environment_variables_dict['APPITO_TOKEN_TTL'] = int(EnvironmentVariables.get_env('APPITO_TOKEN_TTL', '1800'))
+        # the reports of the past months are cached in the dir, empty disables the cache
+        self._environment_variables_dict['CLOUDABILITY_CACHE_DIR'] = EnvironmentVariables.get_env(
+            'CLOUDABILITY_CACHE_DIR', '/tmp/cloudability')
 
         self._environment_variables_dict['PERF_SERVICES_URL'] = EnvironmentVariables.get_env('PERF_SERVICES_URL', '')
 
@@ -370,6 +440,7 @@ class EnvironmentVariables:
         This method return the aws account alias name
         :return:
         """
+        import boto3
         iam_client = boto3.client('iam')
         try:
             account_alias = iam_client.list_account_aliases()['AccountAliases']
@@ -1,11 +1,11 @@
-import json
+from collections.abc import Iterator
 from datetime import datetime
-import pandas as pd
 
 from cloud_governance.common.elasticsearch.elasticsearch_operations import ElasticSearchOperations
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
 from cloud_governance.common.clouds.aws.s3.s3_operations import S3Operations
 from cloud_governance.common.clouds.aws.price.price import AWSPrice
+from cloud_governance.common.utils.json_stream_decoder import JsonStreamDecoder
 
 
 class ESUploader:
@@ -32,69 +32,141 @@ class ESUploader:
                                                logs_bucket_key=self.__logs_bucket_key)
             self.__aws_price = AWSPrice()
 
-    def __get_cluster_cost(self, data, resource, clusters_launch_time, clusters_user):
+    @staticmethod
+    def __to_cost(cost):
         """
-        This method aggregate cluster cost data
+        This method returns the cost as float rounded to 3 digits, the unknown price i.e. NA is 0
+        @param cost:
+        @return:
+        """
+        try:
+            return round(float(cost), 3)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def __get_cluster_cost(self, data: dict, resource: str, cluster_costs: dict, clusters_launch_time: dict,
+                           clusters_user: dict):
+        """
+        This method adds the aggregated cluster cost data
         @param data:
         @param resource:
+        @param cluster_costs: {cluster owned: cost}, the non cluster resources cost is under ''
+        @param clusters_launch_time:
         @param clusters_user:
         @return:
         """
-        # aggregate ec2/ebs cluster cost data
-        resource_data = [item.split('|') for item in data['resources_list']]
-        df = pd.DataFrame(resource_data)
-        # MUST : every fix, change ec2/ebs title
-        # cost column: remove space
-        df[df.columns[2]] = df[df.columns[2]].str.strip()
-        # cost column: change to float
-        df[df.columns[2]] = df[df.columns[2]].astype(float).round(3)
-        # group by cluster owned column
-        cluster_cost = df.groupby(df.columns[-1])[df.columns[2]].sum()
         cluster_cost_results = []
         # cluster
         # title: cluster# | cost($) | user | launch time | cluster owned
+        if cluster_costs.get('', 0) > 0:
+            cost = round(cluster_costs[''], 3)
+            cluster_cost_results.append(f'non cluster | {cost} ')
+            data['non cluster'] = {'name': f'{resource} (non cluster)', 'cost': cost}
         num = 1
-        for name, cost in cluster_cost.items():
-            if cost > 0:
-                if name == '  ':
-                    cluster_cost_results.append(f'non cluster | {round(cost, 3)} ')
-                    data['non cluster'] = {'name': f'{resource} (non cluster)', 'cost': round(cost, 3)}
-                else:
-                    cluster_cost_results.append(
-                        f" cluster_{num} | {round(cost, 3)} | {clusters_user.get(name.strip())} | {clusters_launch_time.get(name.strip())} | {name.strip()} ")
-                    data[f'cluster_{num}'] = {'name': name.strip(), 'cost': round(cost, 3),
-                                              'user': clusters_user.get(name.strip()),
-                                              'launch_time': clusters_launch_time.get(name.strip())}
-                    num += 1
+        for name, cost in sorted(cluster_costs.items()):
+            if name and cost > 0:
+                cost = round(cost, 3)
+                cluster_cost_results.append(
+                    f" cluster_{num} | {cost} | {clusters_user.get(name)} | {clusters_launch_time.get(name)} | {name} ")
+                data[f'cluster_{num}'] = {'name': name, 'cost': cost, 'user': clusters_user.get(name),
+                                          'launch_time': clusters_launch_time.get(name)}
+                num += 1
         return cluster_cost_results
 
-    def __get_user_cost(self, data):
+    def __get_user_cost(self, data: dict, user_costs: dict):
         """
-        This method aggregate user cost data
+        This method adds the aggregated user cost data
         @param data:
+        @param user_costs: {user: cost}
         @return:
         """
-        # aggregate ec2/ebs cluster cost data
-        resource_data = [item.split('|') for item in data['resources_list']]
-        df = pd.DataFrame(resource_data)
-        # MUST : every fix, change ec2/ebs title
-        # cost column: remove space
-        df[df.columns[2]] = df[df.columns[2]].str.strip()
-        # cost column: change to float
-        df[df.columns[2]] = df[df.columns[2]].astype(float).round(3)
-        # group by user
-        user_cost = df.groupby(df.columns[1])[df.columns[2]].sum()
         user_cost_results = []
         # user
         # title: user# | cost($) | user
         num = 1
-        for user, cost in user_cost.items():
-            if cost > 0 and user != '  ' and user:
-                user_cost_results.append(f"user_{num} | {round(cost, 3)}  | {user.strip()} ")
-                data[f'user_{num}'] = {'name': user.strip(), 'cost': round(cost, 3)}
+        for user, cost in sorted(user_costs.items()):
+            if cost > 0 and user:
+                cost = round(cost, 3)
+                user_cost_results.append(f"user_{num} | {cost}  | {user} ")
+                data[f'user_{num}'] = {'name': user, 'cost': cost}
                 num += 1
         return user_cost_results
 
+    def __aggregate_policy_resources(self, items):
+        """
+        This method aggregates the policy resources in a single pass, only the resources_list lines are kept
+        @param items: iterator of the policy resources
+        @return:
+        """
+        resource = ''
+        # cluster owned launch time
+        clusters_launch_time_dict = {}
+        # cluster owned user name
+        cluster_user = {}
+        # cost per cluster owned and per user
+        cluster_costs = {}
+        user_costs = {}
+        # resources_list is a list of items that was triggered by policy
+        data_dict = {'resources_list': []}
+        for i, item in enumerate(items):
+            ec2_ebs_name = ''
+            gitleaks_leakurl = ''
+            user = ''
+            # cluster resource tag
+            cluster_owned = ''
+            data_dict['resources'] = i + 1
+            # ec2/ebs
+            if item.get('Tags'):
+                for val in item['Tags']:
+                    if val['Key'] == 'Name':
+                        ec2_ebs_name = val['Value']
+                    if val['Value'] == 'owned':
+                        cluster_owned = val['Key']
+                    if val['Key'].lower() == 'user':
+                        user = val['Value'].lower()
+            if cluster_owned:
+                cluster_user[cluster_owned] = user
+            cost = None
+            # ec2 - MUST: every fix, change also cluster title
+            # title:  instance id | user | cost($) | state | instance type | launch time | name | cluster owned
+            if item.get('InstanceId'):
+                resource = 'ec2'
+                cost = self.__aws_price.get_ec2_price(resource=resource, item_data=item)
+                launch_time_format = item['LaunchTime'][:-15].replace('T', ' ')
+                if cluster_owned:
+                    clusters_launch_time_dict[cluster_owned] = launch_time_format
+                data_dict['resources_list'].append(
+                    f"{item['InstanceId']} | {user} | {cost} | {item['State']['Name']} | {item['InstanceType']}  | {launch_time_format} | {ec2_ebs_name} | {cluster_owned} ")
+
+            # ebs - MUST: every fix, change also cluster title
+            # title: volume id | user | cost($/month) | state | volume type | create time | size(gb) | name |  cluster owned
+            if item.get('VolumeId'):
+                resource = 'ebs'
+                cost = self.__aws_price.get_ec2_price(resource=resource, item_data=item)
+                create_time_format = item['CreateTime'][:-22].replace('T', ' ')
+                if cluster_owned:
+                    clusters_launch_time_dict[cluster_owned] = create_time_format
+                data_dict['resources_list'].append(
+                    f"{item['VolumeId']} | {user} | {cost} | {item['State']} | {item['VolumeType']} | {create_time_format} | {item['Size']} | {ec2_ebs_name} |  {cluster_owned} ")
+            if cost is not None:
+                cost = self.__to_cost(cost)
+                cluster_costs[cluster_owned] = cluster_costs.get(cluster_owned, 0) + cost
+                user_costs[user] = user_costs.get(user, 0) + cost
+            # gitleaks
+            if item.get('leakURL'):
+                gitleaks_leakurl = item.get('leakURL')
+            if item.get('email'):
+                data_dict['resources_list'].append(f"{item.get('email')} | {gitleaks_leakurl}")
+
+        # get cluster cost data only for ec2 and ebs
+        if resource:
+            data_dict['cluster_cost_data'] = self.__get_cluster_cost(data=data_dict, resource=resource,
+                                                                     cluster_costs=cluster_costs,
+                                                                     clusters_launch_time=clusters_launch_time_dict,
+                                                                     clusters_user=cluster_user)
+            data_dict['user_cost_data'] = self.__get_user_cost(data=data_dict, user_costs=user_costs)
+        return data_dict
+
     def upload_last_policy_to_elasticsearch(self, policy: str, index: str, doc_type: str, s3_json_file: str,
                                             es_add_items: dict = None):
         """
@@ -106,83 +178,18 @@ class ESUploader:
         :param es_add_items:
         :return:
         """
-        resource = ''
-        launch_time_format = ''
-        # fetch data from s3 per region/policy
-        data = self.__s3_operation.get_last_s3_policy_content(policy=policy, file_name=s3_json_file)
-        if data:
-            # cluster owned launch time
-            clusters_launch_time_dict = {}
-            # cluster owned user name
-            cluster_user = {}
-            data_list = json.loads(data)
+        data = None
+        # stream data from s3 per region/policy, the resources are decoded one by one
+        with self.__s3_operation.open_last_s3_policy_content(policy=policy, file_name=s3_json_file) as policy_file:
+            content = JsonStreamDecoder().decode_stream(policy_file)
             # if json folding in list need to extract it
-            if type(data_list) == list:
-                # resources_list is a list of items that was triggered by policy
-                data_dict = {'resources_list': []}
-                for i, item in enumerate(data_list):
-                    ec2_ebs_name = ''
-                    gitleaks_leakurl = ''
-                    user = ''
-                    # cluster resource tag
-                    cluster_owned = ''
-                    # filter all data to save place
-                    # data_dict[f'resource{i + 1}'] = item
-                    # data_dict[f'resource_{i + 1}'] = 1
-                    data_dict['resources'] = i + 1
-                    # ec2/ebs
-                    if item.get('Tags'):
-                        for val in item['Tags']:
-                            if val['Key'] == 'Name':
-                                ec2_ebs_name = val['Value']
-                            if val['Value'] == 'owned':
-                                cluster_owned = val['Key']
-                            if val['Key'].lower() == 'user':
-                                user = val['Value'].lower()
-                    if cluster_owned:
-                        cluster_user[cluster_owned] = user
-                    # ec2 - MUST: every fix, change also cluster title
-                    # title:  instance id | user | cost($) | state | instance type | launch time | name | cluster owned
-                    if item.get('InstanceId'):
-                        resource = 'ec2'
-                        # lt_datetime = datetime.strptime(item['LaunchTime'], '%Y-%m-%dT%H:%M:%S+00:00')
-                        ec2_cost = self.__aws_price.get_ec2_price(resource=resource, item_data=item)
-                        launch_time_format = item['LaunchTime'][:-15].replace('T', ' ')
-                        if cluster_owned:
-                            clusters_launch_time_dict[cluster_owned] = launch_time_format
-                        data_dict['resources_list'].append(
-                            f"{item['InstanceId']} | {user} | {ec2_cost} | {item['State']['Name']} | {item['InstanceType']}  | {launch_time_format} | {ec2_ebs_name} | {cluster_owned} ")
-
-                    # ebs - MUST: every fix, change also cluster title
-                    # title: volume id | user | cost($/month) | state | volume type | create time | size(gb) | name |  cluster owned
-                    if item.get('VolumeId'):
-                        resource = 'ebs'
-                        ebs_monthly_cost = self.__aws_price.get_ec2_price(resource=resource, item_data=item)
-                        create_time_format = item['CreateTime'][:-22].replace('T', ' ')
-                        if cluster_owned:
-                            clusters_launch_time_dict[cluster_owned] = create_time_format
-                        data_dict['resources_list'].append(
-                            f"{item['VolumeId']} | {user} | {ebs_monthly_cost} | {item['State']} | {item['VolumeType']} | {create_time_format} | {item['Size']} | {ec2_ebs_name} |  {cluster_owned} ")
-                    # gitleaks
-                    if item.get('leakURL'):
-                        gitleaks_leakurl = item.get('leakURL')
-                    if item.get('email'):
-                        data_dict['resources_list'].append(f"{item.get('email')} | {gitleaks_leakurl}")
-
-                # get cluster cost data only for ec2 and ebs
-                if resource:
-                    cluster_cost_results = self.__get_cluster_cost(data=data_dict, resource=resource,
-                                                                   clusters_launch_time=clusters_launch_time_dict,
-                                                                   clusters_user=cluster_user)
-                    data_dict['cluster_cost_data'] = cluster_cost_results
-                    user_cost_results = self.__get_user_cost(data=data_dict)
-                    data_dict['user_cost_data'] = user_cost_results
-                data = data_dict
-            elif type(data_list) == dict:
-                data = data_list
+            if isinstance(content, Iterator):
+                data = self.__aggregate_policy_resources(items=content)
+            elif isinstance(content, dict):
+                data = content
 
         # no data for policy
-        else:
+        if data is None:
             data = {'resources': 0}
 
         # Add items
@@ -193,15 +200,8 @@ class ESUploader:
         data['timestamp'] = datetime.utcnow()  # datetime.now()
 
         # Upload data to elastic search server
-        try:
-            if isinstance(data, dict):  # JSON Object
-                self.es_operations.upload_to_elasticsearch(index=index, data=data)
-            else:  # JSON Array
-                for record in data:
-                    self.es_operations.upload_to_elasticsearch(index=index, data=record)
-            return True
-        except Exception:
-            raise
+        self.es_operations.upload_to_elasticsearch(index=index, data=data)
+        return True
 
     @logger_time_stamp
     def upload_to_es(self, account):
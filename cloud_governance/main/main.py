@@ -4,32 +4,10 @@ from multiprocessing import set_start_method
 
 import typeguard
 from ast import literal_eval  # str to dict
-import boto3  # regions
 
-from cloud_governance.main.main_common_operations import run_common_policies
-from cloud_governance.main.main_oerations.main_operations import MainOperations
-from cloud_governance.main.run_cloud_resource_orchestration import run_cloud_resource_orchestration
-from cloud_governance.policy.policy_operations.aws.cost_expenditure.cost_report_policies import CostReportPolicies
-from cloud_governance.policy.policy_operations.azure.azure_policy_runner import AzurePolicyRunner
+# Policy runners are imported on demand, a run loads only the modules of the selected cloud/policy
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp, logger
-from cloud_governance.policy.policy_operations.aws.tag_cluster.run_tag_cluster_resouces import tag_cluster_resource, \
-    remove_cluster_resources_tags
-from cloud_governance.policy.policy_operations.aws.tag_non_cluster.run_tag_non_cluster_resources import \
-    tag_non_cluster_resource, \
-    remove_tag_non_cluster_resource, tag_na_resources
-from cloud_governance.policy.policy_operations.aws.tag_user.run_tag_iam_user import tag_iam_user, \
-    run_validate_iam_user_tags
-from cloud_governance.policy.policy_operations.aws.zombie_cluster.run_zombie_cluster_resources import \
-    zombie_cluster_resource
-from cloud_governance.policy.policy_operations.gcp.gcp_policy_runner import GcpPolicyRunner
-from cloud_governance.policy.policy_operations.gitleaks.gitleaks import GitLeaks
-from cloud_governance.policy.policy_operations.ibm.ibm_operations.ibm_policy_runner import IBMPolicyRunner
 from cloud_governance.main.environment_variables import environment_variables
-from cloud_governance.main.es_uploader import ESUploader
-from cloud_governance.common.clouds.aws.s3.s3_operations import S3Operations
-from cloud_governance.policy.policy_operations.aws.zombie_cluster.validate_zombies import ValidateZombies
-from cloud_governance.policy.policy_operations.aws.zombie_non_cluster.zombie_non_cluster_polices import \
-    ZombieNonClusterPolicies
 
 environment_variables_dict = environment_variables.environment_variables_dict
 log_level = environment_variables_dict.get('log_level', 'INFO').upper()
@@ -58,13 +36,15 @@ def get_custodian_policies(type: str = None):
 
 @logger_time_stamp
 @typeguard.typechecked
-def run_policy(account: str, policy: str, region: str, dry_run: str):
+def run_policy(policy: str, region: str, dry_run: str):
     """
     This method run policy per region, first the custom policy and after custodian policy
     :return:
     """
     # policy Tag Cluster
     if policy == 'tag_resources':
+        from cloud_governance.policy.policy_operations.aws.tag_cluster.run_tag_cluster_resouces import \
+            tag_cluster_resource, remove_cluster_resources_tags
         cluster_name = environment_variables_dict.get('resource_name',
                                                       '')  # environment_variables_dict.get('resource_name', '')
         mandatory_tags = environment_variables_dict.get('mandatory_tags', {})
@@ -77,6 +57,7 @@ def run_policy(account: str, policy: str, region: str, dry_run: str):
             tag_cluster_resource(cluster_name=cluster_name, mandatory_tags=mandatory_tags, region=region,
                                  tag_operation=tag_operation)
     elif policy == 'validate_iam_user_tags':
+        from cloud_governance.policy.policy_operations.aws.tag_user.run_tag_iam_user import run_validate_iam_user_tags
         es_host = environment_variables_dict.get('es_host', '')
         es_port = environment_variables_dict.get('es_port', '')
         es_index = environment_variables_dict.get('es_index', '')
@@ -87,12 +68,15 @@ def run_policy(account: str, policy: str, region: str, dry_run: str):
         run_validate_iam_user_tags(es_host=es_host, es_port=es_port, es_index=es_index, validate_type=validate_type,
                                    user_tags=user_tags)
     elif policy == 'validate_cluster':
+        from cloud_governance.policy.policy_operations.aws.zombie_cluster.validate_zombies import ValidateZombies
         file_path = environment_variables_dict.get('file_path', '')
         file_name = environment_variables_dict.get('file_name', '')
         file_path = file_path + file_name
         validate_zombies = ValidateZombies(file_path=file_path, region=region)
         validate_zombies.read_csv()
     elif policy == 'tag_cluster':
+        from cloud_governance.policy.policy_operations.aws.tag_cluster.run_tag_cluster_resouces import \
+            tag_cluster_resource, remove_cluster_resources_tags
         cluster_name = environment_variables_dict.get('resource_name', '')
         mandatory_tags = environment_variables_dict.get('mandatory_tags', {})
         tag_operation = environment_variables_dict.get('tag_operation', '')
@@ -105,6 +89,7 @@ def run_policy(account: str, policy: str, region: str, dry_run: str):
             tag_cluster_resource(cluster_name=cluster_name, mandatory_tags=mandatory_tags, region=region,
                                  tag_operation=tag_operation, cluster_only=True)
     elif policy == 'tag_iam_user':
+        from cloud_governance.policy.policy_operations.aws.tag_user.run_tag_iam_user import tag_iam_user
         user_tag_operation = environment_variables_dict.get('user_tag_operation', '')
         file_name = environment_variables_dict.get('file_name', '')
         username = environment_variables_dict.get('username', '')
@@ -114,6 +99,9 @@ def run_policy(account: str, policy: str, region: str, dry_run: str):
         tag_iam_user(user_tag_operation=user_tag_operation, file_name=file_name, remove_keys=remove_keys,
                      username=username)
     elif policy == 'zombie_cluster_resource':
+        from cloud_governance.common.clouds.aws.s3.s3_operations import S3Operations
+        from cloud_governance.policy.policy_operations.aws.zombie_cluster.run_zombie_cluster_resources import \
+            zombie_cluster_resource
         policy_output = environment_variables_dict.get('policy_output', '')
         resource = environment_variables_dict.get('resource', '')
         resource_name = environment_variables_dict.get('resource_name', '')
@@ -131,6 +119,8 @@ def run_policy(account: str, policy: str, region: str, dry_run: str):
             logger.info(s3operations.save_results_to_s3(policy=policy.replace('_', '-'), policy_output=policy_output,
                                                         policy_result=zombie_result))
     elif policy == 'tag_non_cluster':
+        from cloud_governance.policy.policy_operations.aws.tag_non_cluster.run_tag_non_cluster_resources import \
+            tag_non_cluster_resource, remove_tag_non_cluster_resource, tag_na_resources
         # instance_name = environment_variables_dict['resource_name']
         mandatory_tags = environment_variables_dict.get('mandatory_tags', {})
         tag_operation = environment_variables_dict.get('tag_operation', '')
@@ -150,6 +140,8 @@ def run_policy(account: str, policy: str, region: str, dry_run: str):
             else:
                 tag_non_cluster_resource(mandatory_tags=mandatory_tags, region=region, tag_operation=tag_operation)
     elif policy == 'gitleaks':
+        from cloud_governance.common.clouds.aws.s3.s3_operations import S3Operations
+        from cloud_governance.policy.policy_operations.gitleaks.gitleaks import GitLeaks
         git_access_token = environment_variables_dict.get('git_access_token')
         git_repo = environment_variables_dict.get('git_repo')
         several_repos = environment_variables_dict.get('several_repos', '')
@@ -212,7 +204,6 @@ def main():
         region_env = environment_variables_dict.get('AWS_DEFAULT_REGION', 'us-east-2')
         dry_run = environment_variables_dict.get('dry_run', 'yes')
 
-        account = environment_variables_dict.get('account', '')
         policy = environment_variables_dict.get('policy', '')
         upload_data_es = environment_variables_dict.get('upload_data_es', '')
         es_host = environment_variables_dict.get('es_host', '')
@@ -220,17 +211,22 @@ def main():
         es_index = environment_variables_dict.get('es_index', '')
         es_doc_type = environment_variables_dict.get('es_doc_type', '')
         bucket = environment_variables_dict.get('bucket', '')
+        from cloud_governance.main.main_oerations.main_operations import MainOperations
         main_operations = MainOperations()
         response = main_operations.run()
         if not response:
             if environment_variables_dict.get('COMMON_POLICIES'):
+                from cloud_governance.main.main_common_operations import run_common_policies
                 run_common_policies()
             elif environment_variables_dict.get('CLOUD_RESOURCE_ORCHESTRATION'):
+                from cloud_governance.main.run_cloud_resource_orchestration import run_cloud_resource_orchestration
                 run_cloud_resource_orchestration()
             else:
                 non_cluster_polices_runner = None
                 is_non_cluster_polices_runner = policy in environment_variables_dict.get('non_cluster_policies')
                 if is_non_cluster_polices_runner:
+                    from cloud_governance.policy.policy_operations.aws.zombie_non_cluster.zombie_non_cluster_polices import \
+                        ZombieNonClusterPolicies
                     non_cluster_polices_runner = ZombieNonClusterPolicies()
 
                 ibm_classic_infrastructure_policy_runner = None
@@ -241,6 +237,8 @@ def main():
                         is_tag_ibm_classic_infrastructure_runner = policy in environment_variables_dict.get(
                             'cost_policies')
                 if is_tag_ibm_classic_infrastructure_runner:
+                    from cloud_governance.policy.policy_operations.ibm.ibm_operations.ibm_policy_runner import \
+                        IBMPolicyRunner
                     ibm_classic_infrastructure_policy_runner = IBMPolicyRunner()
 
                 is_cost_explorer_policies_runner = ''
@@ -248,6 +246,8 @@ def main():
                     cost_explorer_policies_runner = None
                     is_cost_explorer_policies_runner = policy in environment_variables_dict.get('cost_policies')
                     if is_cost_explorer_policies_runner:
+                        from cloud_governance.policy.policy_operations.aws.cost_expenditure.cost_report_policies import \
+                            CostReportPolicies
                         cost_explorer_policies_runner = CostReportPolicies()
 
                 is_azure_policy_runner = ''
@@ -256,6 +256,8 @@ def main():
                     azure_cost_policy_runner = None
                     is_azure_policy_runner = policy in environment_variables_dict.get('cost_policies')
                     if is_azure_policy_runner:
+                        from cloud_governance.policy.policy_operations.azure.azure_policy_runner import \
+                            AzurePolicyRunner
                         azure_cost_policy_runner = AzurePolicyRunner()
 
                 is_gcp_policy_runner = ''
@@ -264,6 +266,7 @@ def main():
                     gcp_cost_policy_runner = None
                     is_gcp_policy_runner = policy in environment_variables_dict.get('cost_policies')
                     if is_gcp_policy_runner:
+                        from cloud_governance.policy.policy_operations.gcp.gcp_policy_runner import GcpPolicyRunner
                         gcp_cost_policy_runner = GcpPolicyRunner()
 
                 @logger_time_stamp
@@ -306,6 +309,9 @@ def main():
 
                 # 1. ELK Uploader
                 if upload_data_es:
+                    from cloud_governance.main.es_uploader import ESUploader
+                    # the account of aws is loaded from IAM, only the ES uploader uses it
+                    account = environment_variables_dict.get('account', '')
                     input_data = {'es_host': es_host,
                                   'es_port': int(es_port),
                                   'es_index': es_index,
@@ -337,14 +343,17 @@ def main():
                     if region_env == 'all':
                         # must be set for boto3 client default region
                         # environment_variables_dict['AWS_DEFAULT_REGION'] = 'us-east-2'
+                        import boto3  # regions
                         ec2 = boto3.client('ec2')
                         regions_data = ec2.describe_regions()
                         for region in regions_data['Regions']:
                             # logger.info(f"region: {region['RegionName']}")
                             environment_variables_dict['AWS_DEFAULT_REGION'] = region['RegionName']
-                            run_policy(account=account, policy=policy, region=region['RegionName'], dry_run=dry_run)
+                            run_policy(policy=policy, region=region['RegionName'], dry_run=dry_run)
                     else:
-                        run_policy(account=account, policy=policy, region=region_env, dry_run=dry_run)
+                        run_policy(policy=policy, region=region_env, dry_run=dry_run)
+    from cloud_governance.common.clouds.aws.utils.aws_api_monitor import AWSApiMonitor
+    AWSApiMonitor.log_summary()
 
 
 if __name__ == '__main__':
@@ -1,8 +1,5 @@
 from cloud_governance.common.utils.utils import Utils
 from cloud_governance.main.environment_variables import environment_variables
-from cloud_governance.policy.policy_runners.azure.policy_runner import PolicyRunner as AzurePolicyRunner
-from cloud_governance.policy.policy_runners.aws.policy_runner import PolicyRunner as AWSPolicyRunner
-from cloud_governance.policy.policy_runners.ibm.policy_runner import PolicyRunner as IBMPolicyRunner
 
 
 class MainOperations:
@@ -19,13 +16,17 @@ class MainOperations:
         :return:
         :rtype:
         """
+        # the cloud runners are imported on demand, only the selected cloud sdk is loaded
         policy_runner = None
         if Utils.equal_ignore_case(self._public_cloud_name, 'AWS'):
+            from cloud_governance.policy.policy_runners.aws.policy_runner import PolicyRunner as AWSPolicyRunner
             policy_runner = AWSPolicyRunner()
         elif Utils.equal_ignore_case(self._public_cloud_name, 'Azure'):
+            from cloud_governance.policy.policy_runners.azure.policy_runner import PolicyRunner as AzurePolicyRunner
             policy_runner = AzurePolicyRunner()
         else:
             if Utils.equal_ignore_case(self._public_cloud_name, 'IBM'):
+                from cloud_governance.policy.policy_runners.ibm.policy_runner import PolicyRunner as IBMPolicyRunner
                 policy_runner = IBMPolicyRunner()
 
         return policy_runner
@@ -37,7 +38,6 @@ class MainOperations:
         :rtype:
         """
         policies_list = Utils.get_cloud_policies(cloud_name=self._public_cloud_name, dir_dict=True)
-        policy_runner = self.get_policy_runner()
         for policy_type, policies in policies_list.items():
             # @Todo support for all the aws policies, currently supports ec2_run as urgent requirement
             if self._policy in policies and self._policy in ["instance_run", "unattached_volume", "cluster_run",
@@ -47,6 +47,7 @@ class MainOperations:
                 source = policy_type
                 if Utils.equal_ignore_case(policy_type, self._public_cloud_name):
                     source = ''
+                policy_runner = self.get_policy_runner()
                 policy_runner.run(source=source)
                 return True
         return False
@@ -1,7 +1,7 @@
-import copy
 import datetime
 import logging
 from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import boto3
 
@@ -22,6 +22,8 @@ class CostExplorerPayerBillings(CostBillingReports):
     """
 
     DEFAULT_ROUND_DIGITS = 3
+    # Cost Explorer requests are rate limited in CostExplorerOperations
+    MAX_WORKERS = 5
 
     def __init__(self):
         super().__init__()
@@ -32,7 +34,8 @@ class CostExplorerPayerBillings(CostBillingReports):
         self.__savings_plan_client = boto3.client('savingsplans', aws_access_key_id=self.__access_key, aws_secret_access_key=self.__secret_key, aws_session_token=self.__session)
         self.__iam_client = boto3.client('iam', aws_access_key_id=self.__access_key, aws_secret_access_key=self.__secret_key, aws_session_token=self.__session)
         self.__assumed_role_account_name = IAMOperations(iam_client=self.__iam_client).get_account_alias_cloud_name()
-        self.__cost_explorer_operations = CostExplorerOperations(ce_client=self.__ce_client)
+        self.__cost_explorer_operations = CostExplorerOperations(ce_client=self.__ce_client,
+                                                                cache_namespace=self.__aws_role)
         self.__savings_plan_operations = SavingsPlansOperations(savings_plan_client=self.__savings_plan_client)
         self.__replacement_account = literal_eval(self._environment_variables_dict.get('REPLACE_ACCOUNT_NAME'))
         self.__savings_discounts = float(self._environment_variables_dict.get('PAYER_SUPPORT_FEE_CREDIT', 0))
@@ -150,14 +153,20 @@ class CostExplorerPayerBillings(CostBillingReports):
         This method append the forecast to the linked accounts
         """
         start_date, end_date = self.get_date_ranges(days=self.FORECAST_DAYS)
-        for account, account_cost_usage in copy.deepcopy(linked_account_usage).items():
+        accounts = []
+        for account, account_cost_usage in linked_account_usage.items():
             list_usage = list(account_cost_usage.values())[0]
-            cost_center, account_id = list_usage.get('CostCenter'), list_usage.get('AccountId')
-            try:
-                cost_forecast_data = self.__cost_explorer_operations.get_cost_forecast(start_date=start_date, end_date=end_date, granularity=self.GRANULARITY, cost_metric=self.COST_METRIC, Filter={'Dimensions': {'Key': 'LINKED_ACCOUNT', 'Values': [account_id]}})
-                self.filter_forecast_data(cost_forecast_data=cost_forecast_data['ForecastResultsByTime'], cost_center=cost_center, account=account, account_id=account_id, cost_usage_data=linked_account_usage)
-            except Exception as err:
-                logger.info(f'No Data to get forecast: {account_id}: {account}, {err}')
+            accounts.append((account, list_usage.get('CostCenter'), list_usage.get('AccountId')))
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {executor.submit(self.__cost_explorer_operations.get_cost_forecast, start_date=start_date, end_date=end_date, granularity=self.GRANULARITY, cost_metric=self.COST_METRIC, Filter={'Dimensions': {'Key': 'LINKED_ACCOUNT', 'Values': [account_id]}}): (account, cost_center, account_id)
+                       for account, cost_center, account_id in accounts}
+            for future in as_completed(futures):
+                account, cost_center, account_id = futures[future]
+                try:
+                    cost_forecast_data = future.result()
+                    self.filter_forecast_data(cost_forecast_data=cost_forecast_data['ForecastResultsByTime'], cost_center=cost_center, account=account, account_id=account_id, cost_usage_data=linked_account_usage)
+                except Exception as err:
+                    logger.info(f'No Data to get forecast: {account_id}: {account}, {err}')
 
     @logger_time_stamp
     def get_cost_centers(self):
@@ -176,8 +185,9 @@ class CostExplorerPayerBillings(CostBillingReports):
         cost_centers = self.get_cost_centers()
         cost_usage_data = {}
         start_date, end_date = self.get_date_ranges()
-        for cost_center in cost_centers:
-            cost_data = self.__cost_explorer_operations.get_cost_and_usage_from_aws(start_date=start_date, end_date=end_date, granularity="MONTHLY", GroupBy=[{'Type': 'DIMENSION', 'Key': 'LINKED_ACCOUNT'}], Filter={'CostCategories': {'Key': 'CostCenter', 'Values': [cost_center.get('CostCenter')]}})
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            cost_centers_data = executor.map(lambda cost_center: self.__cost_explorer_operations.get_cost_and_usage_from_aws(start_date=start_date, end_date=end_date, granularity="MONTHLY", GroupBy=[{'Type': 'DIMENSION', 'Key': 'LINKED_ACCOUNT'}], Filter={'CostCategories': {'Key': 'CostCenter', 'Values': [cost_center.get('CostCenter')]}}), cost_centers)
+        for cost_center, cost_data in zip(cost_centers, cost_centers_data):
             cost_center_usage_accounts = self.filter_data_by_tag(cost_data, tag='AccountId', cost_center=int(cost_center.get('CostCenter')))
             for idx, usage in cost_center_usage_accounts.items():
                 account = usage['Account']
@@ -198,14 +208,18 @@ class CostExplorerPayerBillings(CostBillingReports):
         :return:
         """
         start_date, end_date = self.get_date_ranges()
-        for cost_center in cost_centers:
-            cost_center_number = cost_center.get('CostCenter')
-            filter_cost_center = {'CostCategories': {'Key': 'CostCenter', 'Values': [cost_center_number]}}
-            values = self.__cost_explorer_operations.CE_COST_FILTERS[tag_name.upper()]['Values']
-            filter_tag_value = {'Dimensions': {'Key': 'PURCHASE_TYPE', 'Values': values}}
-            group_by = {'Type': 'DIMENSION', 'Key': 'LINKED_ACCOUNT'}
-            cost_data = self.__cost_explorer_operations.get_cost_and_usage_from_aws(start_date=start_date, end_date=end_date, granularity="MONTHLY",
-                                                                                    GroupBy=[group_by], Filter={'And': [filter_cost_center, filter_tag_value]})
+        values = self.__cost_explorer_operations.CE_COST_FILTERS[tag_name.upper()]['Values']
+        filter_tag_value = {'Dimensions': {'Key': 'PURCHASE_TYPE', 'Values': values}}
+        group_by = {'Type': 'DIMENSION', 'Key': 'LINKED_ACCOUNT'}
+
+        def get_cost_center_usage(cost_center: dict):
+            filter_cost_center = {'CostCategories': {'Key': 'CostCenter', 'Values': [cost_center.get('CostCenter')]}}
+            return self.__cost_explorer_operations.get_cost_and_usage_from_aws(start_date=start_date, end_date=end_date, granularity="MONTHLY",
+                                                                               GroupBy=[group_by], Filter={'And': [filter_cost_center, filter_tag_value]})
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            cost_centers_data = list(executor.map(get_cost_center_usage, cost_centers))
+        for cost_data in cost_centers_data:
             filtered_data = self.__cost_explorer_operations.get_ce_report_filter_data(ce_response=cost_data, tag_name=tag_name)
             if filtered_data:
                 for index_id, row in filtered_data.items():
@@ -1,4 +1,5 @@
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import pytz
 from azure.mgmt.costmanagement.models import QueryGrouping, QueryFilter, QueryComparisonExpression
@@ -147,10 +148,12 @@ class CostBillingReports:
                 self.get_data_from_costs(cost_data_rows=usage_data.get('rows'),
                                          cost_data_columns=usage_data.get('columns'), cost_type='Actual',
                                          cost_billing_data=cost_billing_data)
-            for subscription in subscription_ids:
-                query_filter = {
-                    'filter': {'name': 'SubscriptionId', 'values': [subscription[0]]}}
-                forecast_data = self.cost_mgmt_operations.get_forecast(scope=scope, **query_filter)
+            with ThreadPoolExecutor(max_workers=self.cost_mgmt_operations.MAX_CONCURRENT_QUERIES_PER_SCOPE) as executor:
+                forecasts_data = executor.map(
+                    lambda subscription: self.cost_mgmt_operations.get_forecast(
+                        scope=scope, dimensions={'SubscriptionId': [subscription[0]]}),
+                    subscription_ids)
+            for subscription, forecast_data in zip(subscription_ids, forecasts_data):
                 if forecast_data and forecast_data.get('rows'):
                     self.get_data_from_costs(cost_data_rows=forecast_data.get('rows'),
                                              cost_data_columns=forecast_data.get('columns'), cost_type='Forecast',
@@ -1,10 +1,9 @@
 import datetime
-import json
 
+from cloud_governance.common.clouds.cloudability.cloudability_operations import CloudabilityOperations
 from cloud_governance.common.elasticsearch.elastic_upload import ElasticUpload
 from cloud_governance.common.google_drive.gcp_operations import GCPOperations
 from cloud_governance.common.logger.init_logger import logger
-from cloud_governance.common.utils.api_requests import APIRequests
 from cloud_governance.common.utils.configs import LOOK_BACK_DAYS, IT_ACCOUNTS_COST_REPORTS_LIST, MONTHS, \
     DEFAULT_ROUND_DIGITS, DATE_FORMAT
 from cloud_governance.common.utils.utils import Utils
@@ -16,73 +15,35 @@ class CloudabilityCostReports:
     This class performs cloudability cost operations
     """
 
-    APPITO_LOGIN_API = "https://frontdoor.apptio.com/service/apikeylogin"
-
     def __init__(self):
-        self.__api_requests = APIRequests()
+        self.__cloudability_operations = CloudabilityOperations()
         self.__environment_variables_dict = environment_variables.environment_variables_dict
-        self.__view_id = self.__environment_variables_dict.get('CLOUDABILITY_VIEW_ID')
         self.__dimensions = self.__environment_variables_dict.get('CLOUDABILITY_DIMENSIONS')
         self.__metrics = self.__environment_variables_dict.get('CLOUDABILITY_METRICS')
         self.__cloudability_api = self.__environment_variables_dict.get('CLOUDABILITY_API')
         self.__reports_path = self.__environment_variables_dict.get('CLOUDABILITY_API_REPORTS_PATH')
-        self.__appito_envid = self.__environment_variables_dict.get('APPITO_ENVID')
-        self.__key_secret = self.__environment_variables_dict.get('APPITO_KEY_SECRET')
-        self.__key_access = self.__environment_variables_dict.get('APPITO_KEY_ACCESS')
         self.__gcp_operations = GCPOperations()
         self.elastic_upload = ElasticUpload()
 
-    def __get_appito_token(self):
-        """
-        This method returns the appito token
-        :return:
-        :rtype:
-        """
-        data = {
-            "keyAccess": self.__key_access,
-            "keySecret": self.__key_secret
-        }
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
-        response = self.__api_requests.post(url=self.APPITO_LOGIN_API, data=json.dumps(data), headers=headers)
-        if response.ok:
-            return response.headers['apptio-opentoken']
-        return None
-
     def __get_start_date(self):
         return (self.__get_end_date() - datetime.timedelta(days=LOOK_BACK_DAYS)).replace(day=1)
 
     def __get_end_date(self):
         return datetime.datetime.utcnow().date()
 
-    def __get_cost_reports(self, start_date: str = None, end_date: str = None, custom_filter: str = ''):
+    def __get_cost_reports(self, start_date: str = None, end_date: str = None, custom_filters: list = None):
         """
         This method returns the cost reports from the cloudability
         :return:
         :rtype:
         """
-        appito_token = self.__get_appito_token()
-        if not appito_token:
-            raise Exception("Appito Token missing error")
         if not start_date:
             start_date = self.__get_start_date()
         if not end_date:
             end_date = self.__get_end_date()
-        api = (f'{self.__cloudability_api}/{self.__reports_path}?'
-               f'dimensions={self.__dimensions}&metrics={self.__metrics}'
-               f'&start_date={start_date}&end_date={end_date}'
-               f'&id={self.__view_id}&{custom_filter}')
-        headers = {
-            "apptio-environmentid": self.__appito_envid,
-            "apptio-opentoken": appito_token
-        }
-
-        response = self.__api_requests.get(url=api, headers=headers)
-        if isinstance(response, dict):
-            return response.get('results')
-        return {}
+        return self.__cloudability_operations.get_cost_reports(dimensions=self.__dimensions, metrics=self.__metrics,
+                                                               start_date=start_date, end_date=end_date,
+                                                               custom_filters=custom_filters)
 
     def __get_analysed_reports(self):
         """
@@ -92,8 +53,9 @@ class CloudabilityCostReports:
         """
         accounts_reports_df = self.__gcp_operations.get_accounts_sheet(sheet_name=IT_ACCOUNTS_COST_REPORTS_LIST)
         cost_centers = list(set(accounts_reports_df['CostCenter'].tolist()))
-        custom_filter = '&'.join([f'filters=category4=={cost_center}' for cost_center in cost_centers])
-        cloudability_reports = self.__get_cost_reports(custom_filter=custom_filter)
+        # each cost center is an independent query, the queries run concurrently
+        custom_filters = [f'filters=category4=={cost_center}' for cost_center in cost_centers]
+        cloudability_reports = self.__get_cost_reports(custom_filters=custom_filters)
         cost_reports = {}
         for account in cloudability_reports:
             account['date'] = (datetime.datetime.strptime(account.get('date', ''), DATE_FORMAT)
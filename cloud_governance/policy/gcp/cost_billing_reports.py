@@ -1,8 +1,8 @@
 import json
-import os
 from datetime import datetime, timedelta
-from ast import  literal_eval
+from itertools import chain
 
+import pandas as pd
 from typeguard import typechecked
 
 from cloud_governance.common.clouds.gcp.google_account import GoogleAccount
@@ -30,6 +30,7 @@ class CostBillingReports:
         self.__cloud_name = self.__environment_variables_dict.get('PUBLIC_CLOUD_NAME').upper()
         self.update_to_gsheet = UploadToGsheet()
         self.elastic_upload = ElasticUpload()
+        self.__budget_details = {}
 
     @logger_time_stamp
     def __next_twelve_months(self):
@@ -86,81 +87,114 @@ class CostBillingReports:
 
     @typechecked()
     @logger_time_stamp
-    def __organized_results(self, data_rows: list):
+    def __get_budget_details(self, project_id: str, project_name: str, folder_ids: list, folder_names: dict):
         """
-        This method organize the results to be uploaded to elastic search
-        :param data_rows:
+        This method resolves the budget approved account of the project,
+        starting from the project and walking up the parent folders [project, child, sub_child, root]
+        :param project_id:
+        :param project_name:
+        :param folder_ids:
+        :param folder_names:
         :return:
         """
-        compress_gcp_data = {}  # compress data based on budget_id
-        for row in data_rows:
-            month = row.get('Month')
-            cost_center, allocated_budget, years, owner = 0, 0, '', 'Others'
-            project_budget_account_id = 0
-            budget_approved_account_name = ''
-            for idx, _id in enumerate((row.get('folder_ids')+[row.get('ProjectId')])[::-1]):  # start from reverse [root, sub_child, child]
-                cost_center, allocated_budget, years, owner = self.update_to_gsheet.get_cost_center_budget_details(account_id=_id, dir_path='/tmp')
-                if cost_center > 0:
-                    project_budget_account_id = _id
-                    budget_approved_account_name = row.get(_id)
-                    break
-            parent_index = len(row.get("folder_ids"))
-            index = f'{project_budget_account_id}-{budget_approved_account_name}-{month}'
-            if index in compress_gcp_data:
-                compress_gcp_data[index]['Actual'] = round(compress_gcp_data[index]['Actual'] + row.get('Actual'), 3)
-                compress_gcp_data[index]['Projects'].append({
-                    'Project': row.get('Project'),
-                    'Actual': round(row.get('Actual'), self.DEFAULT_ROUND_DIGITS),
-                    'ProjectId': row.get('ProjectId')
-                })
-                if parent_index > compress_gcp_data[index]['total_folders']:
-                    compress_gcp_data[index]['Account'] = row.get(f'parent{parent_index}', 'NA')
-                    compress_gcp_data[index]['AccountId'] = row.get(f'parent{parent_index}_id', 'NA')
-            else:
-                project_cost_data = {'CloudName': self.__cloud_name, 'CostCenter': cost_center, 'Owner': owner,
-                                     'Budget': round(allocated_budget / self.DEFAULT_YEARS, self.DEFAULT_ROUND_DIGITS),
-                                     'Forecast': 0,
-                                     'AllocatedBudget': round(allocated_budget, self.DEFAULT_ROUND_DIGITS),
-                                     'BudgetId': project_budget_account_id,
-                                     'Account': row.get(f'parent{parent_index}', 'NA'),
-                                     'AccountId': row.get(f'parent{parent_index}_id', 'NA'),
-                                     'Actual': round(row.get('Actual'), self.DEFAULT_ROUND_DIGITS),
-                                     'filter_date': row.get('filter_date'), 'Month': row.get('Month'),
-                                     'start_date': row.get('start_date'), 'timestamp': row.get('timestamp'),
-                                     'Projects': [{'Project': row.get('Project'),
-                                                   'Actual': round(row.get('Actual'), self.DEFAULT_ROUND_DIGITS),
-                                                   'ProjectId': row.get('ProjectId')}],
-                                     'index_id': f"{row.get('start_date')}-{project_budget_account_id}-{row.get(f'parent{parent_index}', 'NA').lower()}",
-                                     'total_folders': parent_index}
-                if budget_approved_account_name:
-                    project_cost_data['Account'] = (f"{row.get(f'parent{parent_index}', 'NA')}/"
-                                                    f"{budget_approved_account_name}")
-                    project_cost_data['AccountId'] = f"{row.get(f'parent{parent_index}_id', 'NA')}/{project_budget_account_id}"
-                compress_gcp_data[index] = project_cost_data
-        return self.__second_layer_filter(items=list(compress_gcp_data.values()))
+        cost_center, allocated_budget, years, owner = 0, 0, '', 'Others'
+        budget_account_id, budget_account_name = 0, ''
+        account_names = {**folder_names, project_id: project_name}
+        for _id in (folder_ids + [project_id])[::-1]:
+            if _id not in self.__budget_details:
+                self.__budget_details[_id] = self.update_to_gsheet.get_cost_center_budget_details(account_id=_id,
+                                                                                                  dir_path='/tmp')
+            cost_center, allocated_budget, years, owner = self.__budget_details[_id]
+            if cost_center > 0:
+                budget_account_id, budget_account_name = _id, account_names.get(_id)
+                break
+        parent_index = len(folder_ids)
+        parent_account = folder_names.get(folder_ids[-1], 'NA') if folder_ids and folder_names else 'NA'
+        parent_account_id = folder_ids[-1] if folder_ids and folder_names else 'NA'
+        account, account_id = parent_account, parent_account_id
+        if budget_account_name:
+            account = f"{parent_account}/{budget_account_name}"
+            account_id = f"{parent_account_id}/{budget_account_id}"
+        return {'CostCenter': cost_center, 'Owner': owner, 'AllocatedBudget': allocated_budget,
+                'BudgetId': budget_account_id, 'BudgetName': budget_account_name,
+                'ParentAccount': parent_account, 'ParentAccountId': parent_account_id,
+                'Account': account, 'AccountId': account_id, 'total_folders': parent_index}
 
-    @typechecked()
     @logger_time_stamp
-    def __second_layer_filter(self, items: list):
+    def __organized_results(self, projects_df: pd.DataFrame, folders_index: dict):
         """
-        This method aggregates the results which have the same Account name
-        :param items:
+        This method organize the results to be uploaded to elastic search
+        Projects are grouped by the budget approved account and month, then by the account and month
+        :param projects_df: project cost per month
+        :param folders_index: project to folder ancestry index
         :return:
         """
-        filtered_result = {}
-        for item in items:
-            account = item.get('Account')
-            month = item.get('Month')
-            index = f'{account}-{month}'
-            if index in filtered_result:
-                filtered_result[index]['Budget'] += item.get('Budget')
-                filtered_result[index]['Actual'] += item.get('Actual')
-                if item.get('BudgetId') != filtered_result[index]['BudgetId']:
-                    filtered_result[index]['AllocatedBudget'] += item.get('AllocatedBudget')
-                filtered_result[index]['Projects'].extend(item.get('Projects'))
-            else:
-                filtered_result[index] = item
-        return list(filtered_result.values())
+        projects_df['ancestry'] = projects_df['project_id'].map(
+            {project_id: folders['folder_id'] for project_id, folders in folders_index.items()}
+        ).fillna(projects_df['folder_id'])
+        hierarchy_df = projects_df[['project_id', 'Project', 'ancestry']].drop_duplicates()
+        hierarchy_df = pd.DataFrame([
+            {'project_id': project_id, 'Project': project_name, 'ancestry': ancestry,
+             **self.__get_budget_details(project_id=project_id, project_name=project_name,
+                                         folder_ids=ancestry.split('/')[2:-1],
+                                         folder_names=folders_index.get(project_id, {}).get('folder_names', {}))}
+            for project_id, project_name, ancestry in hierarchy_df.itertuples(index=False)
+        ])
+        projects_df = projects_df.merge(hierarchy_df, how='left', on=['project_id', 'Project', 'ancestry'],
+                                        sort=False)
+        projects_df['Projects'] = [{'Project': project_name, 'Actual': round(actual, self.DEFAULT_ROUND_DIGITS),
+                                    'ProjectId': project_id}
+                                   for project_name, actual, project_id in
+                                   zip(projects_df['Project'], projects_df['Actual'], projects_df['project_id'])]
+
+        # First layer: budget approved account per month
+        projects_df['budget_index'] = [f'{budget_id}-{budget_name}-{month}' for budget_id, budget_name, month in
+                                       zip(projects_df['BudgetId'], projects_df['BudgetName'], projects_df['month'])]
+        budget_group = projects_df.groupby('budget_index', sort=False)
+        first_parent_index = budget_group['total_folders'].transform('first')
+        deeper_accounts = projects_df[projects_df['total_folders'] > first_parent_index] \
+            .groupby('budget_index', sort=False)[['ParentAccount', 'ParentAccountId']].last()
+        budget_df = budget_group.agg(
+            CostCenter=('CostCenter', 'first'), Owner=('Owner', 'first'),
+            AllocatedBudget=('AllocatedBudget', 'first'), BudgetId=('BudgetId', 'first'),
+            Account=('Account', 'first'), AccountId=('AccountId', 'first'), ParentAccount=('ParentAccount', 'first'),
+            Actual=('Actual', 'sum'), month=('month', 'first'), Projects=('Projects', list),
+            total_folders=('total_folders', 'first'))
+        budget_df.loc[deeper_accounts.index, 'Account'] = deeper_accounts['ParentAccount']
+        budget_df.loc[deeper_accounts.index, 'AccountId'] = deeper_accounts['ParentAccountId']
+        budget_df['Actual'] = budget_df['Actual'].round(self.DEFAULT_ROUND_DIGITS)
+        budget_df['Budget'] = (budget_df['AllocatedBudget'] / self.DEFAULT_YEARS).round(self.DEFAULT_ROUND_DIGITS)
+        budget_df['AllocatedBudget'] = budget_df['AllocatedBudget'].round(self.DEFAULT_ROUND_DIGITS)
+
+        # Second layer: account per month
+        account_group = budget_df.groupby(['Account', 'month'], sort=False, dropna=False)
+        first_budget_id = account_group['BudgetId'].transform('first')
+        budget_df['ExtraAllocatedBudget'] = budget_df['AllocatedBudget'].where(
+            budget_df['BudgetId'].astype(str) != first_budget_id.astype(str), 0)
+        account_df = account_group.agg(
+            CostCenter=('CostCenter', 'first'), Owner=('Owner', 'first'), Budget=('Budget', 'sum'),
+            AllocatedBudget=('AllocatedBudget', 'first'), ExtraAllocatedBudget=('ExtraAllocatedBudget', 'sum'),
+            BudgetId=('BudgetId', 'first'), AccountId=('AccountId', 'first'),
+            ParentAccount=('ParentAccount', 'first'), Actual=('Actual', 'sum'),
+            Projects=('Projects', lambda projects: list(chain.from_iterable(projects))),
+            total_folders=('total_folders', 'first')).reset_index()
+        account_df['AllocatedBudget'] += account_df['ExtraAllocatedBudget']
+
+        cost_data = []
+        for row in account_df.to_dict(orient='records'):
+            start_date = f"{row['month'][:4]}-{row['month'][4:]}-01"
+            timestamp = datetime.strptime(start_date, '%Y-%m-%d')
+            month = datetime.strftime(timestamp, "%Y %b")
+            cost_data.append({
+                'CloudName': self.__cloud_name, 'CostCenter': row['CostCenter'], 'Owner': row['Owner'],
+                'Budget': row['Budget'], 'Forecast': 0, 'AllocatedBudget': row['AllocatedBudget'],
+                'BudgetId': row['BudgetId'], 'Account': row['Account'], 'AccountId': row['AccountId'],
+                'Actual': row['Actual'], 'filter_date': f'{start_date}-{month.split()[-1]}', 'Month': month,
+                'start_date': start_date, 'timestamp': timestamp, 'Projects': row['Projects'],
+                'index_id': f"{start_date}-{row['BudgetId']}-{row['ParentAccount'].lower()}",
+                'total_folders': int(row['total_folders'])
+            })
+        return cost_data
 
     # @Todo Add forecast values in future
     @typechecked()
@@ -206,49 +240,23 @@ class CostBillingReports:
 
     @typechecked()
     @logger_time_stamp
-    def __get_aggregated_folder_details(self, query_data: list):
+    def __get_folders_index(self, query_data: list):
         """
-        This method gives the unique folder_names from the data
+        This method returns the project to folder ancestry index, from the latest month of each project
         :param query_data:
-        :return:
+        :return: {project_number: {'folder_id': ancestry_numbers, 'folder_names': {folder_id: folder_name}}}
         """
-        project_folders = {}
-        for data in query_data:
-            index = f'{data.get("number")}'
-            month = data.get('month')
-            project_folder_id = data.get('folder_id')
-            insert_data = False
-            if index not in project_folders:
-                insert_data = True
-            else:
-                insert_data = month >= project_folders.get(index).get('month')
-            if insert_data:
-                updated_data = {'month': month, 'folder_id': project_folder_id}
-                for folders in literal_eval(data.get('project_folders')):
-                    folder_id = folders.get('resource_name').split('/')[-1]
-                    folder_name = folders.get('display_name')
-                    updated_data[folder_id] = folder_name
-                project_folders[index] = updated_data
-        return project_folders
-
-    @typechecked()
-    @logger_time_stamp
-    def __get_parent_folders(self, folder_ids: list, folders_data: dict, project_id: str):
-        """
-        This method returns the list of parent folders of Project
-        :param folder_ids:
-        :param folders_data:
-        :param project_id:
-        :return:
-        """
-        parent_folders = {}
-        for idx, _id in enumerate(folder_ids):
-            parent_folders.update({
-                f'parent{idx + 1}': folders_data[project_id].get(_id),
-                f'parent{idx + 1}_id': _id,
-                f'{_id}': folders_data[project_id].get(_id),
-            })
-        return parent_folders
+        if not query_data:
+            return {}
+        folders_df = pd.DataFrame(query_data)
+        folders_df = folders_df.sort_values('month', kind='stable').drop_duplicates(subset='number', keep='last')
+        folders_index = {}
+        for project_number, project_folder_id, project_folders in zip(folders_df['number'], folders_df['folder_id'],
+                                                                       folders_df['project_folders']):
+            folder_names = {folder.get('resource_name').split('/')[-1]: folder.get('display_name')
+                            for folder in json.loads(project_folders)}
+            folders_index[f'{project_number}'] = {'folder_id': project_folder_id, 'folder_names': folder_names}
+        return folders_index
 
     @logger_time_stamp
     def __get_big_query_data(self):
@@ -257,29 +265,17 @@ class CostBillingReports:
         :return:
         """
         cost_usage_queries = self.__prepare_usage_query()
-        query_rows = self.__gcp_account.query_list(cost_usage_queries)
-        folders_data = self.__get_aggregated_folder_details(query_rows[1])
-        agg_data = {}
-        for cst_row in query_rows[0]:
-            project_id, bill_month, total_cost = cst_row.get('project_id').strip(), cst_row.get('month'), float(cst_row.get('total_cost'))
-            folder_ids = folders_data.get(project_id).get('folder_id').split('/')[2:-1] if folders_data.get(project_id) else cst_row.get('folder_id').split('/')[2:-1]
-            folder_name = cst_row.get('folder_name')
-            index = f"{project_id}-{bill_month}"
-            parents_folders = self.__get_parent_folders(folder_ids, folders_data, project_id) if project_id in folders_data else {}
-            if agg_data.get(index):
-                total_cost = float(cst_row.get('total_cost')) + agg_data[index]['Actual']
-            agg_data[index] = {
-                'folder_name': parents_folders.get(f'parent{len(folder_ids)}', 'NA'),
-                'start_date': f'{bill_month[:4]}-{bill_month[4:]}-01',
-                f'{project_id}': f'{cst_row.get("project_name")}',
-                'Project': cst_row.get('project_name'), 'ProjectId': project_id, 'Actual': total_cost,
-                'Account': parents_folders.get('parent1', 'NA'), 'Forecast': 0, 'folder_ids': folder_ids, **parents_folders
-            }
-            agg_data[index]['timestamp'] = datetime.strptime(agg_data[index]['start_date'], '%Y-%m-%d')
-            month = datetime.strftime(agg_data[index]['timestamp'], "%Y %b")
-            agg_data[index]['Month'] = month
-            agg_data[index]['filter_date'] = f'{agg_data[index]["start_date"]}-{month.split()[-1]}'
-        return self.__organized_results(list(agg_data.values()))
+        cost_rows, folder_rows = self.__gcp_account.query_list(cost_usage_queries)
+        if not cost_rows:
+            return []
+        folders_index = self.__get_folders_index(folder_rows)
+        cost_df = pd.DataFrame(cost_rows)
+        cost_df['project_id'] = cost_df['project_id'].str.strip()
+        cost_df['total_cost'] = cost_df['total_cost'].astype(float)
+        projects_df = cost_df.groupby(['project_id', 'month'], sort=False).agg(
+            Actual=('total_cost', 'sum'), Project=('project_name', 'last'),
+            folder_id=('folder_id', 'last')).reset_index()
+        return self.__organized_results(projects_df=projects_df, folders_index=folders_index)
 
     @logger_time_stamp
     def __get_cost_and_upload(self):
@@ -13,8 +13,12 @@ from cloud_governance.common.utils.utils import Utils
 
 class AzurePolicyOperations(AbstractPolicyOperations):
 
+    VM_IDLE_METRIC_NAMES = ['Percentage CPU', 'Network In Total', 'Network Out Total']
+
     def __init__(self):
         self._cloud_name = 'Azure'
+        self._vm_metrics_cache = {}
+        self._instance_statuses = None
         self.compute_operations = ComputeOperations()
         self.network_operations = NetworkOperations()
         self.resource_group_operations = ResourceGroupOperations()
@@ -155,7 +159,12 @@ class AzurePolicyOperations(AbstractPolicyOperations):
         :return:
         :rtype:
         """
-        instance_statuses = self.compute_operations.get_instance_statuses(resource_id=resource_id, vm_name=vm_name)
+        if self._instance_statuses is None:
+            self._instance_statuses = self.compute_operations.get_all_instance_statuses()
+        instance_statuses = self._instance_statuses.get(resource_id.lower())
+        if instance_statuses is None:
+            instance_statuses = self.compute_operations.get_instance_statuses(resource_id=resource_id,
+                                                                              vm_name=vm_name)
         statuses = instance_statuses.get('statuses', {})
         if len(statuses) >= 2:
             status = statuses[1].get('display_status', '').lower()
@@ -188,6 +197,31 @@ class AzurePolicyOperations(AbstractPolicyOperations):
         else:
             return round(metric_aggregation_value, DEFAULT_ROUND_DIGITS)
 
+    def __get_vm_metric(self, resource_id: str, metric_name: str, days: int):
+        """
+        This method returns the metric of the Virtual Machine,
+        all the idle metrics are fetched in a single call per vm and cached for the run
+        :param resource_id:
+        :type resource_id:
+        :param metric_name:
+        :type metric_name:
+        :param days:
+        :type days:
+        :return:
+        :rtype:
+        """
+        cache_key = (resource_id, days)
+        if cache_key not in self._vm_metrics_cache:
+            start_date, end_date = Utils.get_start_and_end_datetime(days=days)
+            timespan = f'{start_date}/{end_date}'
+            vm_metrics = self.monitor_operations.get_resource_metrics(resource_id=resource_id,
+                                                                      metricnames=','.join(self.VM_IDLE_METRIC_NAMES),
+                                                                      aggregation='Average',
+                                                                      timespan=timespan)
+            self._vm_metrics_cache[cache_key] = {metric.get('name', {}).get('value'): {'value': [metric]}
+                                                 for metric in vm_metrics.get('value', [])}
+        return self._vm_metrics_cache[cache_key].get(metric_name, {})
+
     def get_cpu_utilization_percentage_metric(self, resource_id: str, days: int = INSTANCE_IDLE_DAYS):
         """
         This method returns the cpu utilization percentage
@@ -198,12 +232,7 @@ class AzurePolicyOperations(AbstractPolicyOperations):
         :return:
         :rtype:
         """
-        start_date, end_date = Utils.get_start_and_end_datetime(days=days)
-        timespan = f'{start_date}/{end_date}'
-        cpu_metrics = self.monitor_operations.get_resource_metrics(resource_id=resource_id,
-                                                                   metricnames='Percentage CPU',
-                                                                   aggregation='Average',
-                                                                   timespan=timespan)
+        cpu_metrics = self.__get_vm_metric(resource_id=resource_id, metric_name='Percentage CPU', days=days)
         average_cpu_metrics_value = self.__get_aggregation_metrics_value(metrics=cpu_metrics, aggregation='average')
         return average_cpu_metrics_value
 
@@ -217,12 +246,7 @@ class AzurePolicyOperations(AbstractPolicyOperations):
         :return:
         :rtype:
         """
-        start_date, end_date = Utils.get_start_and_end_datetime(days=days)
-        timespan = f'{start_date}/{end_date}'
-        network_in_metrics = self.monitor_operations.get_resource_metrics(resource_id=resource_id,
-                                                                          metricnames='Network In Total',
-                                                                          aggregation='Average',
-                                                                          timespan=timespan)
+        network_in_metrics = self.__get_vm_metric(resource_id=resource_id, metric_name='Network In Total', days=days)
         average_network_in_bytes = self.__get_aggregation_metrics_value(metrics=network_in_metrics,
                                                                         aggregation='average')
         return round(average_network_in_bytes / TOTAL_BYTES_IN_KIB, DEFAULT_ROUND_DIGITS)
@@ -237,12 +261,8 @@ class AzurePolicyOperations(AbstractPolicyOperations):
         :return:
         :rtype:
         """
-        start_date, end_date = Utils.get_start_and_end_datetime(days=days)
-        timespan = f'{start_date}/{end_date}'
-        network_out_metrics = self.monitor_operations.get_resource_metrics(resource_id=resource_id,
-                                                                           metricnames='Network Out Total',
-                                                                           aggregation='Average',
-                                                                           timespan=timespan)
+        network_out_metrics = self.__get_vm_metric(resource_id=resource_id, metric_name='Network Out Total',
+                                                   days=days)
         average_network_out_bytes = self.__get_aggregation_metrics_value(metrics=network_out_metrics,
                                                                          aggregation='average')
         return round(average_network_out_bytes / TOTAL_BYTES_IN_KIB, DEFAULT_ROUND_DIGITS)
@@ -45,12 +45,11 @@ class IBMCostReport:
         This method returns the baremetal resource data
         @return:
         """
-        bare_metals = self.classic_operations.get_hardware_ids()
+        bare_metals = self.classic_operations.get_hardware_details()
         collect_machines_data = {}
         for hardware in bare_metals:
-            hardware_tags = self.collect_tags_from_machines(
-                tags=self.classic_operations.get_hardware_tags(hardware_id=str(hardware.get('id'))))
-            hardware_tags['fqdn'] = hardware.get('fullyQualifiedDomainName').lower()
+            hardware_tags = self.collect_tags_from_machines(tags=hardware.get('tags'))
+            hardware_tags['fqdn'] = hardware.get('fqdn').lower()
             if 'budget' not in hardware_tags:
                 hardware_tags['budget'] = self.__environment_variables_dict.get('account')
             collect_machines_data[hardware_tags['fqdn']] = hardware_tags
@@ -61,12 +60,11 @@ class IBMCostReport:
         This method returns the virtual machine data
         @return:
         """
-        vms = self.classic_operations.get_virtual_machine_ids()
+        vms = self.classic_operations.get_virtual_machine_details()
         collect_machines_data = {}
         for vm in vms:
-            vm_tags = self.collect_tags_from_machines(
-                tags=self.classic_operations.get_virtual_machine_tags(vm_id=str(vm.get('id'))))
-            vm_tags['fqdn'] = vm.get('fullyQualifiedDomainName').lower()
+            vm_tags = self.collect_tags_from_machines(tags=vm.get('tags'))
+            vm_tags['fqdn'] = vm.get('fqdn').lower()
             collect_machines_data[vm_tags['fqdn']] = vm_tags
         return collect_machines_data
 
@@ -84,11 +82,12 @@ class IBMCostReport:
             month = int(month)
             year = int(year)
         invoice_data, users = self.ibm_account.get_invoice_data(month=month, year=year)
+        users_pattern = self.ibm_account.get_users_pattern(users)
         for fqdn in invoice_data.keys():
-            if fqdn not in collect_machines_data:
-                user = [user for user in users if user in fqdn]
+            if fqdn not in collect_machines_data and users_pattern:
+                user = users_pattern.search(fqdn)
                 if user:
-                    user_tags = self.ibm_account.get_user_tags_from_gsheet(username=f'{user[0]}@redhat.com',
+                    user_tags = self.ibm_account.get_user_tags_from_gsheet(username=f'{user.group()}@redhat.com',
                                                                            user_email='yes')
                     invoice_data[fqdn].update(self.collect_tags_from_machines(user_tags))
         return invoice_data
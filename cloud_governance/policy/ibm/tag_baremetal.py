@@ -81,15 +81,22 @@ class TagBareMetal(TaggingOperations):
                     logger.info(f'{err}')
         return add_hardware_tags
 
-    def tag_hardware(self, hardware_id: str):
+    def tag_hardware(self, hardware_id: str, hardware_record: dict = None):
         """
         This method perform tag operations - update, remove read
         @param hardware_id:
+        @param hardware_record: pre-fetched record from ClassicOperations.get_hardware_details
         @return:
         """
-        username, hardware_name = self.get_hardware_username(hardware_id=hardware_id)
+        if hardware_record:
+            username, hardware_name = hardware_record.get('username'), hardware_record.get('name')
+        else:
+            username, hardware_name = self.get_hardware_username(hardware_id=hardware_id)
         if username and hardware_name:
-            hardware_tags = self._classic_operations.get_hardware_tags(hardware_id=str(hardware_id))
+            if hardware_record:
+                hardware_tags = hardware_record.get('tags', [])
+            else:
+                hardware_tags = self._classic_operations.get_hardware_tags(hardware_id=str(hardware_id))
             user_tags = self._ibm_client.get_user_tags_from_gsheet(username=username)
             if self._tag_operation == 'remove':
                 tags = self.tag_remove_hardware(user_tags, hardware_tags, hardware_id, hardware_name)
@@ -108,9 +115,9 @@ class TagBareMetal(TaggingOperations):
         if hardware_id:
             response = self.tag_hardware(hardware_id=hardware_id)
         else:
-            hardware_ids = self._classic_operations.get_hardware_ids()
-            for hardware_id in hardware_ids:
-                response_data = self.tag_hardware(hardware_id=hardware_id.get('id'))
+            hardwares = self._classic_operations.get_hardware_details()
+            for hardware in hardwares:
+                response_data = self.tag_hardware(hardware_id=hardware.get('id'), hardware_record=hardware)
                 if response_data:
-                    response.append({hardware_id.get('hostname'): response_data})
+                    response.append({hardware.get('hostname'): response_data})
         return response
@@ -77,14 +77,19 @@ class TagVM(TaggingOperations):
                 logger.info(f'{err}')
         return remove_vm_tags
 
-    def tag_virtual_machine(self, vm_id: str):
+    def tag_virtual_machine(self, vm_id: str, vm_record: dict = None):
         """
         This method perform the tag operations - read, update, remove
         @param vm_id:
+        @param vm_record: pre-fetched record from ClassicOperations.get_virtual_machine_details
         @return:
         """
-        username, vm_name = self.get_virtual_machine_username(vm_id=vm_id)
-        vm_tags = self._classic_operations.get_virtual_machine_tags(vm_id=str(vm_id))
+        if vm_record:
+            username, vm_name = vm_record.get('username'), vm_record.get('name')
+            vm_tags = vm_record.get('tags', [])
+        else:
+            username, vm_name = self.get_virtual_machine_username(vm_id=vm_id)
+            vm_tags = self._classic_operations.get_virtual_machine_tags(vm_id=str(vm_id))
         user_tags = self._ibm_client.get_user_tags_from_gsheet(username=username)
         if self._tag_operation == 'remove':
             tags = self.tag_remove_virtual_machine(user_tags=user_tags, vm_tags=vm_tags, vm_id=vm_id, vm_name=vm_name)
@@ -102,9 +107,9 @@ class TagVM(TaggingOperations):
         if vm_id:
             response = self.tag_virtual_machine(vm_id=vm_id)
         else:
-            vm_ids = self._classic_operations.get_virtual_machine_ids()
-            for vm_id in vm_ids:
-                response_data = self.tag_virtual_machine(vm_id=vm_id.get('id'))
+            vms = self._classic_operations.get_virtual_machine_details()
+            for vm in vms:
+                response_data = self.tag_virtual_machine(vm_id=vm.get('id'), vm_record=vm)
                 if response_data:
-                    response.append({vm_id.get('hostname'): response_data})
+                    response.append({vm.get('hostname'): response_data})
         return response
@@ -1,4 +1,4 @@
-
+from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.policy.policy_operations.aws.dynamodb_upload_data.upload_data_to_dynamodb import UploadDataToDynamoDb
 
 
@@ -43,4 +43,7 @@ class CloudTrailToDynamoDb(UploadDataToDynamoDb):
         self._create_table_not_exists(primary_key='EventId')
         cloud_trail_data = self.__get_cloudtrail_data()
         data = self.__organize_cloudtrail_data(cloud_trail_data=cloud_trail_data)
-        self._upload_to_dynamo_db_table(data=data)
+        # batch_write_item rejects the duplicated keys in a request, the writes keyed on EventId are idempotent
+        data = list({item.get('EventId'): item for item in data}.values())
+        count = self._upload_to_dynamo_db_table(data=data)
+        logger.info(f'Uploaded {count} cloudtrail events to {self._table_name}')
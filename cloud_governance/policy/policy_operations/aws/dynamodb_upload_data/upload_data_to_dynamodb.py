@@ -49,6 +49,7 @@ class UploadDataToDynamoDb:
             self._db_client.describe_table(TableName=self._table_name)
         except self._db_client.exceptions.ResourceNotFoundException:
             self._db_operations.create_table(table_name=self._table_name, key_name=primary_key)
+            self._db_client.get_waiter('table_exists').wait(TableName=self._table_name)
             logger.info(f'Table is created {self._table_name}')
 
     def _upload_to_dynamo_db_table(self, data: list):
@@ -58,8 +59,5 @@ class UploadDataToDynamoDb:
         @return:
         """
         data = self.__convert_datatime_to_timestamp_in_data(data)
-        count = 0
-        for item in data:
-            self._db_operations.put_item(table_name=self._table_name, item=self._db_operations.serialize_data_dynamodb_data(item=item))
-            count += 1
-        return count
+        items = [self._db_operations.serialize_data_dynamodb_data(item=item) for item in data]
+        return self._db_operations.batch_write(table_name=self._table_name, items=items)
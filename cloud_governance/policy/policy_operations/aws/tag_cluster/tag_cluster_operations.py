@@ -1,10 +1,9 @@
 from datetime import datetime
 
-import boto3
-
 from cloud_governance.common.clouds.aws.cloudtrail.cloudtrail_operations import CloudTrailOperations
 from cloud_governance.common.clouds.aws.ec2.ec2_operations import EC2Operations
 from cloud_governance.common.clouds.aws.iam.iam_operations import IAMOperations
+from cloud_governance.common.clouds.aws.utils.boto3_client_pool import Boto3ClientPool
 from cloud_governance.common.clouds.aws.utils.utils import Utils
 
 
@@ -19,11 +18,11 @@ class TagClusterOperations:
         self.cluster_only = cluster_only
         self.cluster_prefix = cluster_prefix
         self.utils = Utils(region=region)
-        self.ec2_client = boto3.client('ec2', region_name=region)
-        self.elb_client = boto3.client('elb', region_name=region)
-        self.elbv2_client = boto3.client('elbv2', region_name=region)
-        self.iam_client = boto3.client('iam', region_name=region)
-        self.s3_client = boto3.client('s3')
+        self.ec2_client = Boto3ClientPool.get_client('ec2', region_name=region)
+        self.elb_client = Boto3ClientPool.get_client('elb', region_name=region)
+        self.elbv2_client = Boto3ClientPool.get_client('elbv2', region_name=region)
+        self.iam_client = Boto3ClientPool.get_client('iam', region_name=region)
+        self.s3_client = Boto3ClientPool.get_client('s3', region_name=None)
         self.ec2_operations = EC2Operations(region=region)
         self.iam_operations = IAMOperations()
         self.cluster_name = cluster_name
@@ -1,5 +1,3 @@
-import time
-
 import boto3
 import typeguard
 from botocore.client import BaseClient
@@ -317,9 +315,8 @@ class DeleteEC2Resources:
             nat_gateway = self.client.describe_nat_gateways(Filter=[{'Name': 'nat-gateway-id', 'Values': [resource_id]}])['NatGateways'][0]
             if nat_gateway.get('State') == 'available':
                 self.client.delete_nat_gateway(NatGatewayId=resource_id)
-                while nat_gateway.get('State') != 'deleted':
-                    nat_gateway = self.client.describe_nat_gateways(Filter=[{'Name': 'nat-gateway-id', 'Values': [resource_id]}])['NatGateways'][0]
-                    time.sleep(self.SLEEP_TIME)
+                self.client.get_waiter('nat_gateway_deleted').wait(NatGatewayIds=[resource_id],
+                                                                   WaiterConfig={'Delay': self.SLEEP_TIME})
                 logger.info(f'delete_nat_gateway: {resource_id}')
         except Exception as err:
             logger.exception(f'Cannot delete_nat_gateway: {resource_id}, {err}')
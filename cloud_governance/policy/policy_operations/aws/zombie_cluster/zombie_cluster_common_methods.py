@@ -5,6 +5,7 @@ from copy import deepcopy
 
 import boto3
 
+from cloud_governance.common.clouds.aws.utils.boto3_client_pool import Boto3ClientPool
 from cloud_governance.common.ldap.ldap_search import LdapSearch
 from cloud_governance.common.logger.init_logger import logger
 from cloud_governance.common.logger.logger_time_stamp import logger_time_stamp
@@ -22,12 +23,12 @@ class ZombieClusterCommonMethods:
         self.region = region
         self.dry_run = self.__environment_variables_dict.get('dry_run', 'yes')
         self.policy = self.__environment_variables_dict.get('policy', '')
-        self.ec2_client = boto3.client('ec2', region_name=region)
+        self.ec2_client = Boto3ClientPool.get_client('ec2', region_name=region)
         self.ec2_resource = boto3.resource('ec2', region_name=region)
-        self.elb_client = boto3.client('elb', region_name=region)
-        self.elbv2_client = boto3.client('elbv2', region_name=region)
-        self.iam_client = boto3.client('iam', region_name=region)
-        self.s3_client = boto3.client('s3')
+        self.elb_client = Boto3ClientPool.get_client('elb', region_name=region)
+        self.elbv2_client = Boto3ClientPool.get_client('elbv2', region_name=region)
+        self.iam_client = Boto3ClientPool.get_client('iam', region_name=region)
+        self.s3_client = Boto3ClientPool.get_client('s3', region_name=None)
         self.s3_resource = boto3.resource('s3')
         self.__ldap_host_name = self.__environment_variables_dict.get('LDAP_HOST_NAME', '')
         self._special_user_mails = self.__environment_variables_dict.get('special_user_mails', '{}')
@@ -55,7 +55,7 @@ setup(
         'google-api-python-client==2.57.0',  # google drive
         'google-auth-httplib2==0.1.0',  # google drive
         'google-auth-oauthlib==0.5.2',  # google drive
-        'google-cloud-bigquery==3.5.0',  # google cloud cost
+        'google-cloud-bigquery[bqstorage]==3.5.0',  # google cloud cost, arrow results via storage read api
         'google-cloud-billing==1.9.1',  # google cloud cost
         'ibm-cloud-sdk-core==3.18.0',
         'ibm-cos-sdk==2.13.6',
@@ -66,6 +66,7 @@ setup(
         'numpy<=1.26.4',  # opensearch 1.2.4 for elasticsearch
         'oauthlib~=3.1.1',  # required by jira
         'pandas',  # latest: aggregate ec2/ebs cluster data
+        'pyarrow<=17.0.0',  # bigquery arrow results, last release supporting numpy<2
         'PyAthena[Pandas]==3.0.5',  # AWS Athena package
         'PyGitHub==1.55',  # gitleaks
         'python-ldap==3.4.2',  # prerequisite: sudo dnf install -y python39-devel openldap-devel gcc
@@ -1,12 +1,15 @@
+import copy
 import datetime
 import os
 import uuid
 from operator import le
+from unittest.mock import patch
 
 import boto3
 import pytest
 from moto import mock_cloudtrail, mock_ec2, mock_dynamodb, mock_iam
 
+from cloud_governance.policy.policy_operations.aws.dynamodb_upload_data.cloudtrail_to_dynamodb import CloudTrailToDynamoDb
 from cloud_governance.policy.policy_operations.aws.dynamodb_upload_data.upload_data_to_dynamodb import UploadDataToDynamoDb
 from cloud_governance.policy.aws.ec2_stop import EC2Stop
 from cloud_governance.policy.policy_operations.aws.tag_non_cluster.tag_non_cluster_resources import TagNonClusterResources
@@ -101,3 +104,30 @@ def test_upload_data():
         'Username': 'cloud-governance-user-test'
     }]
     assert 1 == dynamo_db._upload_to_dynamo_db_table(data=mock_log_data)
+
+
+@mock_iam
+@mock_dynamodb
+def test_cloudtrail_upload_data():
+    """
+    This method tests the duplicated cloudtrail events are uploaded once and the uploads are idempotent
+    @return:
+    """
+    cloudtrail_to_dynamodb = CloudTrailToDynamoDb()
+    cloudtrail_to_dynamodb.set_table_name(value='test_table')
+    mock_log_data = [{
+        'EventId': str(index % 40),
+        'EventTime': datetime.datetime.now(),
+        'EventName': 'RunInstances',
+        'Username': 'cloud-governance-user-test',
+        'Resources': [{'ResourceType': 'AWS::EC2::Instance', 'ResourceName': f'i-{index}'}]
+    } for index in range(50)]
+    with patch.object(CloudTrailToDynamoDb, '_CloudTrailToDynamoDb__get_cloudtrail_data',
+                      side_effect=lambda: copy.deepcopy(mock_log_data)):
+        with patch.object(UploadDataToDynamoDb, '_upload_to_dynamo_db_table',
+                          wraps=cloudtrail_to_dynamodb._upload_to_dynamo_db_table) as upload_to_dynamo_db_table:
+            cloudtrail_to_dynamodb.upload_data()
+            cloudtrail_to_dynamodb.upload_data()
+    assert [len(call.kwargs['data']) for call in upload_to_dynamo_db_table.call_args_list] == [40, 40]
+    db_client = boto3.client('dynamodb', region_name=cloudtrail_to_dynamodb._region)
+    assert db_client.scan(TableName='test_table', Select='COUNT')['Count'] == 40
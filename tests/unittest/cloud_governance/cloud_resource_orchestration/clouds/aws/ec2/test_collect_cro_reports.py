@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from cloud_governance.cloud_resource_orchestration.clouds.aws.ec2.collect_cro_reports import CollectCROReports
+from cloud_governance.main.environment_variables import environment_variables
+
+
+def get_ce_daily_response(tag_name: str, daily_costs: dict):
+    """
+    This method returns the cost explorer daily response grouped by tag_name
+    :param tag_name:
+    :param daily_costs: {day: {tag_value: cost}}
+    :return:
+    """
+    return {'ResultsByTime': [{'TimePeriod': {'Start': day},
+                               'Groups': [{'Keys': [f'{tag_name}${tag_value}'],
+                                           'Metrics': {'UnblendedCost': {'Amount': str(cost)}}}
+                                          for tag_value, cost in costs.items()]}
+                              for day, costs in daily_costs.items()]}
+
+
+@patch('cloud_governance.cloud_resource_orchestration.clouds.aws.ec2.collect_cro_reports.JiraOperations')
+@patch('cloud_governance.cloud_resource_orchestration.clouds.aws.ec2.collect_cro_reports.IAMOperations')
+@patch('cloud_governance.cloud_resource_orchestration.clouds.aws.ec2.collect_cro_reports.CostOverUsage')
+def test_update_in_progress_ticket_cost_incremental(mock_cost_over_usage, mock_iam, mock_jira):
+    """
+    This method verifies only the new days are queried in one grouped query and added to the settled cost
+    :return:
+    """
+    environment_variables_dict = environment_variables.environment_variables_dict
+    environment_variables_dict['account'] = 'mock-account'
+    current_date = datetime.utcnow().date()
+    costed_until = current_date - timedelta(days=5)
+    days = [str(current_date - timedelta(days=day)) for day in range(4, -1, -1)]
+    tickets = [{'_source': {'ticket_id': '1', 'account_name': 'MOCK-ACCOUNT', 'user': 'mock',
+                            'ticket_opened_date': str(current_date - timedelta(days=20)), 'duration': 30,
+                            'costed_until': str(costed_until), 'settled_cost': 100.0, 'AllocatedBudget': 10,
+                            'forecast': 0}},
+               {'_source': {'ticket_id': '2', 'account_name': 'MOCK-ACCOUNT', 'user': 'mock',
+                            'ticket_opened_date': days[-1], 'duration': 5, 'AllocatedBudget': 10, 'forecast': 0}}]
+    cost_over_usage = mock_cost_over_usage.return_value
+    cost_over_usage.es_operations.fetch_data_by_es_query.return_value = tickets
+    cost_over_usage.get_forecast_cost_data.return_value = [{'Forecast': 0}]
+    ce_operations = cost_over_usage.get_cost_explorer_operations.return_value
+    ce_operations.get_filter_data.return_value = 1000
+    ce_operations.get_cost_by_tags.side_effect = lambda tag, start_date, end_date, **kwargs: get_ce_daily_response(
+        tag, {day: {'1': 1, '2': 2} if tag == 'TicketId' else {'mock': 3} for day in days if start_date <= day < end_date})
+    CollectCROReports().update_in_progress_ticket_cost()
+    ticket_id_calls = [call for call in ce_operations.get_cost_by_tags.call_args_list if call.kwargs['tag'] == 'TicketId']
+    assert len(ticket_id_calls) == 1
+    assert ticket_id_calls[0].kwargs['start_date'] == days[0]
+    assert ticket_id_calls[0].kwargs['Filter'] == {'Tags': {'Key': 'TicketId', 'Values': ['1', '2']}}
+    updates = {call.kwargs['id']: call.kwargs['metadata']
+               for call in cost_over_usage.es_operations.update_elasticsearch_index.call_args_list}
+    assert updates['1']['actual_cost'] == 105
+    assert updates['1']['settled_cost'] == 101
+    assert updates['1']['costed_until'] == str(current_date - timedelta(days=4))
+    assert updates['2']['actual_cost'] == 2
+    assert 'settled_cost' not in updates['2']
+    assert 'forecast' not in updates['1']
@@ -1,3 +1,6 @@
+from datetime import datetime
+from unittest.mock import patch
+
 from cloud_governance.cloud_resource_orchestration.clouds.azure.resource_groups.cost_over_usage import CostOverUsage
 from tests.unittest.cloud_governance.cloud_resource_orchestration.mocks.clouds.azure.mock_subscription import mock_subscription
 from tests.unittest.cloud_governance.cloud_resource_orchestration.mocks.clouds.azure.mock_compute import mock_compute
@@ -23,3 +26,29 @@ def test_verify_active():
 def test_verify_non_active():
     cost_over_usage = CostOverUsage()
     assert not cost_over_usage._verify_active_resources(tag_value='user', tag_name='test')
+
+
+@mock_subscription
+@mock_identity
+@mock_compute
+def test_get_cost_over_usage_users():
+    """
+    This method verifies the user ticket costs are fetched with one es query each and joined per user
+    :return:
+    :rtype:
+    """
+    cost_over_usage = CostOverUsage()
+    over_usage_amount = cost_over_usage._over_usage_amount
+    current_date = datetime.utcnow().date()
+    active_tickets = [{'_source': {'user_cro': 'mock', 'estimated_cost': '10'}},
+                      {'_source': {'user_cro': 'mock', 'estimated_cost': '20'}}]
+    closed_tickets = [{'_source': {'user': 'mock', 'user_daily_cost': str({str(current_date): {'TicketId': 5}})}}]
+    users_cost = [{'User': 'mock', 'Cost': over_usage_amount + 100}, {'User': 'test', 'Cost': over_usage_amount + 1},
+                  {'User': 'low', 'Cost': 1}]
+    with patch.object(cost_over_usage, 'get_monthly_user_es_cost_data', return_value=users_cost), \
+            patch.object(cost_over_usage, 'es_operations') as mock_es_operations:
+        mock_es_operations.fetch_data_by_es_query.side_effect = [active_tickets, closed_tickets]
+        over_usage_users = cost_over_usage._get_cost_over_usage_users()
+    assert mock_es_operations.fetch_data_by_es_query.call_count == 2
+    assert {user['User']: user['Cost'] for user in over_usage_users} == {'mock': over_usage_amount + 65,
+                                                                           'test': over_usage_amount + 1}
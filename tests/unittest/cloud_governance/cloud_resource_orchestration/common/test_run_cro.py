@@ -0,0 +1,39 @@
+import threading
+from unittest.mock import patch, Mock
+
+from cloud_governance.cloud_resource_orchestration.common.run_cro import RunCRO
+from cloud_governance.main.environment_variables import environment_variables
+
+
+def test_run_cloud_resources_merge_regions():
+    """
+    This method verifies the regions run with their own region and tickets are merged before uploading to es,
+    the region objects are created in the main thread
+    :return:
+    """
+    environment_variables_dict = environment_variables.environment_variables_dict
+    environment_variables_dict['PUBLIC_CLOUD_NAME'] = 'AWS'
+    default_region = environment_variables_dict.get('AWS_DEFAULT_REGION')
+    regions = ['us-east-1', 'us-east-2', 'ap-south-1']
+    created_threads = set()
+
+    def get_monitor_object(region_name: str):
+        created_threads.add(threading.current_thread())
+        monitor = Mock()
+        monitor.run.return_value = {'1': [{'region_name': region_name, 'instance_data': f'{region_name}-instance'}]}
+        return monitor
+
+    cro_object = Mock()
+    cro_object.get_active_regions.return_value = regions
+    cro_object.get_monitor_cro_resources_object.side_effect = get_monitor_object
+    with patch('cloud_governance.cloud_resource_orchestration.common.run_cro.CroObject', return_value=cro_object), \
+            patch('cloud_governance.cloud_resource_orchestration.common.run_cro.ElasticSearchOperations'):
+        run_cro = RunCRO()
+        run_cro._RunCRO__run_cloud_resources()
+    cro_reports = cro_object.collect_cro_reports.return_value
+    assert cro_reports.run.call_count == 1
+    monitor_response = cro_reports.run.call_args[0][0]
+    assert [data['region_name'] for data in monitor_response['1']] == regions
+    assert cro_object.get_tag_cro_resources_object.call_count == len(regions)
+    assert environment_variables_dict.get('AWS_DEFAULT_REGION') == default_region
+    assert created_threads == {threading.main_thread()}
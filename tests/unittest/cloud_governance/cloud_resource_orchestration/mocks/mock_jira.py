@@ -41,6 +41,15 @@ def mock_get_issue(*args, **kwargs):
         return get_ticket_response()
 
 
+def mock_get_issues(*args, **kwargs):
+    """
+    This method is mock for the get many tickets data
+    :param kwargs:
+    :return:
+    """
+    return {ticket_id.split('-')[-1]: get_ticket_response() for ticket_id in kwargs.get('ticket_ids', [])}
+
+
 def mock_move_issue_state(*args, **kwargs):
     """
     This method is mocking for moving Jira tickets
@@ -95,6 +104,7 @@ def mock_jira(method):
         @return:
         """
         with patch.object(JiraOperations, 'get_issue', mock_get_issue),\
+                patch.object(JiraOperations, 'get_issues', mock_get_issues), \
                 patch.object(JiraOperations, 'move_issue_state', mock_move_issue_state), \
                 patch.object(JiraOperations, 'get_all_issues', mock_get_all_issues):
             result = method(*args, **kwargs)
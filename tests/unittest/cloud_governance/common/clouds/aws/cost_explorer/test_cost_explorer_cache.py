@@ -0,0 +1,116 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from cloud_governance.common.clouds.aws.cost_explorer.cost_explorer_cache import CostExplorerCache
+from cloud_governance.common.clouds.aws.cost_explorer.cost_explorer_operations import CostExplorerOperations
+
+
+def test_request_key_normalized():
+    """
+    This method verifies the request key doesn't depend on the order of the request parameters
+    :return:
+    """
+    first_key = CostExplorerCache.get_request_key('123', 'get_cost_and_usage', start_date='2023-01-01',
+                                                  Filter={'Tags': {'Key': 'User', 'Values': ['mock']}})
+    second_key = CostExplorerCache.get_request_key('123', 'get_cost_and_usage',
+                                                   Filter={'Tags': {'Values': ['mock'], 'Key': 'User'}},
+                                                   start_date='2023-01-01')
+    assert first_key == second_key
+    assert first_key != CostExplorerCache.get_request_key('456', 'get_cost_and_usage', start_date='2023-01-01',
+                                                          Filter={'Tags': {'Key': 'User', 'Values': ['mock']}})
+
+
+def test_closed_month_expires_after_closed_month_ttl():
+    """
+    This method verifies settled closed months are cached with the closed month ttl and open months with the ttl
+    :return:
+    """
+    cost_explorer_cache = CostExplorerCache(ttl=60, closed_month_ttl=86400)
+    assert 86300 < cost_explorer_cache.get_expires_at(end_date='2020-02-01') - time.time() <= 86400
+    assert cost_explorer_cache.get_expires_at(end_date='2020-02-01', forecast=True) - time.time() <= 60
+    assert cost_explorer_cache.get_expires_at(end_date='2999-02-01') - time.time() <= 60
+
+
+def test_closed_month_settlement():
+    """
+    This method verifies the last month is recached until the middle of the next month
+    :return:
+    """
+    cost_explorer_cache = CostExplorerCache(ttl=60, closed_month_ttl=86400)
+    with patch('cloud_governance.common.clouds.aws.cost_explorer.cost_explorer_cache.datetime') as mock_datetime:
+        mock_datetime.utcnow.return_value = datetime(2023, 2, 10)
+        assert cost_explorer_cache.get_expires_at(end_date='2023-02-01') - time.time() <= 60
+        mock_datetime.utcnow.return_value = datetime(2023, 2, 20)
+        assert cost_explorer_cache.get_expires_at(end_date='2023-02-01') - time.time() > 60
+
+
+def test_get_or_load_persisted(tmp_path):
+    """
+    This method verifies the responses are served from disk by a new cache
+    :return:
+    """
+    loader = Mock(return_value={'ResultsByTime': [{'Total': 1}]})
+    CostExplorerCache(cache_directory=str(tmp_path)).get_or_load('key', loader)
+    response = CostExplorerCache(cache_directory=str(tmp_path)).get_or_load('key', loader)
+    assert response == {'ResultsByTime': [{'Total': 1}]}
+    assert loader.call_count == 1
+
+
+def test_get_or_load_coalesce_in_flight():
+    """
+    This method verifies the concurrent identical requests are loaded once
+    :return:
+    """
+    cost_explorer_cache = CostExplorerCache()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {'ResultsByTime': []}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(cost_explorer_cache.get_or_load, 'key', loader) for _ in range(5)]
+        time.sleep(0.2)
+        release.set()
+        responses = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert responses == [{'ResultsByTime': []}] * 5
+
+
+def test_cost_explorer_operations_cached():
+    """
+    This method verifies identical cost explorer requests are sent once
+    :return:
+    """
+    ce_client = Mock()
+    ce_client.get_cost_and_usage.return_value = {'ResultsByTime': [{'TimePeriod': {'Start': '2020-01-01'}}],
+                                                 'DimensionValueAttributes': [], 'GroupDefinitions': []}
+    cost_explorer_operations = CostExplorerOperations(ce_client=ce_client)
+    for _ in range(2):
+        response = cost_explorer_operations.get_cost_and_usage_from_aws(start_date='2020-01-01',
+                                                                        end_date='2020-02-01', granularity='MONTHLY')
+        assert response['ResultsByTime'] == [{'TimePeriod': {'Start': '2020-01-01'}}]
+    assert ce_client.get_cost_and_usage.call_count == 1
+
+
+def test_account_id_looked_up_once():
+    """
+    This method verifies the account id of the default credentials is looked up once per process
+    :return:
+    """
+    sts_client = Mock()
+    sts_client.get_caller_identity.return_value = {'Account': '123456789012'}
+    CostExplorerOperations._CostExplorerOperations__account_id = None
+    try:
+        with patch('cloud_governance.common.clouds.aws.cost_explorer.cost_explorer_operations.boto3.client',
+                   return_value=sts_client):
+            for _ in range(3):
+                assert CostExplorerOperations()._CostExplorerOperations__get_cache_namespace() == '123456789012'
+        assert sts_client.get_caller_identity.call_count == 1
+    finally:
+        CostExplorerOperations._CostExplorerOperations__account_id = None
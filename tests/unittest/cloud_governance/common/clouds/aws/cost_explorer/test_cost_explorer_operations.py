@@ -0,0 +1,21 @@
+import time
+from unittest.mock import MagicMock
+
+from cloud_governance.common.clouds.aws.cost_explorer.cost_explorer_operations import CostExplorerOperations
+
+
+def test_get_cost_forecast_rate_limit():
+    """
+    This method tests the cost explorer requests are sent within the rate limit
+    :return:
+    """
+    ce_client = MagicMock()
+    ce_client.get_cost_forecast.return_value = {'Total': {'Amount': '1'}, 'ForecastResultsByTime': []}
+    cost_explorer_operations = CostExplorerOperations(ce_client=ce_client, cache_namespace='test-rate-limit')
+    total_requests = CostExplorerOperations.MAX_REQUESTS_PER_SECOND + 1
+    start_time = time.monotonic()
+    for day in range(1, total_requests + 1):
+        cost_explorer_operations.get_cost_forecast(start_date=f'2099-01-{day:02d}', end_date='2099-02-01',
+                                                   granularity='MONTHLY', cost_metric='UNBLENDED_COST')
+    assert ce_client.get_cost_forecast.call_count == total_requests
+    assert time.monotonic() - start_time >= (total_requests - 1) / CostExplorerOperations.MAX_REQUESTS_PER_SECOND - 0.05
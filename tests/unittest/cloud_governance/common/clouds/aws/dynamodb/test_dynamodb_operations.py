@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+import boto3
+from moto import mock_dynamodb, mock_iam
+
+from cloud_governance.common.clouds.aws.dynamodb.dynamodb_operations import DynamoDbOperations
+
+TABLE_NAME = 'test_table'
+REGION_NAME = 'us-east-1'
+
+
+def create_table():
+    boto3.client('dynamodb', region_name=REGION_NAME).create_table(
+        TableName=TABLE_NAME, AttributeDefinitions=[{'AttributeName': 'Id', 'AttributeType': 'S'}],
+        KeySchema=[{'AttributeName': 'Id', 'KeyType': 'HASH'}],
+        ProvisionedThroughput={'ReadCapacityUnits': 10, 'WriteCapacityUnits': 10})
+
+
+@mock_iam
+@mock_dynamodb
+def test_batch_write():
+    """
+    This method tests the items are written in chunks of 25
+    @return:
+    """
+    create_table()
+    db_operations = DynamoDbOperations(region_name=REGION_NAME)
+    items = [db_operations.serialize_data_dynamodb_data({'Id': str(index), 'EventTime': index}) for index in range(60)]
+    db_client = db_operations._DynamoDbOperations__db_client
+    with patch.object(db_client, 'batch_write_item', wraps=db_client.batch_write_item) as batch_write_item:
+        assert db_operations.batch_write(table_name=TABLE_NAME, items=items) == 60
+    assert batch_write_item.call_count == 3
+    assert boto3.client('dynamodb', region_name=REGION_NAME).scan(TableName=TABLE_NAME, Select='COUNT')['Count'] == 60
+
+
+@mock_iam
+@mock_dynamodb
+def test_batch_write_unprocessed_items():
+    """
+    This method tests the unprocessed items are written again
+    @return:
+    """
+    create_table()
+    db_operations = DynamoDbOperations(region_name=REGION_NAME)
+    db_operations.BATCH_WRITE_DELAY = 0
+    items = [db_operations.serialize_data_dynamodb_data({'Id': str(index)}) for index in range(10)]
+    db_client = db_operations._DynamoDbOperations__db_client
+    batch_write_item = db_client.batch_write_item
+
+    def unprocess_half_items(RequestItems: dict):
+        put_requests = RequestItems[TABLE_NAME]
+        processed_count = (len(put_requests) + 1) // 2
+        batch_write_item(RequestItems={TABLE_NAME: put_requests[:processed_count]})
+        if put_requests[processed_count:]:
+            return {'UnprocessedItems': {TABLE_NAME: put_requests[processed_count:]}}
+        return {'UnprocessedItems': {}}
+
+    with patch.object(db_client, 'batch_write_item', side_effect=unprocess_half_items) as mock_batch_write_item:
+        assert db_operations.batch_write(table_name=TABLE_NAME, items=items) == 10
+    assert mock_batch_write_item.call_count == 4
+    assert boto3.client('dynamodb', region_name=REGION_NAME).scan(TableName=TABLE_NAME, Select='COUNT')['Count'] == 10
+
+
+@mock_iam
+@mock_dynamodb
+def test_scan_table():
+    """
+    This method tests the scan returns all the table pages
+    @return:
+    """
+    create_table()
+    db_operations = DynamoDbOperations(region_name=REGION_NAME)
+    items = [db_operations.serialize_data_dynamodb_data({'Id': str(index)}) for index in range(100)]
+    db_operations.batch_write(table_name=TABLE_NAME, items=items)
+    items = db_operations.parallel_scan_table(table_name=TABLE_NAME, scan_kwargs={'Limit': 10}, total_segments=1)
+    assert sorted(int(item['Id']) for item in items) == list(range(100))
+    assert db_operations.parallel_scan_table(table_name='not_exists') == []
+
+
+@mock_iam
+@mock_dynamodb
+def test_parallel_scan_table():
+    """
+    This method tests the table segments are scanned concurrently
+    @return:
+    """
+    db_operations = DynamoDbOperations(region_name=REGION_NAME)
+
+    def scan_segment(self, table, scan_kwargs: dict):
+        assert scan_kwargs['Limit'] == 10
+        return [{'Id': str(index)} for index in range(100)
+                if index % scan_kwargs['TotalSegments'] == scan_kwargs['Segment']]
+
+    with patch.object(DynamoDbOperations, '_DynamoDbOperations__scan_segment', scan_segment):
+        items = db_operations.parallel_scan_table(table_name=TABLE_NAME, scan_kwargs={'Limit': 10})
+    assert sorted(int(item['Id']) for item in items) == list(range(100))
@@ -1,11 +1,16 @@
 import datetime
+import json
 
 import boto3
+import pytest
 import tempfile
 import os
 from os import listdir
 from os.path import isfile, join
+from unittest.mock import patch
+
 from cloud_governance.common.clouds.aws.s3.s3_operations import S3Operations
+from cloud_governance.common.clouds.aws.s3.s3_stream_writer import S3StreamWriter
 # walk around for moto DeprecationWarning
 import warnings
 
@@ -236,3 +241,54 @@ def test_get_last_s3_policy_content():
     key_prefix = f'tests/{region_name}/instance-run/{current_date}'
     s3_operations = S3Operations(region_name=region_name, bucket=bucket_name, logs_bucket_key='tests')
     assert s3_operations.get_last_s3_policy_content(policy='instance-run', file_name='resources.json', key_prefix=key_prefix)
+
+
+@mock_s3
+def test_upload_gzip_json():
+    """ This test for testing the gzip json is streamed to s3 in multiple parts"""
+    s3_client = boto3.client('s3', region_name='us-east-1')
+    s3_client.create_bucket(Bucket='ais-server')
+    s3operations = S3Operations(region_name='us-east-1')
+    policy_result = [{'ResourceId': os.urandom(16).hex(), 'Tags': {'Payload': os.urandom(64).hex()}} for _ in range(120000)]
+    with patch.object(S3StreamWriter, 'PART_SIZE', 5 * 1024 * 1024):
+        s3operations.upload_gzip_json(data=policy_result, bucket='ais-server', key='test-data/resources.json.gz')
+    # multipart uploads have the number of parts in the ETag
+    assert '-' in s3_client.head_object(Bucket='ais-server', Key='test-data/resources.json.gz')['ETag']
+    with s3operations.open_gzip_object(bucket='ais-server', key='test-data/resources.json.gz') as policy_file:
+        assert json.load(policy_file) == policy_result
+
+
+@mock_s3
+def test_upload_gzip_json_abort():
+    """ This test for testing nothing is uploaded when the json encoding fails"""
+    s3_client = boto3.client('s3', region_name='us-east-1')
+    s3_client.create_bucket(Bucket='ais-server')
+    s3operations = S3Operations(region_name='us-east-1')
+    with pytest.raises(TypeError):
+        s3operations.upload_gzip_json(data=[{'ResourceId': 'i-123'}, object()], bucket='ais-server',
+                                      key='test-data/resources.json.gz')
+    assert not s3operations.file_exist(bucket='ais-server', key='test-data', file_name='resources.json.gz')
+
+
+@mock_s3
+def test_download_objects_paginated_skip_unchanged():
+    """ This test for testing all the pages are downloaded and the unchanged files are skipped"""
+    s3_client = boto3.client('s3', region_name='us-east-1')
+    s3_client.create_bucket(Bucket='ais-server')
+    expected_files_list = [f'file{index}.txt' for index in range(1005)]
+    for file_name in expected_files_list:
+        s3_client.put_object(Bucket='ais-server', Key=f'test-data/{file_name}', Body=file_name)
+    s3operations = S3Operations(region_name='us-east-1')
+    with tempfile.TemporaryDirectory() as temp_local_directory:
+        s3operations.download_objects(s3_target='ais-server/test-data', local_source=temp_local_directory)
+        assert sorted(listdir(temp_local_directory)) == sorted(expected_files_list)
+        with open(os.path.join(temp_local_directory, expected_files_list[0]), 'w') as f:
+            f.write('changed')
+        with patch.object(s3operations._S3Operations__s3_client, 'get_object',
+                          wraps=s3operations._S3Operations__s3_client.get_object) as get_object:
+            s3operations.upload_objects(local_source=temp_local_directory, s3_target='ais-server/test-data',
+                                        skip_unchanged=True)
+            s3operations.download_objects(s3_target='ais-server/test-data', local_source=temp_local_directory,
+                                          skip_unchanged=True)
+            assert get_object.call_count == 0
+    assert s3_client.get_object(Bucket='ais-server', Key=f'test-data/{expected_files_list[0]}')['Body'].read() == b'changed'
@@ -0,0 +1,95 @@
+import io
+import time
+
+from botocore.awsrequest import AWSResponse
+from moto import mock_ec2
+
+from cloud_governance.common.clouds.aws.utils.aws_api_monitor import AWSApiMonitor
+from cloud_governance.common.clouds.aws.utils.common_methods import get_boto3_client
+from cloud_governance.main.environment_variables import environment_variables
+
+THROTTLING_RESPONSE = (b'<Response><Errors><Error><Code>Throttling</Code><Message>Rate exceeded</Message></Error>'
+                       b'</Errors><RequestID>1</RequestID></Response>')
+
+
+class RawResponse(io.BytesIO):
+
+    def stream(self, **kwargs):
+        yield self.getvalue()
+
+
+@mock_ec2
+def test_aws_api_monitor_counts_calls():
+    """
+    This method tests the calls and latency are counted per api operation
+    :return:
+    """
+    ec2_client = get_boto3_client('ec2', region_name='us-east-1')
+    for _ in range(3):
+        ec2_client.describe_instances()
+    ec2_client.describe_regions()
+    summary = AWSApiMonitor.get_summary()
+    assert summary['ec2.DescribeInstances']['calls'] == 3
+    assert summary['ec2.DescribeInstances']['errors'] == 0
+    assert summary['ec2.DescribeInstances']['total_latency'] > 0
+    assert summary['ec2.DescribeRegions']['calls'] == 1
+
+
+@mock_ec2
+def test_aws_api_monitor_counts_throttles():
+    """
+    This method tests the throttled calls are retried and counted
+    :return:
+    """
+    ec2_client = get_boto3_client('ec2', region_name='us-east-1')
+    throttled_responses = [AWSResponse(url='', status_code=400, headers={}, raw=RawResponse(THROTTLING_RESPONSE))]
+
+    def throttle_first_request(**kwargs):
+        if throttled_responses:
+            return throttled_responses.pop()
+
+    ec2_client.meta.events.register_first('before-send.ec2.DescribeRegions', throttle_first_request)
+    assert ec2_client.describe_regions()['Regions']
+    summary = AWSApiMonitor.get_summary()
+    assert summary['ec2.DescribeRegions']['throttles'] == 1
+    assert summary['ec2.DescribeRegions']['retries'] == 1
+    assert summary['ec2.DescribeRegions']['calls'] == 1
+
+
+@mock_ec2
+def test_aws_api_monitor_rate_limit():
+    """
+    This method tests the calls of a rate limited service are spaced by its rate limit
+    :return:
+    """
+    rate_limits = environment_variables.environment_variables_dict.get('AWS_API_RATE_LIMITS')
+    environment_variables.environment_variables_dict['AWS_API_RATE_LIMITS'] = {'ec2': 10}
+    try:
+        ec2_client = get_boto3_client('ec2', region_name='us-east-1')
+        start_time = time.monotonic()
+        for _ in range(5):
+            ec2_client.describe_regions()
+        assert time.monotonic() - start_time >= 0.4
+    finally:
+        environment_variables.environment_variables_dict['AWS_API_RATE_LIMITS'] = rate_limits
+
+
+@mock_ec2
+def test_aws_api_monitor_rate_limit_per_region():
+    """
+    This method tests the rate limit of a service applies per region
+    :return:
+    """
+    rate_limits = environment_variables.environment_variables_dict.get('AWS_API_RATE_LIMITS')
+    environment_variables.environment_variables_dict['AWS_API_RATE_LIMITS'] = {'ec2': 5}
+    try:
+        ec2_clients = [get_boto3_client('ec2', region_name=region_name)
+                       for region_name in ['us-east-1', 'us-west-2', 'eu-west-1']]
+        start_time = time.monotonic()
+        for _ in range(3):
+            for ec2_client in ec2_clients:
+                ec2_client.describe_regions()
+        elapsed_time = time.monotonic() - start_time
+        assert 0.4 <= elapsed_time < 1.0
+    finally:
+        environment_variables.environment_variables_dict['AWS_API_RATE_LIMITS'] = rate_limits
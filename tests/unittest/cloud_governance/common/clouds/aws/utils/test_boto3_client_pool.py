@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from botocore.config import Config
+from botocore.exceptions import InvalidRegionError
+
+from cloud_governance.common.clouds.aws.cloudtrail.cloudtrail_operations import CloudTrailOperations
+from cloud_governance.common.clouds.aws.utils.boto3_client_pool import Boto3ClientPool
+from cloud_governance.common.clouds.aws.utils.common_methods import get_boto3_client
+
+
+def test_get_boto3_client_shared():
+    """
+    This method tests the client is created once per service, region and credentials
+    :return:
+    """
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        clients = list(executor.map(lambda _: get_boto3_client('ec2', region_name='us-east-1'), range(20)))
+    assert len({id(client) for client in clients}) == 1
+    assert get_boto3_client('ec2', region_name='us-east-2') is not clients[0]
+    assert get_boto3_client('ec2', region_name='us-east-1', aws_access_key_id='key',
+                            aws_secret_access_key='secret') is not clients[0]
+
+
+def test_get_boto3_client_config():
+    """
+    This method tests the pooled clients use the tuned config and merge the caller config
+    :return:
+    """
+    client = get_boto3_client('s3', region_name='us-east-1', config=Config(read_timeout=5))
+    assert client.meta.config.max_pool_connections == 50
+    assert client.meta.config.retries.get('mode') == 'adaptive'
+    assert client.meta.config.tcp_keepalive
+    assert client.meta.config.read_timeout == 5
+    Boto3ClientPool.clear()
+    assert get_boto3_client('s3', region_name='us-east-1').meta.config.read_timeout == 60
+
+
+def test_client_initialization_error_raised():
+    """
+    This method tests the client initialization errors are raised to the pooled clients callers
+    :return:
+    """
+    with pytest.raises(InvalidRegionError):
+        CloudTrailOperations(region_name='mock region!')
+    assert get_boto3_client('ec2', region_name='mock region!') is None
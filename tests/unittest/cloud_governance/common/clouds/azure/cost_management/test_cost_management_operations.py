@@ -0,0 +1,86 @@
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, Mock
+
+from azure.core.exceptions import HttpResponseError
+from azure.mgmt.costmanagement import CostManagementClient
+from azure.mgmt.costmanagement.models import QueryResult
+
+from cloud_governance.common.clouds.azure.cost_management.cost_management_operations import CostManagementOperations
+from cloud_governance.common.clouds.azure.subscriptions.azure_operations import AzureOperations
+
+
+def get_throttled_error(retry_after: str):
+    """
+    This method returns the throttled HttpResponseError with the rate limit headers
+    :param retry_after:
+    :type retry_after:
+    :return:
+    :rtype:
+    """
+    response = Mock(status_code=429, reason='Too many requests',
+                    headers={'x-ms-ratelimit-microsoft.costmanagement-qpu-retry-after': retry_after})
+    return HttpResponseError(message='Too many requests', response=response)
+
+
+def test_get_usage__retry_after_and_cache():
+    """
+    This method tests get_usage waits for the Retry-After header on throttling and caches the identical queries
+    :return:
+    :rtype:
+    """
+    mock_query = Mock()
+    mock_query.usage.side_effect = [get_throttled_error(retry_after='17'),
+                                    QueryResult(columns=[], rows=[[10, '2024-01-01T00:00:00']])]
+    with patch.object(AzureOperations, '_AzureOperations__get_subscription_id', return_value=('', '')), \
+            patch('time.sleep') as mock_sleep:
+        cost_management_operations = CostManagementOperations()
+        cost_management_operations.azure_operations.cost_mgmt_client = Mock(spec=CostManagementClient,
+                                                                            query=mock_query)
+        start_date, end_date = datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 31)
+        response = cost_management_operations.get_usage(scope='subscriptions/mock-retry', start_date=start_date,
+                                                        end_date=end_date)
+        cached_response = cost_management_operations.get_usage(scope='subscriptions/mock-retry',
+                                                               start_date=start_date, end_date=end_date)
+    assert response['rows'] == cached_response['rows'] == [[10, '2024-01-01T00:00:00']]
+    assert mock_query.usage.call_count == 2
+    mock_sleep.assert_called_once_with(17)
+
+
+def test_get_forecast__dimensions_filter_and_in_flight_queries():
+    """
+    This method tests the forecast queries are filtered by the dimensions and the identical in-flight queries
+    are sent once
+    :return:
+    :rtype:
+    """
+    release = threading.Event()
+    queried_filters = []
+
+    def mock_usage(scope: str, parameters: dict):
+        queried_filters.append(parameters['dataset'].get('filter'))
+        release.wait(timeout=5)
+        return QueryResult(columns=[], rows=[[10, '2024-01-01T00:00:00', 'Actual']])
+
+    mock_forecast = Mock()
+    mock_forecast.usage.side_effect = mock_usage
+    with patch.object(AzureOperations, '_AzureOperations__get_subscription_id', return_value=('', '')):
+        cost_management_operations = CostManagementOperations()
+        cost_management_operations.azure_operations.cost_mgmt_client = Mock(spec=CostManagementClient,
+                                                                            forecast=mock_forecast)
+        start_date, end_date = datetime.datetime(2024, 1, 1), datetime.datetime(2024, 12, 31)
+        subscription_ids = ['mock-1', 'mock-2', 'mock-1', 'mock-1']
+        with ThreadPoolExecutor(max_workers=len(subscription_ids)) as executor:
+            futures = [executor.submit(cost_management_operations.get_forecast, scope='billingAccounts/mock-flight',
+                                       start_date=start_date, end_date=end_date,
+                                       dimensions={'SubscriptionId': [subscription_id]})
+                       for subscription_id in subscription_ids]
+            time.sleep(0.2)
+            release.set()
+            responses = [future.result() for future in futures]
+    assert mock_forecast.usage.call_count == 2
+    assert sorted(query_filter['dimensions']['values'][0] for query_filter in queried_filters) == ['mock-1', 'mock-2']
+    assert all(query_filter['dimensions']['name'] == 'SubscriptionId' for query_filter in queried_filters)
+    assert all(response['rows'] == [[10, '2024-01-01T00:00:00', 'Actual']] for response in responses)
@@ -0,0 +1,86 @@
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+from cloud_governance.common.clouds.cloudability.cloudability_operations import CloudabilityOperations
+from cloud_governance.common.utils.api_requests import APIRequests
+from cloud_governance.main.environment_variables import environment_variables
+
+
+def mock_get(url: str, headers: dict):
+    """
+    This method mocks the cloudability reports api, each report has 2 pages
+    :param url:
+    :param headers:
+    :return:
+    """
+    assert headers['apptio-opentoken'] == 'mock-token'
+    query = parse_qs(urlparse(url).query)
+    result = {'start_date': query['start_date'][0], 'end_date': query['end_date'][0],
+              'filters': query.get('filters', [''])[0]}
+    if 'token' in query:
+        return {'results': [{**result, 'page': 2}]}
+    return {'results': [{**result, 'page': 1}], 'pagination': {'next': 'page-2'}}
+
+
+def get_cost_reports(**kwargs):
+    """
+    This method returns the mocked cost reports and the mocked api calls
+    :return:
+    """
+    login_response = MagicMock(ok=True, headers={'apptio-opentoken': 'mock-token'})
+    with patch.object(APIRequests, 'post', return_value=login_response) as post, \
+            patch.object(APIRequests, 'get', side_effect=mock_get) as get:
+        return CloudabilityOperations().get_cost_reports(**kwargs), post, get
+
+
+def test_get_cost_reports(tmp_path):
+    """
+    This method tests the monthly queries of each filter are fetched with all their pages and the token is reused
+    :return:
+    """
+    cache_dir = environment_variables.environment_variables_dict.get('CLOUDABILITY_CACHE_DIR')
+    environment_variables.environment_variables_dict['CLOUDABILITY_CACHE_DIR'] = str(tmp_path)
+    CloudabilityOperations.clear_appito_token()
+    try:
+        results, post, get = get_cost_reports(dimensions='date,vendor', start_date='2023-11-15',
+                                              end_date=date(2024, 2, 10),
+                                              custom_filters=['filters=category4==1', 'filters=category4==2'])
+        assert post.call_count == 1
+        assert get.call_count == 16
+        assert [(result['start_date'], result['end_date']) for result in results if result['page'] == 1][:4] == \
+               [('2023-11-15', '2023-11-30'), ('2023-12-01', '2023-12-31'), ('2024-01-01', '2024-01-31'),
+                ('2024-02-01', '2024-02-10')]
+        assert sorted({result['filters'] for result in results}) == ['category4==1', 'category4==2']
+        assert len(results) == 16
+        # the settled months are read from the cache
+        cached_results, post, get = get_cost_reports(dimensions='date,vendor', start_date='2023-11-15',
+                                                     end_date=date(2024, 2, 10),
+                                                     custom_filters=['filters=category4==1', 'filters=category4==2'])
+        assert cached_results == results
+        assert post.call_count == 0
+        assert get.call_count == 0
+    finally:
+        environment_variables.environment_variables_dict['CLOUDABILITY_CACHE_DIR'] = cache_dir
+        CloudabilityOperations.clear_appito_token()
+
+
+def test_get_cost_reports_current_month_not_cached(tmp_path):
+    """
+    This method tests the reports which can still change are not cached and the range is not split without date
+    :return:
+    """
+    cache_dir = environment_variables.environment_variables_dict.get('CLOUDABILITY_CACHE_DIR')
+    environment_variables.environment_variables_dict['CLOUDABILITY_CACHE_DIR'] = str(tmp_path)
+    CloudabilityOperations.clear_appito_token()
+    try:
+        end_date = datetime.now(timezone.utc).date()
+        start_date = end_date - timedelta(days=60)
+        for _ in range(2):
+            results, _, get = get_cost_reports(dimensions='vendor', start_date=start_date, end_date=end_date)
+            assert get.call_count == 2
+            assert [result['page'] for result in results] == [1, 2]
+        assert not list(tmp_path.iterdir())
+    finally:
+        environment_variables.environment_variables_dict['CLOUDABILITY_CACHE_DIR'] = cache_dir
+        CloudabilityOperations.clear_appito_token()
@@ -0,0 +1,51 @@
+from unittest.mock import Mock
+
+import pyarrow
+from google.api_core.exceptions import Forbidden
+
+from cloud_governance.common.clouds.gcp.google_account import GoogleAccount
+
+MOCK_ROWS = [{'month': '202401', 'cost': 1.5}, {'month': '202402', 'cost': 2.0}]
+
+
+def get_mock_google_account(to_arrow):
+    """
+    This method returns the GoogleAccount with a mock BigQuery client, the query results are read with to_arrow
+    :param to_arrow:
+    :return:
+    """
+    query_job = Mock()
+    query_job.result.return_value.to_arrow.side_effect = to_arrow
+    google_account = GoogleAccount()
+    google_account._GoogleAccount__client = Mock()
+    google_account._GoogleAccount__client.query.return_value = query_job
+    return google_account, query_job
+
+
+def test_query_list_arrow():
+    """
+    This method tests the query rows are read through arrow with the BigQuery Storage API
+    :return:
+    """
+    google_account, query_job = get_mock_google_account(to_arrow=lambda **kwargs: pyarrow.Table.from_pylist(MOCK_ROWS))
+    assert google_account.query_list(['SELECT 1', 'SELECT 2']) == [MOCK_ROWS, MOCK_ROWS]
+    assert query_job.result.call_count == 2
+    for call in query_job.result.return_value.to_arrow.call_args_list:
+        assert call.kwargs == {'create_bqstorage_client': True}
+
+
+def test_query_list_rest_fallback():
+    """
+    This method tests the query rows are read through REST when the BigQuery Storage API fails
+    :return:
+    """
+    def to_arrow(create_bqstorage_client: bool):
+        if create_bqstorage_client:
+            raise Forbidden('bigquery.readsessions.create permission denied')
+        return pyarrow.Table.from_pylist(MOCK_ROWS)
+
+    google_account, query_job = get_mock_google_account(to_arrow=to_arrow)
+    assert google_account.query_list(['SELECT 1']) == [MOCK_ROWS]
+    assert query_job.result.call_count == 1
+    assert [call.kwargs for call in query_job.result.return_value.to_arrow.call_args_list] == [
+        {'create_bqstorage_client': True}, {'create_bqstorage_client': False}]
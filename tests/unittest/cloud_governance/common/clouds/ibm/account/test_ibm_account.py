@@ -0,0 +1,114 @@
+import os
+import time
+from unittest.mock import patch
+
+import pandas as pd
+from SoftLayer import BaseClient
+
+from cloud_governance.common.clouds.ibm.account.ibm_account import IBMAccount
+from cloud_governance.common.ldap.ldap_search import LdapSearch
+from cloud_governance.main.environment_variables import environment_variables
+
+environment_variables.environment_variables_dict['IBM_API_USERNAME'] = '1234_mock_user'
+environment_variables.environment_variables_dict['IBM_API_KEY'] = 'mock_api_key'
+
+MOCK_INVOICES = [
+    {'id': 1, 'typeCode': 'RECURRING', 'itemCount': 250},
+    {'id': 2, 'typeCode': 'ONE-TIME-CHARGE', 'itemCount': 10},
+    {'id': 3, 'typeCode': 'RECURRING', 'itemCount': 1},
+]
+
+
+def mock_invoice_item(invoice_id: int, item_id: int):
+    if item_id % 2:
+        return {'id': item_id, 'parentId': item_id - 1, 'recurringFee': '1.5', 'invoiceId': invoice_id,
+                'description': f'Storage for mockuser{item_id % 3} node', 'categoryCode': 'storage'}
+    return {'id': item_id, 'recurringFee': '1', 'invoiceId': invoice_id, 'description': 'Bare metal server',
+            'hostName': f'host{item_id}', 'domainName': 'example.com', 'categoryCode': 'server'}
+
+
+def mock_call(cls, service, method, *args, **kwargs):
+    if service == 'SoftLayer_Account' and method == 'getUsers':
+        return [{'email': 'mockuser1@example.com'}, {'email': 'mockuser12@example.com'},
+                {'email': 'mockuser2@example.com'}]
+    if service == 'SoftLayer_Account' and method == 'getInvoices':
+        assert 'itemCount' in kwargs.get('mask')
+        return MOCK_INVOICES
+    if service == 'SoftLayer_Billing_Invoice' and method == 'getItems':
+        assert not kwargs.get('iter')
+        invoice = [invoice for invoice in MOCK_INVOICES if invoice['id'] == kwargs['id']][0]
+        assert invoice['typeCode'] == 'RECURRING'
+        end = min(kwargs['offset'] + kwargs['limit'], invoice['itemCount'])
+        return [mock_invoice_item(invoice['id'], invoice['id'] * 1000 + item_id)
+                for item_id in range(kwargs['offset'], end)]
+    raise AssertionError(f'Unexpected call: {service}.{method}')
+
+
+@patch.object(BaseClient, 'call', mock_call)
+def test_get_monthly_invoices():
+    """
+    This method tests all the pages of the recurring invoices items are fetched
+    @return:
+    """
+    invoice_data = IBMAccount().get_monthly_invoices(month=1, year=2024)
+    assert sorted(invoice_data) == [1, 3]
+    assert [item['id'] for item in invoice_data[1]] == list(range(1000, 1250))
+    assert len(invoice_data[3]) == 1
+
+
+def test_get_users_pattern():
+    """
+    This method tests the users regex finds the longest user name
+    @return:
+    """
+    users_pattern = IBMAccount.get_users_pattern(['mockuser1', 'mockuser12', 'mock.user', ''])
+    assert users_pattern.search('Storage for mockuser12 node').group() == 'mockuser12'
+    assert users_pattern.search('host-mock.user.example.com').group() == 'mock.user'
+    assert not users_pattern.search('mockuserx')
+    assert IBMAccount.get_users_pattern([]) is None
+
+
+@patch.object(BaseClient, 'call', mock_call)
+def test_get_invoice_data():
+    """
+    This method tests the invoice items are aggregated by the hostname or the user
+    @return:
+    """
+    invoice_data, users = IBMAccount().get_invoice_data(month=1, year=2024)
+    assert users == ['mockuser1', 'mockuser12', 'mockuser2']
+    assert invoice_data['host3000.example.com']['cost'] == 1
+    assert invoice_data['host1004.example.com']['cost'] == 2.5
+    assert invoice_data['mockuser1-storage-for']['cost'] == 105
+    assert invoice_data['mockuser2-storage-for']['cost'] == 105
+    assert sum(data['cost'] for data in invoice_data.values()) == 313.5
+
+
+def test_get_user_tags_from_gsheet(tmp_path):
+    """
+    This method tests the user tags sheet is parsed once and reloaded when the file changes
+    @return:
+    """
+    file_name = tmp_path / 'mock-account.csv'
+    file_name.write_text('User,_Email,Project,Environment\n'
+                         '1234_mockuser@redhat.com,mockuser@redhat.com,cloud/governance,\n')
+    environment_variables.environment_variables_dict['account'] = 'mock-account'
+    IBMAccount.clear_user_tags_sheets()
+    ibm_account = IBMAccount()
+    with patch('cloud_governance.common.clouds.ibm.account.ibm_account.pd.read_csv', wraps=pd.read_csv) as read_csv, \
+            patch.object(LdapSearch, 'get_user_details', return_value={}):
+        for _ in range(3):
+            assert ibm_account.get_user_tags_from_gsheet(username='1234_mockuser@redhat.com',
+                                                         file_path=str(tmp_path)) == ['project:cloud-governance',
+                                                                                      'user:mockuser']
+        assert sorted(ibm_account.get_user_tags_from_gsheet(username='mockuser@redhat.com', user_email='yes',
+                                                            file_path=str(tmp_path))) == ['project:cloud-governance',
+                                                                                         'user:mockuser']
+        assert ibm_account.get_user_tags_from_gsheet(username='1234_unknown@redhat.com',
+                                                     file_path=str(tmp_path)) == ['user:unknown']
+        assert read_csv.call_count == 1
+        file_name.write_text('User,_Email,Project\n1234_mockuser@redhat.com,mockuser@redhat.com,new\n')
+        os.utime(file_name, (time.time() + 10, time.time() + 10))
+        assert IBMAccount().get_user_tags_from_gsheet(username='1234_mockuser@redhat.com',
+                                                      file_path=str(tmp_path)) == ['project:new', 'user:mockuser']
+        assert read_csv.call_count == 2
+    IBMAccount.clear_user_tags_sheets()
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from SoftLayer import BaseClient
+
+from cloud_governance.common.clouds.ibm.classic.classic_operations import ClassicOperations
+from cloud_governance.main.environment_variables import environment_variables
+
+environment_variables.environment_variables_dict['IBM_API_USERNAME'] = '1234_mock_user'
+environment_variables.environment_variables_dict['IBM_API_KEY'] = 'mock_api_key'
+
+MOCK_DEVICES = [
+    {
+        'id': 101, 'hostname': 'test-bm', 'domain': 'example.com', 'fullyQualifiedDomainName': 'test-bm.example.com',
+        'tagReferences': [{'tag': {'name': 'user:mock '}}, {'tag': {'name': 'project:test'}}],
+        'billingItem': {'orderItem': {'order': {'userRecord': {'username': 'mock_user'}}}}
+    },
+    {
+        'id': 102, 'hostname': 'test-no-order', 'domain': 'example.com',
+        'fullyQualifiedDomainName': 'test-no-order.example.com'
+    }
+]
+
+
+def mock_call(cls, service, method, *args, **kwargs):
+    if service == 'Account' and method in ('getHardware', 'getVirtualGuests'):
+        assert 'tagReferences' in kwargs.get('mask')
+        return iter(MOCK_DEVICES)
+    raise AssertionError(f'Unexpected call: {service}.{method}')
+
+
+@patch.object(BaseClient, 'call', mock_call)
+def test_get_hardware_details():
+    """
+    This method tests the hardware details are fetched in a single object mask call
+    :return:
+    """
+    classic_operations = ClassicOperations()
+    hardwares = classic_operations.get_hardware_details()
+    assert hardwares[0] == {'id': '101', 'hostname': 'test-bm', 'name': 'test-bm.example.com',
+                            'fqdn': 'test-bm.example.com', 'username': 'mock_user',
+                            'tags': ['user:mock', 'project:test']}
+    assert hardwares[1]['username'] == '' and hardwares[1]['tags'] == []
+
+
+@patch.object(BaseClient, 'call', mock_call)
+def test_get_virtual_machine_details():
+    """
+    This method tests the virtual machine details are fetched in a single object mask call
+    :return:
+    """
+    classic_operations = ClassicOperations()
+    vms = classic_operations.get_virtual_machine_details()
+    assert len(vms) == 2
+    assert vms[0]['username'] == 'mock_user'
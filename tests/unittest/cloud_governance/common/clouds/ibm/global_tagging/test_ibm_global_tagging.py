@@ -1,6 +1,12 @@
+from unittest.mock import patch
+
+from ibm_platform_services import GlobalSearchV2
+from ibm_platform_services.global_tagging_v1 import GlobalTaggingV1
+
 from cloud_governance.common.clouds.ibm.tagging.global_tagging_operations import GlobalTaggingOperations
 from cloud_governance.main.environment_variables import environment_variables
-from tests.unittest.mocks.ibm.mock_ibm_global_tagging import mock_ibm_global_tagging
+from tests.unittest.mocks.ibm.mock_ibm_global_tagging import mock_ibm_global_tagging, MockGlobalTaggingV1, \
+    MockGlobalSearchV2
 
 environment_variables.IBM_CLOUD_API_KEY = 'mock_ibm_api_key'
 environment_variables.IBM_ACCOUNT_ID = "test"
@@ -17,3 +23,21 @@ def test_update_tags():
     tags = ["cost-center: test"]
     response = global_tagging_operations.update_tags(resources_crn=crns, tags=tags)
     assert response[0]
+
+
+def test_update_tags_skip_tagged_and_retry_failed():
+    """
+    This method tests update_tags skips the already tagged resources and retries only the failed crns
+    :return:
+    """
+    mock_global_tagging = MockGlobalTaggingV1()
+    mock_global_tagging.resources = {'tagged-crn': ['cost-center:test']}
+    mock_global_tagging.failures = {'failed-once-crn': 1}
+    with patch.object(GlobalTaggingV1, 'attach_tag', mock_global_tagging.attach_tag), \
+            patch.object(GlobalSearchV2, 'search', MockGlobalSearchV2(mock_global_tagging).search):
+        global_tagging_operations = GlobalTaggingOperations()
+        crns = ['tagged-crn', 'failed-once-crn'] + [f'crn-{idx}' for idx in range(250)]
+        ok, errors = global_tagging_operations.update_tags(resources_crn=crns, tags=["cost-center: test"])
+    assert ok
+    assert not errors
+    assert len(mock_global_tagging.resources) == len(crns)
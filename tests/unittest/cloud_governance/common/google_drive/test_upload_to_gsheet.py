@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+from cloud_governance.common.google_drive.google_drive_operations import GoogleDriveOperations
+from cloud_governance.common.google_drive.upload_to_gsheet import UploadToGsheet
+
+
+def mock_download_spreadsheet(self, spreadsheet_id: str, sheet_name: str, file_path: str):
+    with open(f'{file_path}/{sheet_name}.csv', 'w') as sheet_file:
+        sheet_file.write('AccountId,CostCenter,Budget,Year,Owner\n')
+        sheet_file.write('012345678901,100,"1,000",2023,owner1\n')
+        sheet_file.write('subscription-id,200,500,2023,owner2\n')
+
+
+def test_get_cost_center_budget_details():
+    """
+    This method tests the accounts sheet is downloaded once and looked up by AccountId
+    :return:
+    """
+    UploadToGsheet.clear_accounts_table()
+    with patch.object(GoogleDriveOperations, 'download_spreadsheet', autospec=True,
+                      side_effect=mock_download_spreadsheet) as download_spreadsheet:
+        upload_to_gsheet = UploadToGsheet()
+        assert upload_to_gsheet.get_cost_center_budget_details(account_id='012345678901') == (100, 1000, '2023', 'owner1')
+        assert UploadToGsheet().get_cost_center_budget_details(account_id='subscription-id') == (200, 500, '2023', 'owner2')
+        assert upload_to_gsheet.get_cost_center_budget_details(account_id='unknown') == (0, 0, '', 'Others')
+        assert download_spreadsheet.call_count == 1
+    UploadToGsheet.clear_accounts_table()
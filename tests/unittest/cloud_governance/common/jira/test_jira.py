@@ -0,0 +1,34 @@
+import asyncio
+from unittest.mock import patch, MagicMock
+
+from cloud_governance.common.jira.jira import Jira
+
+
+def test_get_tickets_bounded_concurrency():
+    """
+    This method verifies get_tickets fetch all tickets over one session without exceeding the concurrency
+    :return:
+    """
+    loop = asyncio.new_event_loop()
+    jira = Jira(url='https://mock.jira', username='mock', ticket_queue='MOCK', token='mock', loop=loop)
+    sessions = []
+    running = {'current': 0, 'max': 0}
+
+    async def mock_get_ticket(ticket, session=None):
+        sessions.append(session)
+        running['current'] += 1
+        running['max'] = max(running['max'], running['current'])
+        await asyncio.sleep(0.01)
+        running['current'] -= 1
+        return {'key': f'MOCK-{ticket}'}
+
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    with patch.object(jira, 'get_ticket', mock_get_ticket), patch.object(jira, 'create_session', return_value=session):
+        result = loop.run_until_complete(jira.get_tickets(tickets=[str(ticket) for ticket in range(20)],
+                                                          max_concurrency=3))
+    loop.close()
+    assert result['7'] == {'key': 'MOCK-7'}
+    assert len(result) == 20
+    assert running['max'] == 3
+    assert set(sessions) == {session}
@@ -0,0 +1,56 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from cloud_governance.common.jira.jira_cache import JiraCache
+
+
+def test_jira_cache_bulk_put_get(tmp_path):
+    """
+    This method verifies descriptions are saved and returned in bulk and persist across instances
+    :return:
+    """
+    opened_date = datetime(2023, 5, 1, 10, 20, 30)
+    JiraCache(cache_directory=str(tmp_path), ttl=3600).put_many(descriptions={
+        '1': {'Days': '5', 'JiraStatus': 'In Progress', 'TicketOpenedDate': opened_date},
+        '2': {'Days': '2', 'JiraStatus': 'Refinement', 'TicketOpenedDate': opened_date}})
+    result = JiraCache(cache_directory=str(tmp_path), ttl=3600).get_many(ticket_ids=['1', '2', '3'])
+    assert sorted(result) == ['1', '2']
+    assert result['1']['TicketOpenedDate'] == opened_date
+    assert result['2']['Days'] == '2'
+
+
+def test_jira_cache_ttl(tmp_path):
+    """
+    This method verifies expired descriptions are not returned
+    :return:
+    """
+    jira_cache = JiraCache(cache_directory=str(tmp_path), ttl=60)
+    with patch('cloud_governance.common.jira.jira_cache.time.time', return_value=1000):
+        jira_cache.put(ticket_id='1', description={'Days': '5', 'JiraStatus': 'In Progress'})
+    with patch('cloud_governance.common.jira.jira_cache.time.time', return_value=1030):
+        assert jira_cache.get(ticket_id='1')
+    with patch('cloud_governance.common.jira.jira_cache.time.time', return_value=1100):
+        assert not jira_cache.get(ticket_id='1')
+
+
+def test_jira_cache_invalidate_changed_status(tmp_path):
+    """
+    This method verifies descriptions are dropped when the jira status changes
+    :return:
+    """
+    jira_cache = JiraCache(cache_directory=str(tmp_path), ttl=3600)
+    jira_cache.put_many(descriptions={'1': {'JiraStatus': 'In Progress'}, '2': {'JiraStatus': 'In Progress'},
+                                      '3': {'JiraStatus': 'New'}})
+    jira_cache.invalidate_changed_status(ticket_statuses={'1': 'In Progress', '2': 'Closed'})
+    jira_cache.invalidate(ticket_ids=['3'])
+    assert list(jira_cache.get_many(ticket_ids=['1', '2', '3'])) == ['1']
+
+
+def test_jira_cache_disabled():
+    """
+    This method verifies the cache is a no-op without a cache directory
+    :return:
+    """
+    jira_cache = JiraCache(cache_directory='', ttl=3600)
+    jira_cache.put(ticket_id='1', description={'JiraStatus': 'In Progress'})
+    assert jira_cache.get_many(ticket_ids=['1']) == {}
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+from cloud_governance.common.jira.jira_operations import JiraOperations
+from cloud_governance.main.environment_variables import environment_variables
+
+MOCK_ISSUES = {
+    '1': {'fields': {'subtasks': [
+        {'key': 'MOCK-2', 'fields': {'summary': 'Budget Extension', 'status': {'name': 'In Progress'}}},
+        {'key': 'MOCK-3', 'fields': {'summary': 'Duration Extension', 'status': {'name': 'New'}}},
+        {'key': 'MOCK-4', 'fields': {'summary': 'Duration Extension', 'status': {'name': 'Closed'}}}]}},
+    '5': {'fields': {'subtasks': []}}
+}
+
+
+def test_extend_tickets_by_tickets_share_issues():
+    """
+    This method verifies the budget and duration extension tickets are built from the issues fetched once
+    :return:
+    """
+    environment_variables_dict = environment_variables.environment_variables_dict
+    environment_variables_dict['JIRA_TOKEN'] = '123456mock'
+    jira_operations = JiraOperations()
+    with patch.object(JiraOperations, 'get_issues', return_value=MOCK_ISSUES) as get_issues:
+        issues = jira_operations.get_issues(ticket_ids=['1', '5'])
+        budget_extend_tickets = jira_operations.get_budget_extend_tickets_by_tickets(
+            ticket_ids=['1', '5'], ticket_state='inprogress', issues=issues)
+        duration_extend_tickets = jira_operations.get_duration_extend_tickets_by_tickets(
+            ticket_ids=['1', '5'], ticket_state='new', issues=issues)
+        assert get_issues.call_count == 1
+        assert budget_extend_tickets == {'1': ['2'], '5': []}
+        assert duration_extend_tickets == {'1': ['3'], '5': []}
+        assert jira_operations.get_budget_extend_tickets_by_tickets(ticket_ids=['1', '5'],
+                                                                    ticket_state='inprogress') == budget_extend_tickets
+        assert get_issues.call_count == 2
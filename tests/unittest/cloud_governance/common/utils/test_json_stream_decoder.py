@@ -0,0 +1,39 @@
+import io
+import json
+
+import pytest
+
+from cloud_governance.common.utils.json_stream_decoder import JsonStreamDecoder
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 0])
+def test_decode_stream_array(chunk_size: int):
+    """
+    This method tests the array items are decoded one by one across the chunks
+    :return:
+    """
+    data = [{'InstanceId': f'i-{index}', 'Tags': [{'Key': 'User', 'Value': ']["'}]} for index in range(50)]
+    data.extend([12345, -1.5e3, 1e-7, 'a,]b', None, True, [], {}])
+    for indent in (None, 2):
+        items = JsonStreamDecoder(chunk_size=chunk_size).decode_stream(io.StringIO(json.dumps(data, indent=indent)))
+        assert not isinstance(items, list)
+        assert list(items) == data
+
+
+def test_decode_stream_value():
+    """
+    This method tests the other top level values are decoded as is
+    :return:
+    """
+    assert JsonStreamDecoder(chunk_size=2).decode_stream(io.StringIO('{"resources": 1}')) == {'resources': 1}
+    assert JsonStreamDecoder().decode_stream(io.StringIO('  ')) is None
+
+
+@pytest.mark.parametrize('text', ['[1, 2', '[1 2]', '[1,]', '[{"a": 1}'])
+def test_decode_stream_invalid(text: str):
+    """
+    This method tests the invalid arrays raise a decode error
+    :return:
+    """
+    with pytest.raises(json.JSONDecodeError):
+        list(JsonStreamDecoder(chunk_size=2).decode_stream(io.StringIO(text)))
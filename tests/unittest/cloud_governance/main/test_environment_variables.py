@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+
+from cloud_governance.main.environment_variables import EnvironmentVariablesDict
+
+
+def test_environment_variables_dict_lazy():
+    """
+    This method tests the lazy variable is loaded once, on the first access
+    :return:
+    """
+    loader = MagicMock(return_value='TEST-ACCOUNT')
+    environment_variables_dict = EnvironmentVariablesDict(account='')
+    environment_variables_dict.set_lazy('account', loader)
+    assert loader.call_count == 0
+    assert 'account' in environment_variables_dict
+    assert environment_variables_dict.get('account') == 'TEST-ACCOUNT'
+    assert environment_variables_dict['account'] == 'TEST-ACCOUNT'
+    assert loader.call_count == 1
+    environment_variables_dict.set_lazy('account', loader)
+    environment_variables_dict['account'] = 'OTHER-ACCOUNT'
+    assert environment_variables_dict.get('account') == 'OTHER-ACCOUNT'
+    assert loader.call_count == 1
+    assert environment_variables_dict.get('missing', 'default') == 'default'
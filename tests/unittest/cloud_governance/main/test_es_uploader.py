@@ -0,0 +1,67 @@
+import io
+import json
+from unittest.mock import patch
+
+from cloud_governance.common.clouds.aws.price.price import AWSPrice
+from cloud_governance.common.clouds.aws.s3.s3_operations import S3Operations
+from cloud_governance.common.elasticsearch.elasticsearch_operations import ElasticSearchOperations
+from cloud_governance.main.environment_variables import environment_variables
+from cloud_governance.main.es_uploader import ESUploader
+
+environment_variables.environment_variables_dict['account'] = 'test-account'
+
+MOCK_RESOURCES = [
+    {'InstanceId': 'i-1', 'LaunchTime': '2024-01-01T10:00:00.000000+00:00', 'State': {'Name': 'running'},
+     'InstanceType': 't2.micro', 'Tags': [{'Key': 'User', 'Value': 'Mock'}, {'Key': 'kubernetes.io/cluster/c1',
+                                                                             'Value': 'owned'}]},
+    {'InstanceId': 'i-2', 'LaunchTime': '2024-01-02T10:00:00.000000+00:00', 'State': {'Name': 'running'},
+     'InstanceType': 't2.micro', 'Tags': [{'Key': 'User', 'Value': 'mock'}]},
+    {'VolumeId': 'vol-1', 'CreateTime': '2024-01-03T10:00:00.000000+00:00', 'State': 'available',
+     'VolumeType': 'gp2', 'Size': 10, 'Tags': [{'Key': 'User', 'Value': 'other'},
+                                                {'Key': 'kubernetes.io/cluster/c1', 'Value': 'owned'}]},
+]
+MOCK_PRICES = {'i-1': 1.0004, 'i-2': 2, 'vol-1': 'NA'}
+
+
+def upload_last_policy(policy_content: str):
+    """
+    This method uploads the mocked policy content and returns the uploaded document
+    :param policy_content:
+    :return:
+    """
+    es_uploader = ESUploader(es_host='localhost', es_port='9200', region='us-east-1', bucket='test-bucket',
+                             logs_bucket_key='logs')
+    with patch.object(S3Operations, 'open_last_s3_policy_content', return_value=io.StringIO(policy_content)), \
+            patch.object(AWSPrice, 'get_ec2_price',
+                         side_effect=lambda resource, item_data: MOCK_PRICES[item_data.get('InstanceId',
+                                                                                           item_data.get('VolumeId'))]), \
+            patch.object(ElasticSearchOperations, 'upload_to_elasticsearch') as upload_to_elasticsearch:
+        assert es_uploader.upload_last_policy_to_elasticsearch(policy='ec2-run', index='test-index', doc_type='',
+                                                               s3_json_file='resources.json',
+                                                               es_add_items={'policy': 'ec2-run'})
+    return upload_to_elasticsearch.call_args.kwargs['data']
+
+
+def test_upload_last_policy_to_elasticsearch():
+    """
+    This method tests the cluster and user costs are aggregated from the streamed resources
+    :return:
+    """
+    data = upload_last_policy(json.dumps(MOCK_RESOURCES, indent=4))
+    assert data['resources'] == 3
+    assert len(data['resources_list']) == 3
+    assert data['policy'] == 'ec2-run'
+    assert data['non cluster'] == {'name': 'ebs (non cluster)', 'cost': 2}
+    assert data['cluster_1'] == {'name': 'kubernetes.io/cluster/c1', 'cost': 1.0, 'user': 'other',
+                                 'launch_time': '2024-01-03'}
+    assert data['user_1'] == {'name': 'mock', 'cost': 3.0}
+    assert 'user_2' not in data
+
+
+def test_upload_last_policy_to_elasticsearch_no_data():
+    """
+    This method tests the empty policy content is uploaded as no resources
+    :return:
+    """
+    assert upload_last_policy('')['resources'] == 0
+    assert upload_last_policy('{"resources": 5}')['resources'] == 5
@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock, patch
+
+from cloud_governance.main import main as main_module
+from cloud_governance.main.environment_variables import environment_variables
+from cloud_governance.main.main_oerations.main_operations import MainOperations
+
+
+def test_main_policy_skips_account_loader():
+    """
+    This method tests the account is not loaded from IAM when the policy results are not uploaded to es
+    :return:
+    """
+    environment_variables_dict = environment_variables.environment_variables_dict
+    keys = ['policy', 'account', 'upload_data_es', 'PUBLIC_CLOUD_NAME', 'AWS_DEFAULT_REGION', 'dry_run']
+    original_values = {key: environment_variables_dict.get(key) for key in keys}
+    account_loader = MagicMock(return_value='MOCK-ACCOUNT')
+    try:
+        environment_variables_dict.update({'policy': 'tag_resources', 'upload_data_es': '',
+                                           'PUBLIC_CLOUD_NAME': 'AWS', 'AWS_DEFAULT_REGION': 'us-east-1',
+                                           'dry_run': 'yes'})
+        environment_variables_dict.set_lazy('account', account_loader)
+        with patch.object(environment_variables, 'POLICIES_LIST', ''), \
+                patch.object(MainOperations, 'run', return_value=False), \
+                patch.object(main_module, 'run_policy') as run_policy:
+            main_module.main()
+        run_policy.assert_called_once_with(policy='tag_resources', region='us-east-1', dry_run='yes')
+        assert account_loader.call_count == 0
+    finally:
+        for key, value in original_values.items():
+            environment_variables_dict[key] = value
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+# cloud_governance.main.main must load without the cloud sdks, they are imported per policy
+HEAVY_MODULES = ['boto3', 'pandas', 'ldap', 'SoftLayer', 'ibm_platform_services', 'google.cloud.bigquery', 'azure',
+                 'github', 'elasticsearch']
+IMPORT_TIME_BUDGET_SECONDS = 2
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+
+def get_import_times(module: str):
+    """
+    This method returns the cumulative import time of the modules loaded by module, using python -X importtime
+    :param module:
+    :return: {module_name: cumulative_microseconds}
+    """
+    env = dict(os.environ, PYTHONPATH=REPOSITORY_PATH, AWS_ACCESS_KEY_ID='testing', AWS_SECRET_ACCESS_KEY='testing')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], cwd=REPOSITORY_PATH,
+                            env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, module_name = line.split('|')
+            if cumulative.strip().isdigit():
+                import_times[module_name.strip()] = int(cumulative)
+    return import_times
+
+
+def test_main_import_time():
+    """
+    This method tests the main module loads only the startup modules and within the time budget
+    :return:
+    """
+    import_times = get_import_times(module='cloud_governance.main.main')
+    assert not [module for module in import_times if module.split('.')[0] in HEAVY_MODULES or module in HEAVY_MODULES]
+    assert import_times['cloud_governance.main.main'] < IMPORT_TIME_BUDGET_SECONDS * 1000000
@@ -261,3 +261,33 @@ def test_instance_idle__set_counter_zero():
     response = instance_idle.run()
     assert len(response) == 1
     assert response[0]['CleanUpDays'] == 0
+
+
+@mock_compute
+@mock_network
+@mock_monitor
+def test_instance_idle__single_metrics_call():
+    """
+    This method tests instance_idle fetches all the idle metrics of vm in a single call
+    :return:
+    :rtype:
+    """
+    environment_variables.environment_variables_dict['dry_run'] = 'yes'
+    environment_variables.environment_variables_dict['policy'] = 'instance_idle'
+    compute_client = ComputeManagementClient(subscription_id=SUBSCRIPTION_ID, credential=MockDefaultAzureCredential())
+    time_created = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(8)
+    instance = compute_client.virtual_machines.begin_create_or_update(vm_name='test-unitest', location='useast',
+                                                                      time_created=time_created)
+    monitor_client = MonitorManagementClient(subscription_id=SUBSCRIPTION_ID, credential=MockDefaultAzureCredential())
+    for metric_name in ['Percentage CPU', 'Network In Total', 'Network Out Total']:
+        monitor_client.metrics.create_metric(resource_id=instance.id, type='VirtualMachine', name=metric_name,
+                                             unit=metric_name,
+                                             timeseries=[TimeSeriesElement(data=[
+                                                 MetricValue(time_stamp=datetime.datetime.utcnow(), average=0)
+                                             ])])
+    instance_idle = InstanceIdle()
+    with patch.object(instance_idle.monitor_operations, 'get_resource_metrics',
+                      wraps=instance_idle.monitor_operations.get_resource_metrics) as mock_get_resource_metrics:
+        response = instance_idle.run()
+    assert len(response) == 1
+    assert mock_get_resource_metrics.call_count == 1
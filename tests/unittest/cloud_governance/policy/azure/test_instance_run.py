@@ -188,3 +188,23 @@ def test_instance_run_vm_already_stopped():
         instance_run = InstanceRun()
         response = instance_run.run()
         assert len(response) == 0
+
+
+def test_instance_run_batch_instance_statuses():
+    """
+    This method tests instance_run fetches the vm statuses from the listing instead of per vm instance_view
+    :return:
+    :rtype:
+    """
+    environment_variables.environment_variables_dict['dry_run'] = 'yes'
+    environment_variables.environment_variables_dict['policy'] = 'instance_run'
+    vms = [MockVirtualMachine(tags={'User': 'mock'}) for _ in range(3)]
+    mock_azure = MockAzure(vms=vms)
+    mock_virtual_machines = Mock()
+    mock_virtual_machines.list_all.side_effect = mock_azure.mock_list_all
+    mock_virtual_machines.instance_view.side_effect = mock_azure.mock_instance_view
+    with patch.object(ComputeManagementClient, 'virtual_machines', mock_virtual_machines):
+        instance_run = InstanceRun()
+        response = instance_run.run()
+        assert len(response) == 3
+        assert mock_virtual_machines.instance_view.call_count == 0
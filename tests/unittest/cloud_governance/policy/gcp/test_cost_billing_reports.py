@@ -0,0 +1,139 @@
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from cloud_governance.main.environment_variables import environment_variables
+from cloud_governance.policy.gcp import cost_billing_reports
+from cloud_governance.policy.gcp.cost_billing_reports import CostBillingReports
+
+
+def get_project_folders(*folders):
+    """
+    This method returns the project ancestors json string of the folders query
+    :param folders: (resource_name, display_name)
+    :return:
+    """
+    return json.dumps([{'resource_name': resource_name, 'display_name': display_name}
+                       for resource_name, display_name in folders])
+
+
+def get_cost_row(folder_id: str, month: str, project_name: str, project_id: str, total_cost: str):
+    return {'folder_name': 'NA', 'folder_id': folder_id, 'month': month, 'project_name': project_name,
+            'project_id': project_id, 'total_cost': total_cost}
+
+
+def get_folder_row(number: str, month: str, folder_id: str, *folders):
+    return {'project_folders': get_project_folders(*folders), 'number': number, 'month': month,
+            'folder_id': folder_id}
+
+
+ORGANIZATION = ('organizations/1', 'Org')
+ENGINEERING = ('folders/100', 'Engineering')
+
+COST_ROWS = [
+    # rows of the same project and month are summed
+    get_cost_row('/1/100/200/', '202401', 'project-a', '111', '10.1234'),
+    get_cost_row('/1/100/200/', '202401', 'project-a', '111 ', '5.5'),
+    get_cost_row('/1/100/200/', '202402', 'project-a', '111', '7.25'),
+    get_cost_row('/1/100/200/', '202401', 'project-b', '222', '3.3333'),
+    # the project has its own budget
+    get_cost_row('/1/300/', '202401', 'project-c', '333', '20'),
+    get_cost_row('/1/300/', '202402', 'project-c', '333', '-2.5'),
+    # different budgets with the same account name are aggregated
+    get_cost_row('/1/100/', '202401', 'project-d', '444', '1.75'),
+    get_cost_row('/1/100/', '202401', 'Engineering', '666', '2'),
+    # the deeper project of the budget folder changes the account
+    get_cost_row('/1/100/', '202402', 'project-h', '888', '8'),
+    get_cost_row('/1/100/700/', '202402', 'project-g', '777', '0.125'),
+    # the project has no folders data and no budget
+    get_cost_row('/1/500/', '202402', 'project-e', '555', '4.4444'),
+    get_cost_row('NA', '202401', 'GCP-refund/credit', '000000000000', '-1.5'),
+]
+
+FOLDER_ROWS = [
+    get_folder_row('111', '202401', '/1/100/200/', ('projects/111', 'project-a'), ('folders/200', 'Platform'),
+                   ENGINEERING, ORGANIZATION),
+    # the latest month names are used
+    get_folder_row('111', '202402', '/1/100/200/', ('projects/111', 'project-a'), ('folders/200', 'Platform Team'),
+                   ENGINEERING, ORGANIZATION),
+    get_folder_row('222', '202401', '/1/100/200/', ('projects/222', 'project-b'), ('folders/200', 'Platform Team'),
+                   ENGINEERING, ORGANIZATION),
+    get_folder_row('333', '202401', '/1/300/', ('projects/333', 'project-c'), ('folders/300', 'Research'),
+                   ORGANIZATION),
+    get_folder_row('444', '202401', '/1/100/', ('projects/444', 'project-d'), ENGINEERING, ORGANIZATION),
+    get_folder_row('666', '202401', '/1/100/', ('projects/666', 'Engineering'), ENGINEERING, ORGANIZATION),
+    get_folder_row('777', '202402', '/1/100/700/', ('projects/777', 'project-g'), ('folders/700', 'Tools'),
+                   ENGINEERING, ORGANIZATION),
+    get_folder_row('888', '202402', '/1/100/', ('projects/888', 'project-h'), ENGINEERING, ORGANIZATION),
+]
+
+BUDGET_DETAILS = {
+    '200': (1234, 1200000, '2024', 'platform-owner'),
+    '333': (5678, 240000, '2024', 'research-owner'),
+    '100': (1111, 600000, '2024', 'engineering-owner'),
+    '666': (6666, 120000, '2024', 'engineering-project-owner'),
+}
+
+
+def get_expected_row(start_date: str, account: str, account_id: str, actual: float, budget_id, cost_center: int,
+                     owner: str, allocated_budget: int, budget: float, projects: list, index_account: str,
+                     total_folders: int):
+    """
+    This method returns the cost document of the previous aggregation loop
+    :return:
+    """
+    timestamp = datetime.strptime(start_date, '%Y-%m-%d')
+    month = datetime.strftime(timestamp, '%Y %b')
+    return {'CloudName': 'GCP', 'CostCenter': cost_center, 'Owner': owner, 'Budget': budget, 'Forecast': 0,
+            'AllocatedBudget': allocated_budget, 'BudgetId': budget_id, 'Account': account, 'AccountId': account_id,
+            'Actual': actual, 'filter_date': f'{start_date}-{month.split()[-1]}', 'Month': month,
+            'start_date': start_date, 'timestamp': timestamp,
+            'Projects': [{'Project': project, 'Actual': project_actual, 'ProjectId': project_id}
+                         for project, project_actual, project_id in projects],
+            'index_id': f'{start_date}-{budget_id}-{index_account}', 'total_folders': total_folders}
+
+
+# output of the aggregation loop before the pandas group-bys, for COST_ROWS and FOLDER_ROWS
+EXPECTED_RESULT = [
+    get_expected_row('2024-02-01', 'NA', 'NA', 4.444, 0, 0, 'Others', 0, 0.0,
+                     [('project-e', 4.444, '555')], 'na', 1),
+    get_expected_row('2024-02-01', 'Platform Team/Platform Team', '200/200', 7.25, '200', 1234, 'platform-owner',
+                     1200000, 100000.0, [('project-a', 7.25, '111')], 'platform team', 2),
+    get_expected_row('2024-02-01', 'Research/project-c', '300/333', -2.5, '333', 5678, 'research-owner',
+                     240000, 20000.0, [('project-c', -2.5, '333')], 'research', 1),
+    get_expected_row('2024-02-01', 'Tools', '700', 8.125, '100', 1111, 'engineering-owner', 600000, 50000.0,
+                     [('project-h', 8.0, '888'), ('project-g', 0.125, '777')], 'engineering', 1),
+    get_expected_row('2024-01-01', 'Engineering/Engineering', '100/100', 3.75, '100', 1111, 'engineering-owner',
+                     720000, 60000.0, [('project-d', 1.75, '444'), ('Engineering', 2.0, '666')], 'engineering', 1),
+    get_expected_row('2024-01-01', 'NA', 'NA', -1.5, 0, 0, 'Others', 0, 0.0,
+                     [('GCP-refund/credit', -1.5, '000000000000')], 'na', 0),
+    get_expected_row('2024-01-01', 'Platform Team/Platform Team', '200/200', 18.956, '200', 1234, 'platform-owner',
+                     1200000, 100000.0, [('project-a', 15.623, '111'), ('project-b', 3.333, '222')],
+                     'platform team', 2),
+    get_expected_row('2024-01-01', 'Research/project-c', '300/333', 20.0, '333', 5678, 'research-owner',
+                     240000, 20000.0, [('project-c', 20.0, '333')], 'research', 1),
+]
+
+
+def test_get_big_query_data():
+    """
+    This method tests the billing rows are aggregated as the previous aggregation loop,
+    the previous loop rounded the budget account cost on every row
+    :return:
+    """
+    environment_variables.environment_variables_dict['PUBLIC_CLOUD_NAME'] = 'GCP'
+    with patch.object(cost_billing_reports, 'GoogleAccount') as google_account, \
+            patch.object(cost_billing_reports, 'UploadToGsheet') as upload_to_gsheet, \
+            patch.object(cost_billing_reports, 'ElasticUpload'):
+        google_account.return_value.query_list.return_value = [COST_ROWS, FOLDER_ROWS]
+        upload_to_gsheet.return_value.get_cost_center_budget_details.side_effect = \
+            lambda account_id, dir_path: BUDGET_DETAILS.get(account_id, (0, 0, '', 'Others'))
+        result = CostBillingReports()._CostBillingReports__get_big_query_data()
+    result = sorted(result, key=lambda item: (item['Month'], item['Account']))
+    expected_result = sorted(EXPECTED_RESULT, key=lambda item: (item['Month'], item['Account']))
+    assert len(result) == len(expected_result)
+    for actual_row, expected_row in zip(result, expected_result):
+        assert actual_row.pop('Actual') == pytest.approx(expected_row.pop('Actual'), abs=0.005)
+        assert actual_row == expected_row
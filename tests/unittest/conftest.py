@@ -0,0 +1,26 @@
+import pytest
+
+from cloud_governance.common.clouds.aws.utils.aws_api_monitor import AWSApiMonitor
+from cloud_governance.common.clouds.aws.utils.boto3_client_pool import Boto3ClientPool
+
+
+@pytest.fixture(autouse=True)
+def clear_boto3_client_pool():
+    """
+    This fixture drops the shared boto3 clients, each test creates its clients under its own mocks
+    :return:
+    """
+    Boto3ClientPool.clear()
+    yield
+    Boto3ClientPool.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_aws_api_monitor():
+    """
+    This fixture drops the api counters and the rate limits state between the tests
+    :return:
+    """
+    AWSApiMonitor.clear()
+    yield
+    AWSApiMonitor.clear()
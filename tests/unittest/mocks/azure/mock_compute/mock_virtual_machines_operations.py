@@ -44,12 +44,15 @@ class MockVirtualMachinesOperations:
         self.__virtual_machines[vm_name] = virtual_machine
         return virtual_machine
 
-    def list_all(self):
+    def list_all(self, status_only: str = None, **kwargs):
         """
         This method list all virtual machines
         :return:
         :rtype:
         """
+        if status_only:
+            for vm_name, virtual_machine in self.__virtual_machines.items():
+                virtual_machine.instance_view = self.__instance_views.get(vm_name, MockVirtualMachineInstanceView())
         return CustomItemPaged(resource_list=list(self.__virtual_machines.values()))
 
     def instance_view(self, resource_group_name: str, vm_name: str, **kwargs):
@@ -49,6 +49,9 @@ class MockAzure:
         self.disks = disks if disks else []
 
     def mock_list_all(self, *args, **kwargs):
+        if kwargs.get('status_only'):
+            for vm in self.vms:
+                vm.instance_view = MockVirtualMachineInstanceView(status1=self.status1, status2=self.status2)
         return CustomItemPaged(resource_list=self.vms)
 
     def mock_instance_view(self, *args, **kwargs):
@@ -1,4 +1,4 @@
-from azure.mgmt.monitor.v2021_05_01.models import Metric, Response
+from azure.mgmt.monitor.v2021_05_01.models import Metric, Response, LocalizableString
 
 
 class MockMetric(Metric):
@@ -28,5 +28,10 @@ class MockMetricOperations:
     def list(self, resource_uri: str, **kwargs):
         metricnames = kwargs.get('metricnames')
         if metricnames:
-            return self.__metrics[resource_uri][metricnames]
+            metrics = []
+            for metricname in metricnames.split(','):
+                for metric in self.__metrics[resource_uri][metricname].value:
+                    metrics.append(MockMetric(id=metric.id, type=metric.type, name=LocalizableString(value=metricname),
+                                              unit=metric.unit, timeseries=metric.timeseries))
+            return MockResponse(timespan='', value=metrics)
         raise Exception("metricnames not found")
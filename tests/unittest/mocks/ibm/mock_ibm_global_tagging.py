@@ -2,6 +2,7 @@ from typing import List
 from unittest.mock import patch
 
 from ibm_cloud_sdk_core import DetailedResponse
+from ibm_platform_services import GlobalSearchV2
 from ibm_platform_services.global_tagging_v1 import Resource, GlobalTaggingV1
 
 
@@ -9,6 +10,7 @@ class MockGlobalTaggingV1(GlobalTaggingV1):
 
     def __init__(self, *args, **kwargs):
         self.resources = {}
+        self.failures = {}
 
     def attach_tag(self,
                    resources: List[Resource],
@@ -19,6 +21,13 @@ class MockGlobalTaggingV1(GlobalTaggingV1):
                    ) -> DetailedResponse:
         results = []
         for resource in resources:
+            if self.failures.get(resource.resource_id, 0) > 0:
+                self.failures[resource.resource_id] -= 1
+                results.append({
+                    'is_error': True,
+                    'resource_id': resource.resource_id,
+                })
+                continue
             if tag_names:
                 self.resources[resource.resource_id] = tag_names
             else:
@@ -31,6 +40,18 @@ class MockGlobalTaggingV1(GlobalTaggingV1):
         return DetailedResponse(response={'results': results})
 
 
+class MockGlobalSearchV2(GlobalSearchV2):
+
+    def __init__(self, tagging_service: MockGlobalTaggingV1, *args, **kwargs):
+        self.tagging_service = tagging_service
+
+    def search(self, *, query: str = None, **kwargs) -> DetailedResponse:
+        tag_name = query.split('"')[1] if query else ''
+        items = [{'crn': resource_id} for resource_id, tags in self.tagging_service.resources.items()
+                 if tag_name in tags]
+        return DetailedResponse(response={'items': items, 'search_cursor': None})
+
+
 def mock_ibm_global_tagging(method):
     def method_wrapper(*args, **kwargs):
         """
@@ -39,8 +60,9 @@ def mock_ibm_global_tagging(method):
         @param kwargs:
         @return:
         """
-        with patch.object(GlobalTaggingV1, 'attach_tag',
-                          MockGlobalTaggingV1().attach_tag):
+        mock_global_tagging = MockGlobalTaggingV1()
+        with patch.object(GlobalTaggingV1, 'attach_tag', mock_global_tagging.attach_tag), \
+                patch.object(GlobalSearchV2, 'search', MockGlobalSearchV2(mock_global_tagging).search):
             result = method(*args, **kwargs)
         return result
 